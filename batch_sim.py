@@ -0,0 +1,124 @@
+"""Simulação vetorizada de muitas partidas independentes com NumPy.
+
+Mesmas regras do ``game_core.GameEngine`` (GRAVITY, FLAP_STRENGTH, PIPE_GAP,
+PIPE_SPEED, colisão, pontuação e geração de canos), mas com o estado de N
+partidas em arrays: cada tick é um punhado de operações sobre arrays, sem
+objetos por pássaro ou por cano. Útil para treinar bots e balancear fases.
+"""
+
+import numpy as np
+
+from game_core import (SCREEN_WIDTH, SCREEN_HEIGHT, GRAVITY, FLAP_STRENGTH, PIPE_WIDTH,
+                       PIPE_GAP, PIPE_SPEED, BIRD_SIZE)
+
+BIRD_X = 100
+# Canos simultâneos por partida (espaçamento mínimo de 300 px na tela de 1200)
+PIPE_SLOTS = 6
+# Faixa de sorteio do vão, igual a Pipe.__init__ (randint inclusivo)
+GAP_MIN = 150
+GAP_MAX = SCREEN_HEIGHT - PIPE_GAP - 150
+
+
+class BatchSimulator:
+    """Estado de N partidas em arrays; ``step(flaps)`` avança todas um tick"""
+
+    def __init__(self, n_games, seed=None, auto_reset=False):
+        self.n = n_games
+        self.rng = np.random.default_rng(seed)
+        self.auto_reset = auto_reset
+
+        self.bird_y = np.empty(n_games, dtype=np.float64)
+        self.bird_velocity = np.empty(n_games, dtype=np.float64)
+        self.pipe_x = np.empty((n_games, PIPE_SLOTS), dtype=np.int32)
+        self.pipe_gap_y = np.empty((n_games, PIPE_SLOTS), dtype=np.int32)
+        self.pipe_active = np.empty((n_games, PIPE_SLOTS), dtype=bool)
+        self.pipe_scored = np.empty((n_games, PIPE_SLOTS), dtype=bool)
+        # x do último cano criado e quantos canos cada partida já criou
+        self.last_pipe_x = np.empty(n_games, dtype=np.int32)
+        self.spawned = np.empty(n_games, dtype=np.int64)
+        self.score = np.empty(n_games, dtype=np.int64)
+        self.ticks = np.empty(n_games, dtype=np.int64)
+        self.alive = np.empty(n_games, dtype=bool)
+        self._rows = np.arange(n_games)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Reinicia todas as partidas, ou só as indicadas por ``mask``"""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        self.bird_y[mask] = SCREEN_HEIGHT // 2
+        self.bird_velocity[mask] = 0
+        self.pipe_active[mask] = False
+        self.pipe_scored[mask] = False
+        self.score[mask] = 0
+        self.ticks[mask] = 0
+        self.alive[mask] = True
+        self.spawned[mask] = 0
+        # Primeiro cano, como em GameEngine.reset
+        self._spawn(mask, SCREEN_WIDTH + 200)
+
+    def _spawn(self, mask, x):
+        rows = self._rows[mask]
+        if rows.size == 0:
+            return
+        slots = self.spawned[rows] % PIPE_SLOTS
+        self.pipe_x[rows, slots] = x
+        self.pipe_gap_y[rows, slots] = self.rng.integers(GAP_MIN, GAP_MAX + 1, rows.size)
+        self.pipe_active[rows, slots] = True
+        self.pipe_scored[rows, slots] = False
+        self.last_pipe_x[rows] = x
+        self.spawned[rows] += 1
+
+    def step(self, flaps=None):
+        """Avança um tick; ``flaps`` é um array booleano (N,) ou None. Retorna quem morreu"""
+        alive = self.alive
+        self.ticks += alive
+
+        # Pássaro
+        velocity = self.bird_velocity
+        if flaps is not None:
+            velocity[flaps & alive] = FLAP_STRENGTH
+        velocity += GRAVITY * alive
+        self.bird_y += velocity * alive
+        y = self.bird_y
+        floor = SCREEN_HEIGHT - BIRD_SIZE
+        clamped = (y < 0) | (y > floor)
+        np.clip(y, 0, floor, out=y)
+        velocity[clamped] = 0
+
+        # Canos
+        moving = self.pipe_active & alive[:, None]
+        self.pipe_x -= PIPE_SPEED * moving
+        self.last_pipe_x -= PIPE_SPEED * alive
+        px = self.pipe_x
+
+        # Colisão (mesma regra de Pipe.collides_with)
+        left = int(BIRD_X - BIRD_SIZE // 2)
+        top = np.trunc(y - BIRD_SIZE // 2)[:, None]
+        overlap_x = (left < px + PIPE_WIDTH) & (px < left + BIRD_SIZE)
+        outside_gap = (top < self.pipe_gap_y) | (top + BIRD_SIZE > self.pipe_gap_y + PIPE_GAP)
+        hit = (moving & overlap_x & outside_gap).any(axis=1)
+
+        # Pontuar
+        passed = moving & ~self.pipe_scored & (px + PIPE_WIDTH < BIRD_X)
+        self.pipe_scored |= passed
+        self.score += passed.sum(axis=1)
+
+        # Remover canos fora da tela e criar novos
+        self.pipe_active &= ~(moving & (px < -PIPE_WIDTH))
+        need_pipe = alive & (~self.pipe_active.any(axis=1) | (self.last_pipe_x < SCREEN_WIDTH - 300))
+        self._spawn(need_pipe, SCREEN_WIDTH)
+
+        # Fim de jogo
+        died = alive & (hit | (y >= floor) | (y <= 0))
+        self.alive &= ~died
+        if self.auto_reset and died.any():
+            self.reset(died)
+        return died
+
+    def nearest_pipe(self):
+        """(x, gap_y) do próximo cano à frente de cada pássaro (para bots)"""
+        ahead = self.pipe_active & (self.pipe_x + PIPE_WIDTH >= BIRD_X - BIRD_SIZE // 2)
+        distance = np.where(ahead, self.pipe_x, np.iinfo(np.int32).max)
+        slot = distance.argmin(axis=1)
+        return self.pipe_x[self._rows, slot], self.pipe_gap_y[self._rows, slot]
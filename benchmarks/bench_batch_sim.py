@@ -0,0 +1,128 @@
+"""Vazão do BatchSimulator em partidas·ticks por segundo.
+
+Antes de medir, confere o simulador tick a tick contra o ``GameEngine``:
+``--check-games`` partidas (um bot com flaps aleatórios no meio) rodam lado a
+lado nos dois, com os mesmos vãos, comparando pássaro, canos, placar e fim
+de jogo a cada tick. Termina com código 1 se algum tick divergir.
+
+Uso: python benchmarks/bench_batch_sim.py [--sizes 1 1000 100000] [--seconds 2] [--check-games 100]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from batch_sim import PIPE_SLOTS, BatchSimulator  # noqa: E402
+from game_core import GameEngine  # noqa: E402
+
+
+class BatchGaps:
+    """``rng`` de um GameEngine que devolve o vão que o simulador sorteou para a partida ``row``"""
+
+    def __init__(self, sim, row):
+        self.sim = sim
+        self.row = row
+
+    def randint(self, low, high):
+        slot = (self.sim.spawned[self.row] - 1) % PIPE_SLOTS
+        return int(self.sim.pipe_gap_y[self.row, slot])
+
+
+def compare(sim, engines, row):
+    """Primeira diferença entre a partida ``row`` do simulador e o engine (ou None)"""
+    engine = engines[row]
+    bird = engine.bird
+    if sim.bird_y[row] != bird.y or sim.bird_velocity[row] != bird.velocity:
+        return (f"pássaro ({sim.bird_y[row]}, {sim.bird_velocity[row]}) != "
+                f"({bird.y}, {bird.velocity})")
+    if sim.score[row] != engine.score:
+        return f"placar {sim.score[row]} != {engine.score}"
+    if (not sim.alive[row]) != engine.game_over:
+        return f"fim de jogo {not sim.alive[row]} != {engine.game_over}"
+    active = sim.pipe_active[row]
+    batch_pipes = sorted(zip(sim.pipe_x[row, active].tolist(),
+                             sim.pipe_gap_y[row, active].tolist()))
+    engine_pipes = [(pipe.x, pipe.gap_y) for pipe in engine.pipes]
+    if batch_pipes != engine_pipes:
+        return f"canos {batch_pipes} != {engine_pipes}"
+    return None
+
+
+def check(n_games, max_ticks):
+    """Roda ``n_games`` partidas no simulador e em GameEngines; retorna (ticks, falhas)"""
+    sim = BatchSimulator(n_games, seed=0)
+    # O engine é criado depois do reset do simulador: o primeiro cano usa o vão já sorteado
+    engines = [GameEngine(rng=BatchGaps(sim, row)) for row in range(n_games)]
+    rng = np.random.default_rng(1)
+    failures = []
+    compared = 0
+    for tick in range(1, max_ticks + 1):
+        if not sim.alive.any():
+            break
+        # Bot simples (flap abaixo do vão) com flaps aleatórios para as partidas acabarem
+        _, gap_y = sim.nearest_pipe()
+        flaps = (((sim.bird_y >= gap_y + 145) & (sim.bird_velocity >= 0))
+                 | (rng.random(n_games) < 0.002))
+        alive = sim.alive.copy()
+        sim.step(flaps)
+        for row in np.flatnonzero(alive):
+            engine = engines[row]
+            if flaps[row]:
+                engine.flap()
+            engine.step()
+            compared += 1
+            difference = compare(sim, engines, row)
+            if difference is not None:
+                failures.append(f"partida {row}, tick {tick}: {difference}")
+                # Uma divergência por partida basta; para de comparar esta
+                sim.alive[row] = False
+    return compared, failures
+
+
+def bench(n_games, seconds):
+    """Roda partidas com auto_reset e flaps aleatórios; retorna partidas·ticks/s"""
+    sim = BatchSimulator(n_games, seed=0, auto_reset=True)
+    rng = np.random.default_rng(1)
+    # Flaps pré-sorteados para não medir o gerador de números aleatórios
+    flaps = rng.random((64, n_games)) < 0.06
+    ticks = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        sim.step(flaps[ticks % 64])
+        ticks += 1
+    elapsed = time.perf_counter() - start
+    return n_games * ticks / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 100000])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--check-games", type=int, default=100,
+                        help="partidas conferidas tick a tick contra o GameEngine "
+                             "(0 = não confere)")
+    parser.add_argument("--check-ticks", type=int, default=5000,
+                        help="máximo de ticks por partida conferida")
+    args = parser.parse_args()
+
+    if args.check_games:
+        compared, failures = check(args.check_games, args.check_ticks)
+        print(f"Conferência com o GameEngine: {compared} partidas·ticks, "
+              f"{len(failures)} partida(s) divergente(s)")
+        for failure in failures[:10]:
+            print(f"    FALHOU: {failure}")
+        if failures:
+            sys.exit(1)
+
+    for n_games in args.sizes:
+        rate = bench(n_games, args.seconds)
+        print(f"N={n_games:>7}: {rate:>14,.0f} partidas·ticks/s")
+
+
+if __name__ == "__main__":
+    main()
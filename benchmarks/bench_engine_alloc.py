@@ -0,0 +1,125 @@
+"""Alocação e vazão do GameEngine.step, medidas com tracemalloc.
+
+Joga uma partida longa com um piloto automático (gravando os ticks de flap),
+depois reproduz a mesma partida com a mesma semente medindo, tick a tick, o
+pico de memória alocada dentro do ``step``. Ticks que criam um cano novo
+(sorteio do vão) são contados à parte; nos demais a alocação deve ser zero.
+Um ou outro tick isolado pode pegar um float novo quando o número de floats
+vivos no interpretador bate recorde (a lista livre do CPython está vazia),
+então o critério é a média: termina com código 1 se os ticks comuns alocarem
+mais que ``MAX_BYTES_PER_TICK`` em média, ou se a partida acabar antes de
+``MIN_TICKS`` ticks (o piloto quebrou e não sobrou o que medir).
+
+Uso: python benchmarks/bench_engine_alloc.py [--ticks 20000] [--seed 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_core import GameEngine  # noqa: E402
+
+# Média tolerada nos ticks comuns (a versão com listas e Rects alocava ~260 B/tick)
+MAX_BYTES_PER_TICK = 0.1
+# Ticks mínimos da partida para a média valer (a partida padrão chega a 13752)
+MIN_TICKS = 1000
+
+
+def autopilot(engine):
+    """Flap quando o pássaro desce abaixo do vão do próximo cano"""
+    bird = engine.bird
+    for pipe in engine.pipes:
+        if pipe.x + pipe.width > bird.left:
+            return bird.y >= pipe.gap_y + 145 and bird.velocity >= 0
+    return bird.y >= 500 and bird.velocity >= 0
+
+
+def record_flaps(engine, seed, ticks):
+    """Lista (por tick) de quando o piloto pediu flap, até o fim da partida"""
+    engine.rng.seed(seed)
+    engine.reset()
+    flaps = []
+    while not engine.game_over and len(flaps) < ticks:
+        flaps.append(autopilot(engine))
+        if flaps[-1]:
+            engine.flap()
+        engine.step()
+    return flaps
+
+
+def measure_allocations(engine, seed, flaps):
+    """Bytes alocados (pico) em cada tick e se o tick criou um cano"""
+    engine.rng.seed(seed)
+    engine.reset()
+    n = len(flaps)
+    peaks = [0] * n
+    spawned = [False] * n
+    pipes = engine.pipes
+    tracemalloc.start()
+    try:
+        for t in range(n):
+            if flaps[t]:
+                engine.flap()
+            newest = pipes[-1]
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            engine.step()
+            peaks[t] = tracemalloc.get_traced_memory()[1] - before
+            spawned[t] = pipes[-1] is not newest
+    finally:
+        tracemalloc.stop()
+    return peaks, spawned
+
+
+def measure_speed(engine, seed, flaps):
+    engine.rng.seed(seed)
+    engine.reset()
+    start = time.perf_counter()
+    for flap in flaps:
+        if flap:
+            engine.flap()
+        engine.step()
+    return len(flaps) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=20000, help="limite de ticks da partida")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = GameEngine(rng=random.Random(args.seed))
+    flaps = record_flaps(engine, args.seed, args.ticks)
+    # Primeira reprodução só para preencher o anel de canos (alocação única)
+    measure_speed(engine, args.seed, flaps)
+    peaks, spawned = measure_allocations(engine, args.seed, flaps)
+    rate = measure_speed(engine, args.seed, flaps)
+
+    common = [p for p, s in zip(peaks, spawned) if not s]
+    spawn = [p for p, s in zip(peaks, spawned) if s]
+    allocating = sum(1 for p in common if p > 0)
+    mean = sum(common) / len(common) if common else 0.0
+    print(f"{len(flaps)} ticks (placar {engine.score}), {rate:,.0f} ticks/s")
+    print(f"ticks comuns: {len(common)}, com alocação: {allocating}, "
+          f"média {mean:.3f} B/tick, pico máximo {max(common, default=0)} B")
+    if spawn:
+        print(f"ticks com cano novo: {len(spawn)}, pico médio {sum(spawn) / len(spawn):.0f} B "
+              f"(sorteio do vão)")
+    failures = []
+    if len(flaps) < min(MIN_TICKS, args.ticks):
+        failures.append(f"partida acabou em {len(flaps)} ticks (mínimo {MIN_TICKS})")
+    if mean > MAX_BYTES_PER_TICK:
+        failures.append(f"média {mean:.3f} B/tick > {MAX_BYTES_PER_TICK} B/tick")
+    for failure in failures:
+        print(f"FALHOU: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
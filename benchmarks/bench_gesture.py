@@ -0,0 +1,128 @@
+"""Latência do flap: limiar de um frame vs. GestureEngine, sobre landmarks gravados.
+
+Reproduz a mesma gravação (.npz de ``--record-landmarks``) pelos dois
+detectores, sem seguir o relógio, e pareia cada flap do limiar com o flap do
+gesto que o antecedeu: a diferença é o ganho de latência. Sem arquivo, gera
+um movimento sintético de braços com ruído.
+
+Serve de teste: termina com código 1 se o gesto deixar de parear quase
+todos os flaps do limiar (``MIN_PAIRED_SHARE``), gerar flaps extras demais
+(``MAX_EXTRA_SHARE``) ou antecipar menos que ``MIN_LEAD_MS`` na mediana.
+
+Uso: python benchmarks/bench_gesture.py [landmarks.npz] [--seconds 60] [--noise 0.005]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gesture_engine import GestureEngine  # noqa: E402
+from input_sources import LandmarkReplayDetector  # noqa: E402
+
+# Janela (s) em que um flap do gesto conta como o mesmo flap do limiar
+MATCH_WINDOW = 0.5
+# Critérios de regressão (medido na gravação sintética padrão: 35/35 pareados,
+# nenhum extra, mediana de 133 ms)
+MIN_PAIRED_SHARE = 0.9
+MAX_EXTRA_SHARE = 0.1
+MIN_LEAD_MS = 50
+
+
+def synthetic_landmarks(path, seconds=60, fps=30, noise=0.005, seed=0):
+    """Grava braços subindo e descendo (subida de 0,3 s, ritmo irregular) em ``path``"""
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(seconds * fps)) / fps
+    wrist_y = np.full(len(times), 0.75)
+    t = 0.5
+    while t < seconds - 1:
+        rise = rng.uniform(0.2, 0.4)
+        hold = rng.uniform(0.2, 0.6)
+        up = (times >= t) & (times < t + rise)
+        wrist_y[up] = 0.75 - 0.55 * (1 - np.cos(np.pi * (times[up] - t) / rise)) / 2
+        top = (times >= t + rise) & (times < t + rise + hold)
+        wrist_y[top] = 0.2
+        down = (times >= t + rise + hold) & (times < t + 2 * rise + hold)
+        wrist_y[down] = 0.2 + 0.55 * (1 - np.cos(np.pi * (times[down] - t - rise - hold) / rise)) / 2
+        t += 2 * rise + hold + rng.uniform(0.3, 1.0)
+    landmarks = np.empty((len(times), 4, 2), dtype=np.float32)
+    landmarks[:, :, 0] = (0.4, 0.6, 0.35, 0.65)
+    landmarks[:, 0:2, 1] = 0.45
+    landmarks[:, 2:4, 1] = wrist_y[:, None]
+    landmarks += rng.normal(0, noise, landmarks.shape).astype(np.float32)
+    np.savez_compressed(path, time=times, landmarks=landmarks)
+
+
+def flap_times(path, gesture):
+    """Tempos (na gravação) dos flaps e µs por amostra"""
+    detector = LandmarkReplayDetector(path, realtime=False, loop=False, gesture=gesture)
+    detector.calibrated = True  # conta flaps desde a primeira amostra
+    flaps = []
+    samples = 0
+    start = time.perf_counter()
+    while True:
+        flap, _ = detector.detect_arms_raised()
+        if detector.finished:
+            break
+        samples += 1
+        if flap:
+            flaps.append(float(detector.times[detector.index]))
+    elapsed = time.perf_counter() - start
+    return np.asarray(flaps), elapsed / max(samples, 1) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("landmarks", nargs="?", help="gravação .npz (padrão: sintética)")
+    parser.add_argument("--seconds", type=float, default=60, help="duração da gravação sintética")
+    parser.add_argument("--noise", type=float, default=0.005,
+                        help="ruído (desvio padrão) dos landmarks sintéticos")
+    args = parser.parse_args()
+
+    path = args.landmarks
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "synthetic.npz")
+        synthetic_landmarks(path, args.seconds, noise=args.noise)
+
+    threshold, threshold_us = flap_times(path, None)
+    engine = GestureEngine()
+    gesture, gesture_us = flap_times(path, engine)
+
+    leads = []
+    for t in threshold:
+        earlier = gesture[(gesture <= t) & (gesture > t - MATCH_WINDOW)]
+        if len(earlier):
+            leads.append((t - earlier[0]) * 1000)
+    print(f"limiar: {len(threshold)} flaps ({threshold_us:.1f} µs/amostra)")
+    print(f"gesto:  {len(gesture)} flaps, {engine.onset_flaps} no início do movimento "
+          f"({gesture_us:.1f} µs/amostra)")
+    print(f"pareados: {len(leads)}/{len(threshold)}, "
+          f"extras do gesto: {len(gesture) - len(leads)}")
+    if leads:
+        print(f"antecipação: média {np.mean(leads):.1f} ms, mediana {np.median(leads):.1f} ms, "
+              f"máx {np.max(leads):.1f} ms")
+
+    failures = []
+    if len(threshold) == 0:
+        failures.append("nenhum flap do limiar na gravação")
+    elif len(leads) < MIN_PAIRED_SHARE * len(threshold):
+        failures.append(f"só {len(leads)}/{len(threshold)} flaps pareados "
+                        f"(mínimo {MIN_PAIRED_SHARE:.0%})")
+    if len(gesture) - len(leads) > MAX_EXTRA_SHARE * max(len(threshold), 1):
+        failures.append(f"{len(gesture) - len(leads)} flaps extras do gesto "
+                        f"(máximo {MAX_EXTRA_SHARE:.0%} dos do limiar)")
+    if leads and np.median(leads) < MIN_LEAD_MS:
+        failures.append(f"antecipação mediana {np.median(leads):.1f} ms < {MIN_LEAD_MS} ms")
+    for failure in failures:
+        print(f"FALHOU: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
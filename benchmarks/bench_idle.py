@@ -0,0 +1,75 @@
+"""CPU por minuto das telas de menu e game over, com e sem o agendador de energia.
+
+Roda cada tela em tempo real (SDL dummy) por ``--seconds`` em três modos:
+``full`` (flip completo a 30 FPS, como antes), ``dirty`` (só as regiões que
+mudaram) e ``idle`` (ocioso desde o início: taxa reduzida e câmera pausada).
+Imprime os segundos de CPU por minuto que o ``FrameScheduler`` contabilizou.
+Sem ``--source`` o menu roda sem detector ("Loading camera..."); com uma
+fonte (ex.: ``synthetic``) a captura e a conversão do frame entram na conta.
+Com o driver dummy o flip não custa nada; numa janela real a economia do
+``display.update`` parcial é maior.
+
+Uso: python benchmarks/bench_idle.py [--seconds 10] [--source synthetic]
+"""
+
+import argparse
+import os
+import sys
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame  # noqa: E402
+
+import flappy_arms as game  # noqa: E402
+
+# (nome, idle_after, partial)
+MODES = (("full", 0, False), ("dirty", 0, True), ("idle", 1e-3, True))
+
+
+def run_screen(name, seconds, loader):
+    """Roda uma tela até um ESC agendado; retorna o relatório do scheduler"""
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE),
+                          int(seconds * 1000), loops=1)
+    if name == "menu":
+        game.menu_screen(loader)
+    else:
+        game.game_over_screen(12, 30, loader.detector)
+    return game.frame_scheduler.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0, help="duração de cada medição")
+    parser.add_argument("--source", help="fonte do detector no menu (ex.: synthetic, 0)")
+    args = parser.parse_args()
+
+    loader = types.SimpleNamespace(detector=None, error=None)
+    if args.source is not None:
+        source = int(args.source) if args.source.isdigit() else args.source
+        game.init_display()
+        loader.detector = game.create_pose_detector("inline", source=source)
+        loader.detector.warm_up()
+
+    try:
+        print(f"{'tela':<10} {'modo':<6} {'estado':<16} {'CPU s/min':>10} {'% núcleo':>9}")
+        for screen_name in ("menu", "game_over"):
+            for mode, idle_after, partial in MODES:
+                game.init_display(idle_after, partial)
+                game.camera_pause["detector"] = None
+                if loader.detector is not None:
+                    loader.detector.resume()
+                report = run_screen(screen_name, args.seconds, loader)
+                # O ESC do fim acorda a tela; o estado dominante é o mais longo
+                state, usage = max(report.items(), key=lambda item: item[1]["wall_s"])
+                print(f"{screen_name:<10} {mode:<6} {state:<16} {usage['cpu_s_per_min']:>10.2f} "
+                      f"{usage['cpu_percent']:>8.1f}%")
+    finally:
+        if loader.detector is not None:
+            loader.detector.release()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Latência do braço até o flip, medida no loop do jogo sem ninguém na câmera.
+
+Roda o mesmo caminho da tela de jogo (detector, ``engine.advance``,
+``draw_play_frame``, ``present_frame``) com SDL dummy por ``--seconds``,
+sobre a fonte sintética (bonecos levantando os braços a cada ``period``) ou
+uma gravação de landmarks (.npz). A partida recomeça sozinha a cada game
+over. Imprime percentis, médias de cada parcela e o histograma da sessão.
+
+Uso: python benchmarks/bench_latency.py [--source synthetic|sessao.npz] [--inference process]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import flappy_arms as game  # noqa: E402
+from latency_trace import LatencyTracer  # noqa: E402
+
+
+def calibrate(detector, timeout=10.0):
+    """Tenta calibrar até conseguir ou estourar ``timeout``"""
+    deadline = time.monotonic() + timeout
+    while not detector.calibrate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def run(detector, tracer, seconds, fps):
+    """Loop da tela de jogo por ``seconds``; retorna o número de partidas"""
+    clouds = [game.Cloud(100 + 250 * i, 80 + 40 * i, 0.3) for i in range(5)]
+    engine = game.GameEngine(bird_factory=game.Bird, pipe_factory=game.Pipe)
+    frame_time = engine.dt
+    rounds = 1
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        flap, camera_frame = detector.detect_arms_raised()
+        if flap:
+            engine.flap()
+            game.trace_flap(tracer, detector, engine.tick)
+        alpha = engine.advance(frame_time)
+        tracer.advanced(engine.tick, time.monotonic())
+        game.frame_scheduler.mark_all()
+        game.draw_play_frame(engine, alpha, clouds, camera_frame, detector.arms_raised)
+        frame_time = game.present_frame("play", fps) / 1000
+        tracer.presented(game.frame_scheduler.presented_at)
+        if engine.game_over:
+            tracer.discard()
+            engine.reset()
+            rounds += 1
+    return rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default="synthetic",
+                        help="synthetic, vídeo, diretório de frames ou landmarks .npz")
+    parser.add_argument("--inference", choices=["inline", "process"], default="inline")
+    parser.add_argument("--gesture", action="store_true", help="flap pelo GestureEngine")
+    parser.add_argument("--seconds", type=float, default=20.0, help="duração da medição")
+    parser.add_argument("--fps", type=int, default=game.FPS, help="FPS do loop do jogo")
+    parser.add_argument("--out", metavar="ARQUIVO.csv", help="grava a latência de cada flap")
+    args = parser.parse_args()
+
+    game.init_display(idle_after=0)
+    source = int(args.source) if args.source.isdigit() else args.source
+    detector = game.create_pose_detector(args.inference, source=source, gesture=args.gesture)
+    tracer = LatencyTracer()
+    try:
+        if not detector.warm_up(timeout=10.0):
+            print("Aviso: a fonte não entregou frames no aquecimento")
+        if not calibrate(detector):
+            print("Aviso: calibração falhou; os flaps usam o limiar sem referência")
+        rounds = run(detector, tracer, args.seconds, args.fps)
+    finally:
+        detector.release()
+
+    report = tracer.report()
+    if report is None:
+        print("Nenhum flap chegou à tela")
+        return
+    print(f"{args.source} ({args.inference}), {rounds} partidas, {report['flaps']} flaps")
+    print("total: p50 {p50_ms:.1f} ms, p95 {p95_ms:.1f} ms, p99 {p99_ms:.1f} ms, "
+          "máx {max_ms:.1f} ms".format(**report))
+    print("médias: inferência {inference_ms:.1f} ms, espera do jogo {detect_wait_ms:.1f} ms, "
+          "tick {tick_wait_ms:.1f} ms, desenho + flip {render_ms:.1f} ms".format(**report))
+    for line in tracer.histogram_lines():
+        print(line)
+    if args.out:
+        tracer.save(args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Carga do placar persistente: um milhão de pontuações e a latência dos top-N.
+
+Enfileira ``--rows`` pontuações (jogadores e dias sorteados) no
+``ScoreStore``, espera a thread gravar e mede a vazão das inserções em lote.
+Depois mede o top-N geral, do dia e por jogador: sem cache (um jogador/dia
+diferente a cada consulta) e com cache. Confere no ``EXPLAIN QUERY PLAN``
+que nenhuma consulta ordena em memória e termina com código 1 se o p99 sem
+cache passar de ``--max-ms``.
+
+Uso: python benchmarks/bench_leaderboard.py [--rows 1000000] [--max-ms 5]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from leaderboard import QUERIES, ScoreStore, day_of  # noqa: E402
+
+DAY = 86400
+
+
+def fill(store, rows, players, days, rng):
+    """Enfileira ``rows`` pontuações; retorna os segundos até tudo estar gravado"""
+    now = time.time()
+    start = time.perf_counter()
+    for _ in range(rows):
+        store.submit(int(rng.expovariate(1 / 15)), f"player{rng.randrange(players)}",
+                     now - rng.random() * days * DAY)
+    queued = time.perf_counter() - start
+    store.flush()
+    return queued, time.perf_counter() - start
+
+
+def measure(lookup, queries, n):
+    """Latências (ms) de ``lookup`` (query ou top) para cada ``(escopo, jogador, dia)``"""
+    latencies = np.empty(len(queries))
+    for i, (scope, player, day) in enumerate(queries):
+        start = time.perf_counter()
+        lookup(n, scope, player, day)
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="pontuações inseridas")
+    parser.add_argument("--players", type=int, default=20_000, help="jogadores distintos")
+    parser.add_argument("--days", type=int, default=365, help="dias cobertos pelas partidas")
+    parser.add_argument("--top", type=int, default=10, help="N do top-N")
+    parser.add_argument("--queries", type=int, default=500, help="consultas por escopo")
+    parser.add_argument("--max-ms", type=float, default=5.0,
+                        help="p99 máximo (ms) de uma consulta sem cache")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        store = ScoreStore(os.path.join(directory, "scores.db"))
+        try:
+            queued, total = fill(store, args.rows, args.players, args.days, rng)
+            print(f"inserção: {args.rows} pontuações, submit {queued / args.rows * 1e6:.1f} µs "
+                  f"cada, gravadas em {total:.1f} s ({args.rows / total:,.0f}/s, "
+                  f"{store.version} lotes)")
+
+            connection = sqlite3.connect(store.path)
+            for scope, sql in QUERIES.items():
+                params = (1,) if scope == "global" else ("x", 1)
+                plan = " | ".join(row[-1] for row in
+                                  connection.execute("EXPLAIN QUERY PLAN " + sql, params))
+                print(f"{scope:<7} plano: {plan}")
+                if "TEMP B-TREE" in plan:
+                    failed = True
+            connection.close()
+
+            now = time.time()
+            for scope in QUERIES:
+                cold = [(scope, f"player{rng.randrange(args.players)}",
+                         day_of(now - rng.randrange(args.days) * DAY))
+                        for _ in range(args.queries)]
+                uncached = measure(store.query, cold, args.top)
+                cached = measure(store.top, [cold[0]] * args.queries, args.top)
+                p50, p99 = np.percentile(uncached, (50, 99))
+                print(f"{scope:<7} sem cache: p50 {p50:.3f} ms, p99 {p99:.3f} ms, "
+                      f"máx {uncached.max():.3f} ms; com cache: p50 "
+                      f"{np.percentile(cached, 50) * 1000:.1f} µs")
+                if p99 > args.max_ms:
+                    failed = True
+        finally:
+            store.close()
+
+    if failed:
+        print(f"FALHOU: consulta acima de {args.max_ms} ms ou sem índice")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
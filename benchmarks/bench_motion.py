@@ -0,0 +1,138 @@
+"""Detector por movimento vs. MediaPipe Pose: CPU por frame, atraso e concordância.
+
+Passa os mesmos frames de um clipe (vídeo, diretório de frames ou a fonte
+sintética) pelos dois backends, sem seguir o relógio, calibrando ambos no
+primeiro frame (braços abaixados). Mede a CPU por frame de cada um, a
+concordância do estado "braço levantado" frame a frame e o atraso de cada
+flap do detector por movimento em relação ao do MediaPipe (negativo: dispara
+antes). Na fonte sintética também compara com a verdade do boneco, e com
+``--no-pose`` só com ela (máquinas sem MediaPipe). Termina com código 1 se a
+concordância ficar abaixo de ``--min-agreement``.
+
+Uso: python benchmarks/bench_motion.py [clip.mp4 | frames/ | synthetic] [--frames 600] [--no-pose]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from input_sources import SyntheticSource, open_source  # noqa: E402
+from motion_detector import MotionEstimator  # noqa: E402
+from pose_detector import arms_raised  # noqa: E402
+
+# Frames em que um flap do detector conta como o mesmo flap da referência
+MATCH_FRAMES = 10
+
+
+def rising_edges(states):
+    """Índices dos frames em que o estado passa de abaixado para levantado"""
+    states = np.asarray(states, dtype=bool)
+    return np.flatnonzero(states[1:] & ~states[:-1]) + 1
+
+
+def compare(name, reference, states, fps, detector="detector por movimento"):
+    """Imprime concordância e atraso dos flaps de ``states`` em relação a ``reference``"""
+    reference = np.asarray(reference, dtype=bool)
+    states = np.asarray(states, dtype=bool)
+    agreement = float(np.mean(reference == states))
+    flaps = rising_edges(states)
+    delays = []
+    for edge in rising_edges(reference):
+        if len(flaps):
+            nearest = flaps[np.argmin(np.abs(flaps - edge))]
+            if abs(nearest - edge) <= MATCH_FRAMES:
+                delays.append((nearest - edge) * 1000 / fps)
+    expected = len(rising_edges(reference))
+    line = (f"{detector} vs. {name}: concordância {agreement:.1%}, flaps "
+            f"{len(delays)}/{expected} pareados ({len(flaps)} do detector)")
+    if delays:
+        line += (f", atraso p50 {np.percentile(delays, 50):+.0f} ms, "
+                 f"p95 {np.percentile(delays, 95):+.0f} ms")
+    print(line)
+    return agreement
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default="synthetic",
+                        help="vídeo, diretório de frames ou synthetic (padrão)")
+    parser.add_argument("--frames", type=int, default=600, help="máximo de frames analisados")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1, 2], default=0,
+                        help="modelo do MediaPipe usado como referência")
+    parser.add_argument("--no-pose", action="store_true",
+                        help="só o detector por movimento (compara com a verdade sintética)")
+    parser.add_argument("--min-agreement", type=float, default=0.9,
+                        help="concordância mínima com a referência")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    synthetic = isinstance(source, SyntheticSource)
+    if args.no_pose and not synthetic:
+        parser.error("--no-pose só com a fonte sintética (é a única com verdade)")
+    pose = None
+    if not args.no_pose:
+        from pose_detector import PoseEstimator
+        pose = PoseEstimator(model_complexity=args.model_complexity)
+    motion = MotionEstimator()
+
+    truth, pose_states, motion_states = [], [], []
+    pose_cpu, motion_cpu = [], []
+    last_id = None
+    while len(motion_states) < args.frames:
+        frame, _, frame_id = source.read()
+        if frame is None or frame_id == last_id:
+            break
+        last_id = frame_id
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if synthetic:
+            truth.append(source.arms_up(frame_id - 1))
+        if not motion_states:
+            # Primeiro frame: calibração dos dois (braços abaixados)
+            motion.calibrate(frame_rgb)
+            if pose is not None:
+                pose.process(frame_rgb)
+        if pose is not None:
+            start = time.process_time()
+            landmarks = pose.process(frame_rgb)
+            pose_cpu.append(time.process_time() - start)
+            pose_states.append(bool(landmarks) and arms_raised(landmarks))
+        start = time.process_time()
+        motion_states.append(motion.process(frame_rgb))
+        motion_cpu.append(time.process_time() - start)
+    source.release()
+    if not motion_states:
+        print("Nenhum frame lido")
+        return
+
+    fps = getattr(source, "fps", 30) or 30
+    print(f"{len(motion_states)} frames de {args.source} ({fps:.0f} FPS), calibração: "
+          f"ombros em {motion.shoulders[0]:.2f} da altura, centro {motion.shoulders[1]:.2f}, "
+          f"largura {motion.shoulders[2]:.2f}")
+    motion_ms = np.mean(motion_cpu) * 1000
+    line = f"CPU por frame: movimento {motion_ms:.3f} ms"
+    if pose is not None:
+        pose_ms = np.mean(pose_cpu) * 1000
+        line += f", MediaPipe {pose_ms:.2f} ms ({pose_ms / max(motion_ms, 1e-6):.0f}x)"
+        pose.close()
+    print(line)
+
+    agreements = []
+    if pose is not None:
+        agreements.append(compare("MediaPipe", pose_states, motion_states, fps))
+    if synthetic:
+        if pose is not None:
+            compare("verdade", truth, pose_states, fps, detector="MediaPipe")
+        agreements.append(compare("verdade", truth, motion_states, fps))
+    if min(agreements) < args.min_agreement:
+        print(f"FALHOU: concordância abaixo de {args.min_agreement:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Taxa de resultados e atraso por jogador no modo multijogador, de 1 a N jogadores.
+
+Para cada número de jogadores cria o ``PlayerGroup`` (faixas de uma fonte
+só, ou ``--cameras`` para uma fonte por jogador), aquece e consulta
+``detect_flaps`` como o jogo faria por ``--seconds``. Imprime, por jogador,
+resultados de pose por segundo, inferência p50/p95 e atraso p50 desde a
+captura; e o total, para ver quanto a taxa de cada um cai com mais jogadores.
+
+Uso: python benchmarks/bench_multiplayer.py [--source synthetic] [--max-players 4] [--cameras]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pose_pool import create_player_group  # noqa: E402
+
+
+def run(players, args):
+    """Mede um grupo de ``players`` jogadores; retorna o player_report"""
+    source = int(args.source) if args.source.isdigit() else args.source
+    sources = [source] * players if args.cameras else [source]
+    group = create_player_group(players, sources, realtime=True,
+                                model_complexity=args.model_complexity)
+    try:
+        if not group.warm_up(timeout=30.0):
+            print(f"Aviso: {players} jogador(es) sem resultados no aquecimento")
+        group.reset_stats()
+        end = time.monotonic() + args.seconds
+        while time.monotonic() < end:
+            group.detect_flaps()
+            # Um frame do jogo a 60 FPS
+            time.sleep(1 / 60)
+        return group.player_report()
+    finally:
+        group.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default="synthetic",
+                        help="fonte de vídeo (padrão: synthetic, com uma figura por faixa)")
+    parser.add_argument("--max-players", type=int, default=4, help="mede de 1 até este número")
+    parser.add_argument("--cameras", action="store_true",
+                        help="uma fonte por jogador (ProcessPoseDetector) em vez de faixas")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duração de cada medição")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1, 2], default=1)
+    args = parser.parse_args()
+
+    print(f"{'jogadores':>9} {'jogador':>7} {'Hz':>6} {'inf p50':>8} {'inf p95':>8} "
+          f"{'atraso p50':>11}")
+    for players in range(1, args.max_players + 1):
+        report = run(players, args)
+        for player in report["players"]:
+            print(f"{players:>9} {player['player']:>7} {player['hz']:>6.1f} "
+                  f"{player['inference_p50_ms']:>6.1f}ms {player['inference_p95_ms']:>6.1f}ms "
+                  f"{player['latency_p50_ms']:>9.1f}ms")
+        print(f"{players:>9} {'total':>7} {report['total_hz']:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Vazão pura de inferência: PoseDetector sobre um vídeo ou diretório de frames.
+
+A fonte é lida o mais rápido possível (sem seguir o relógio), então o
+resultado mede só captura/decodificação + MediaPipe, sem renderização.
+Também informa o tempo por frame do MediaPipe, para comparar modelos,
+resolução de inferência e recorte da região dos braços.
+
+Com ``--cpu-budget`` a fonte segue o relógio (o governor agenda pelo tempo de
+captura) e o relatório do governor é impresso no fim.
+
+Uso: python benchmarks/bench_pose_source.py CLIPE [--roi] [--inference-size 256]
+     [--model-complexity 0] [--record landmarks.npz] [--cpu-budget 0.3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from input_sources import LandmarkRecorder, open_source  # noqa: E402
+from pose_detector import PoseDetector  # noqa: E402
+from pose_governor import InferenceGovernor  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clip", help="vídeo, diretório de frames ou 'synthetic'")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1, 2], default=1)
+    parser.add_argument("--inference-size", type=int, metavar="PIXELS")
+    parser.add_argument("--roi", action="store_true")
+    parser.add_argument("--frames", type=int, default=300,
+                        help="limite de frames para a fonte sintética")
+    parser.add_argument("--record", metavar="ARQUIVO.npz",
+                        help="também grava os landmarks para reprodução sem MediaPipe")
+    parser.add_argument("--cpu-budget", type=float, metavar="FRAÇÃO",
+                        help="inferência adaptativa limitada a esta fração de um núcleo")
+    args = parser.parse_args()
+
+    recorder = LandmarkRecorder(args.record) if args.record else None
+    realtime = args.cpu_budget is not None
+    source = open_source(args.clip, realtime=realtime)
+    if args.clip == "synthetic":
+        source.n_frames = args.frames
+    governor = InferenceGovernor(args.cpu_budget, max_hz=source.fps) if realtime else None
+    detector = PoseDetector(source, recorder=recorder, model_complexity=args.model_complexity,
+                            inference_size=args.inference_size, roi=args.roi, governor=governor)
+    detector.calibrated = True  # conta flaps desde o primeiro frame
+    frames = 0
+    flaps = 0
+    inference_ms = []
+    start = time.perf_counter()
+    try:
+        while True:
+            if realtime:
+                detector.camera.wait_new(detector._frame_id)
+            flap, _ = detector.detect_arms_raised()
+            if detector.camera.finished:
+                break
+            frames += 1
+            flaps += flap
+            inference_ms.append(detector.inference_ms)
+        report = detector.governor_report()
+    finally:
+        detector.release()
+    elapsed = time.perf_counter() - start
+    print(f"{frames} frames em {elapsed:.2f} s: {frames / elapsed:.1f} frames/s, {flaps} flaps")
+    if inference_ms:
+        p50, p95 = np.percentile(inference_ms, (50, 95))
+        print(f"inferência por frame: p50 {p50:.2f} ms, p95 {p95:.2f} ms")
+    if args.roi:
+        print(f"recorte: {detector.estimator.roi_changes} mudanças em {frames} frames")
+    if report:
+        print("governor: {inference_hz:.1f} Hz, {cpu_percent:.0f}% de CPU, "
+              "+{added_flap_latency_ms:.1f} ms por flap confirmado ({flaps_predicted}/{flaps} "
+              "pela previsão, {false_flaps} falsos)".format(**report))
+
+
+if __name__ == "__main__":
+    main()
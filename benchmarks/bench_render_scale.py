@@ -0,0 +1,120 @@
+"""Custo do frame de jogo por escala de renderização e o ajuste dinâmico.
+
+Roda sem janela (driver "dummy" do SDL). Para cada ``--scales`` desenha
+``--frames`` frames de jogo (nuvens, canos, pássaro, placar, câmera no canto
+e indicador) na superfície reduzida e mede desenho + ampliação até a janela.
+Depois simula o modo dinâmico duas vezes. Na primeira cada frame custa o
+tempo medido mais ``--load-ms × escala²`` (uma carga proporcional aos
+pixels, como um desenho limitado por preenchimento): a escala deve descer e
+trazer o p90 para dentro do orçamento. Na segunda a carga extra é fixa (CPU
+fora do desenho, que a escala não reduz): o degrau deve ser desfeito. O p90
+julgado é o dos últimos frames fora de teste (sem os frames de uma troca
+ainda sendo conferida), para o resultado não depender de onde a execução
+para. Termina com código 1 se algum dos dois não acontecer, ou se uma subida
+ficar mais que ``MAX_TRIAL_OVER`` frames acima do orçamento.
+
+Uso: python benchmarks/bench_render_scale.py [--scales 1 0.75 0.5] [--load-ms 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+
+import flappy_arms as game  # noqa: E402
+from game_core import GameEngine  # noqa: E402
+from render_scale import RenderView  # noqa: E402
+
+# Frames seguidos acima do orçamento tolerados numa subida em teste
+MAX_TRIAL_OVER = 8
+
+
+def play_frame(engine, clouds, camera_frame):
+    """Um frame de jogo na escala atual; retorna os ms de (desenho, ampliação)"""
+    engine.step()
+    if engine.game_over:
+        engine.reset()
+    if engine.tick % 20 == 0:
+        engine.flap()
+    start = time.perf_counter()
+    game.draw_play_frame(engine, 0.5, clouds, camera_frame, True)
+    drawn = time.perf_counter()
+    game.view.present()
+    return (drawn - start) * 1000, (time.perf_counter() - drawn) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 0.75, 0.5],
+                        help="escalas medidas")
+    parser.add_argument("--frames", type=int, default=600, help="frames por escala")
+    parser.add_argument("--load-ms", type=float, default=20.0,
+                        help="carga extra na escala 1 da simulação do modo dinâmico")
+    args = parser.parse_args()
+
+    game.init_display()
+    engine = GameEngine(bird_factory=game.Bird, pipe_factory=game.Pipe, seed=1)
+    clouds = [game.Cloud(200 * i, 60 + 40 * i, 0.3, 1.0) for i in range(5)]
+    camera_frame = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+
+    baseline = None
+    for scale in args.scales:
+        game.view = RenderView(game.window, scale)
+        game.use_view(True)
+        for _ in range(30):
+            play_frame(engine, clouds, camera_frame)
+        times = np.array([play_frame(engine, clouds, camera_frame) for _ in range(args.frames)])
+        total = times.sum(axis=1)
+        p50, p95 = np.percentile(total, (50, 95))
+        baseline = baseline or p50
+        width, height = game.view.surface.get_size()
+        print(f"escala {scale:.2f} ({width}x{height}): p50 {p50:.2f} ms, p95 {p95:.2f} ms "
+              f"(desenho {np.median(times[:, 0]):.2f} + ampliação {np.median(times[:, 1]):.2f}; "
+              f"{p50 / baseline:.0%} da primeira)")
+
+    budget = 1000 / game.FPS
+    failed = False
+    for name, pixel_load in (("proporcional aos pixels", True), ("fixa", False)):
+        game.view = view = RenderView(game.window, 1.0, dynamic=True, budget_ms=budget)
+        game.use_view(True)
+        history = []
+        # Frames fora de teste e a maior sequência acima do orçamento numa subida
+        settled = []
+        over = longest_over = 0
+        for frame in range(args.frames * 2):
+            load = args.load_ms * view.scale ** 2 if pixel_load else args.load_ms
+            work_ms = sum(play_frame(engine, clouds, camera_frame)) + load
+            over = over + 1 if view.raising and work_ms > budget else 0
+            longest_over = max(longest_over, over)
+            if not view.in_trial:
+                settled.append(work_ms)
+            if view.adjust(work_ms):
+                game.use_view(True)
+                history.append((frame, view.scale))
+        p90 = np.percentile(settled[-view.window_frames:], 90) if settled else float("inf")
+        print(f"dinâmico, carga {name} de {args.load_ms:.0f} ms (orçamento {budget:.1f} ms): "
+              + (", ".join(f"frame {frame} -> {scale:.2f}" for frame, scale in history)
+                 or "sem trocas")
+              + f"; final {view.scale:.2f}, p90 {p90:.1f} ms, {view.reverted} desfeita(s), "
+              f"até {longest_over} frames seguidos acima do orçamento em subidas")
+        if pixel_load and p90 > budget and view.scale > view.steps[-1]:
+            print("FALHOU: a escala dinâmica não trouxe o frame para o orçamento")
+            failed = True
+        if not pixel_load and p90 > budget and view.scale != 1.0:
+            print("FALHOU: o degrau que não baixou o p90 não foi desfeito")
+            failed = True
+        if pixel_load and longest_over > MAX_TRIAL_OVER:
+            print(f"FALHOU: subida em teste ficou {longest_over} frames acima do orçamento")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Verificação de partidas gravadas: replays sem display por segundo.
+
+Joga ``--runs`` partidas com sementes diferentes (piloto automático com
+erros, para terminarem em game over em tempos variados), grava cada uma
+como ``Run`` (semente + ticks dos flaps) e depois as verifica com
+``replay.verify`` reaproveitando um engine só. Imprime partidas e ticks por
+segundo, bytes por partida gravada e termina com código 1 se alguma não
+bater. Com ``--db`` verifica as melhores partidas de um placar
+(``scores.db``) em vez das geradas, como numa auditoria de recorde.
+
+Uso: python benchmarks/bench_replay.py [--runs 2000] [--workers 4] [--db scores.db]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_core import GameEngine  # noqa: E402
+from replay import Run, encode_flaps, verify  # noqa: E402
+
+
+def autopilot(engine):
+    """Flap quando o pássaro desce abaixo do vão do próximo cano"""
+    bird = engine.bird
+    for pipe in engine.pipes:
+        if pipe.x + pipe.width > bird.left:
+            return bird.y >= pipe.gap_y + 145 and bird.velocity >= 0
+    return bird.y >= 500 and bird.velocity >= 0
+
+
+def play(seed, miss_rate=0.02):
+    """Uma partida com a semente ``seed``; o piloto erra ``miss_rate`` dos flaps"""
+    engine = GameEngine(seed=seed)
+    mistakes = random.Random(seed)
+    while not engine.game_over:
+        if autopilot(engine) and mistakes.random() >= miss_rate:
+            engine.flap()
+        # Frames de duração variável: os flaps caem em ticks quaisquer
+        engine.advance(mistakes.uniform(0.005, 0.03))
+    return Run.from_engine(engine)
+
+
+def verify_all(runs):
+    """Quantas de ``runs`` o replay reproduz (um engine para todas)"""
+    engine = GameEngine(seed=0)
+    return sum(verify(run, engine) for run in runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000, help="partidas geradas")
+    parser.add_argument("--workers", type=int, default=1, help="processos verificando")
+    parser.add_argument("--db", help="verifica as melhores partidas deste placar")
+    parser.add_argument("--top", type=int, default=1000, help="partidas lidas do --db")
+    args = parser.parse_args()
+
+    if args.db:
+        from leaderboard import ScoreStore
+        store = ScoreStore(args.db)
+        runs = [run for _, _, run in store.runs(args.top)]
+        store.close()
+    else:
+        start = time.perf_counter()
+        runs = [play(seed) for seed in range(args.runs)]
+        print(f"gravação: {len(runs)} partidas em {time.perf_counter() - start:.1f} s")
+    if not runs:
+        print("Nenhuma partida gravada")
+        return
+
+    ticks = sum(run.ticks for run in runs)
+    stored = sum(len(encode_flaps(run.flap_ticks)) for run in runs)
+    start = time.perf_counter()
+    if args.workers > 1:
+        chunks = [runs[i::args.workers] for i in range(args.workers)]
+        with Pool(args.workers) as pool:
+            matched = sum(pool.map(verify_all, chunks))
+    else:
+        matched = verify_all(runs)
+    elapsed = time.perf_counter() - start
+
+    print(f"verificação: {matched}/{len(runs)} partidas batem; {len(runs) / elapsed:,.0f} "
+          f"partidas/s, {ticks / elapsed:,.0f} ticks/s ({ticks / len(runs):.0f} ticks e "
+          f"{stored / len(runs):.0f} bytes de flaps por partida, {args.workers} processo(s))")
+    if matched != len(runs):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
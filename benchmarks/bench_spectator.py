@@ -0,0 +1,160 @@
+"""Transmissão para espectadores: bytes por segundo e atraso com 1 e com muitos.
+
+Um ``SpectatorServer`` em 127.0.0.1 publica a 60 Hz, por ``--seconds``, o
+estado de uma partida jogada pelo piloto automático (recomeça no game
+over). Para cada número em ``--viewers`` os ``SpectatorClient`` rodam numa
+thread que lê os sockets prontos (``selectors``). Com ``--loss`` cada
+espectador descarta essa fração dos pacotes recebidos, para exercitar os
+deltas contra o último snapshot confirmado. Imprime bytes/s por espectador
+e no total, tamanho médio do pacote, fração de quadros-chave, o RTT medido
+pelos ACKs no servidor (p50/p95), a variação do atraso vista pelos
+espectadores e o atraso ponta a ponta estimado da cena exibida (metade do
+RTT mais a interpolação), o mesmo que vale entre duas máquinas. Termina
+com código 1 se algum snapshot decodificado diferir do enviado ou se um
+espectador não receber nada.
+
+Uso: python benchmarks/bench_spectator.py [--viewers 1 10 50] [--seconds 5] [--loss 0.05]
+"""
+
+import argparse
+import os
+import random
+import selectors
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_core import GameEngine, TICK_RATE  # noqa: E402
+from spectator import SpectatorClient, SpectatorServer  # noqa: E402
+
+
+def autopilot(engine):
+    """Flap quando o pássaro desce abaixo do vão do próximo cano"""
+    bird = engine.bird
+    for pipe in engine.pipes:
+        if pipe.x + pipe.width > bird.left:
+            return bird.y >= pipe.gap_y + 145 and bird.velocity >= 0
+    return bird.y >= 500 and bird.velocity >= 0
+
+
+class BenchClient(SpectatorClient):
+    """Espectador que perde ``loss`` dos pacotes e guarda o que decodificou"""
+
+    def __init__(self, address, loss=0.0, seed=0, **options):
+        super().__init__(address, **options)
+        self.loss = loss
+        self.rng = random.Random(seed)
+        # seq -> campos, para comparar com o que o servidor enviou
+        self.received = {}
+
+    def handle(self, packet, received_ms):
+        if self.loss and self.rng.random() < self.loss:
+            return
+        super().handle(packet, received_ms)
+        if self.latest is not None:
+            self.received[self.latest.seq] = self.decoded[self.latest.seq]
+
+
+def receive(clients, stop):
+    """Thread dos espectadores: lê os sockets prontos até ``stop``"""
+    selector = selectors.DefaultSelector()
+    for client in clients:
+        selector.register(client.socket, selectors.EVENT_READ, client)
+        # Primeiro HELLO
+        client.poll()
+    while not stop.is_set():
+        for key, _ in selector.select(timeout=0.05):
+            key.data.poll()
+    selector.close()
+
+
+def run(viewers, seconds, loss, interp_ms):
+    """Uma rodada com ``viewers`` espectadores; retorna (relatório, falhas)"""
+    server = SpectatorServer(("127.0.0.1", 0))
+    clients = [BenchClient(server.address, loss, seed=i, interp_ms=interp_ms)
+               for i in range(viewers)]
+    stop = threading.Event()
+    thread = threading.Thread(target=receive, args=(clients, stop), daemon=True)
+    thread.start()
+
+    engine = GameEngine(seed=1)
+    sent = {}
+    period = 1.0 / TICK_RATE
+    deadline = time.perf_counter()
+    end = deadline + seconds
+    while deadline < end:
+        if engine.game_over:
+            engine.reset()
+        if autopilot(engine):
+            engine.flap()
+        engine.step()
+        server.publish(engine, engine.flapped)
+        sent[server.seq] = server._sent[server.seq]
+        deadline += period
+        time.sleep(max(deadline - time.perf_counter(), 0))
+    # Últimos pacotes em trânsito
+    time.sleep(0.1)
+    stop.set()
+    thread.join()
+
+    failures = []
+    jitter = []
+    received = 0
+    for i, client in enumerate(clients):
+        wrong = [seq for seq, fields in client.received.items() if sent.get(seq) != fields]
+        if wrong:
+            failures.append(f"espectador {i}: {len(wrong)} snapshots diferentes do enviado")
+        if not client.received:
+            failures.append(f"espectador {i}: nenhum snapshot")
+        if client.received:
+            jitter.extend(client.jitter_ms())
+        received += len(client.received)
+        client.close()
+    server_report = server.report()
+    server.close()
+    report = dict(server_report, viewers=viewers, published=server.seq,
+                  received_share=received / max(server.seq * viewers, 1),
+                  undecodable=sum(client.undecodable for client in clients),
+                  jitter_p50_ms=np.percentile(jitter, 50) if jitter else 0,
+                  jitter_p95_ms=np.percentile(jitter, 95) if jitter else 0,
+                  display_delay_ms=server_report["rtt_p50_ms"] / 2 + interp_ms)
+    return report, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--viewers", type=int, nargs="+", default=[1, 10, 50],
+                        help="números de espectadores medidos")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duração de cada rodada")
+    parser.add_argument("--loss", type=float, default=0.0,
+                        help="fração dos pacotes descartada por cada espectador")
+    parser.add_argument("--interp-ms", type=int, default=50,
+                        help="atraso de interpolação dos espectadores")
+    args = parser.parse_args()
+
+    failed = False
+    for viewers in args.viewers:
+        report, failures = run(viewers, args.seconds, args.loss, args.interp_ms)
+        print(f"{viewers:3d} espectador(es): {report['bytes_per_s'] / viewers:.0f} B/s cada, "
+              f"{report['bytes_per_s'] / 1024:.1f} KiB/s no total, "
+              f"{report['packet_bytes']:.1f} bytes/pacote "
+              f"({report['keyframe_share']:.1%} quadros-chave), "
+              f"{report['received_share']:.1%} dos snapshots recebidos "
+              f"({report['undecodable']} sem base)")
+        print(f"    RTT p50 {report['rtt_p50_ms']:.1f} ms / p95 {report['rtt_p95_ms']:.1f} ms, "
+              f"variação do atraso p50 {report['jitter_p50_ms']:.0f} ms / p95 "
+              f"{report['jitter_p95_ms']:.0f} ms, cena exibida ~"
+              f"{report['display_delay_ms']:.0f} ms atrás")
+        for failure in failures:
+            print(f"    FALHOU: {failure}")
+        failed = failed or bool(failures)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Suíte de benchmarks: primitivas de desenho, frames inteiros e pose.
+
+Roda sem janela (driver de vídeo "dummy" do SDL). Os resultados vão para um
+JSON; com ``--baseline`` compara com uma execução anterior e termina com
+código 1 se algum benchmark ficar mais lento que o limite.
+
+Uso:
+    python benchmarks/bench_suite.py --out results.json
+    python benchmarks/bench_suite.py --baseline results.json --threshold 0.15
+    python benchmarks/bench_suite.py --filter frame --clip clip.mp4
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import flappy_arms as game  # noqa: E402
+from game_core import GameEngine  # noqa: E402
+from input_sources import SyntheticSource, open_source  # noqa: E402
+
+
+def measure(fn, min_time=0.2, repeat=5):
+    """Tempo por chamada em µs: mediana e mínimo de ``repeat`` rodadas"""
+    fn()  # aquecimento (caches, mapas da pré-visualização)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        number *= 2
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - start) / number * 1e6)
+    return {"us": statistics.median(runs), "min_us": min(runs), "calls": number * repeat}
+
+
+# ==================== BENCHMARKS ====================
+
+def primitive_benchmarks(frame_rgb):
+    screen = game.screen
+    cloud = game.Cloud(400, 150, 0.2, 1.0)
+    pipe = game.Pipe(500)
+    rect = (350, 295, 500, 360)
+
+    def text_outline_uncached():
+        game.text_cache.clear()
+        game.draw_text_with_outline("FLAPPY ARMS", game.font_title, game.WHITE, game.ORANGE,
+                                    600, 300, center=True)
+
+    return {
+        "draw_rounded_rect": lambda: game.draw_rounded_rect(
+            screen, game.LIGHT_BLUE, rect, 25, 5, game.WHITE),
+        "draw_rounded_rect_border": lambda: game.draw_rounded_rect_border(
+            screen, game.WHITE, rect, 25, 5),
+        "draw_star": lambda: game.draw_star(screen, (255, 255, 200), 150, 80, 10),
+        "star_atlas": lambda: game.blit_star(screen, (255, 255, 200), 150, 80, 10),
+        "cloud_draw": lambda: cloud.draw(screen),
+        "pipe_draw": lambda: pipe.draw(screen),
+        "menu_panel_atlas": lambda: game.blit_shape(screen, "menu_panel", game.draw_menu_panel, rect),
+        "text_outline_cached": lambda: game.draw_text_with_outline(
+            "FLAPPY ARMS", game.font_title, game.WHITE, game.ORANGE, 600, 300, center=True),
+        "text_outline_uncached": text_outline_uncached,
+        "sky_gradient_loop": lambda: game.draw_sky_gradient(screen, game.SKY_THEME),
+        "background_cached": lambda: game.draw_background(screen),
+        "camera_feed_menu": lambda: game.draw_camera_feed(frame_rgb, 375, 365, 450, 250),
+        "camera_feed_corner": lambda: game.draw_camera_feed(
+            frame_rgb, 250, 10, 140, 105, rounded=False),
+    }
+
+
+def frame_benchmarks(frame_rgb):
+    detector = types.SimpleNamespace(calibrated=True, arms_raised=True)
+    menu_clouds = [game.Cloud(100, 100, 0.3, 1.2), game.Cloud(400, 150, 0.2, 0.8),
+                   game.Cloud(700, 80, 0.25, 1.0), game.Cloud(200, 300, 0.15, 1.1),
+                   game.Cloud(800, 250, 0.35, 0.9)]
+    play_clouds = [game.Cloud(200 * i, 60 + 40 * i, 0.3, 1.0) for i in range(5)]
+    engine = GameEngine(bird_factory=game.Bird, pipe_factory=game.Pipe)
+
+    def play_frame():
+        engine.step()
+        if engine.game_over:
+            engine.reset()
+        if engine.tick % 20 == 0:
+            engine.flap()
+        game.draw_play_frame(engine, 0.5, play_clouds, frame_rgb, True)
+
+    def menu_frame():
+        game.move_clouds(menu_clouds)
+        game.draw_menu_frame(detector, frame_rgb, menu_clouds, False)
+
+    def game_over_frame():
+        game.move_clouds(menu_clouds[:3])
+        game.draw_game_over_frame(12, 30, menu_clouds[:3])
+
+    return {
+        "frame_menu": menu_frame,
+        "frame_play": play_frame,
+        "frame_game_over": game_over_frame,
+    }
+
+
+def pose_benchmarks(clip):
+    """Passo de pose sobre um clipe gravado ou sintético (exige MediaPipe)"""
+    try:
+        from pose_detector import PoseDetector
+        source = open_source(clip, realtime=False, loop=True) if clip else \
+            SyntheticSource(realtime=False, loop=True)
+        detector = PoseDetector(source)
+    except Exception as exc:
+        print(f"pose: ignorado ({exc})")
+        return {}
+    detector.calibrated = True
+    return {"pose_step": lambda: detector.detect_arms_raised()}
+
+
+# ==================== EXECUÇÃO ====================
+
+def run(names_filter, clip, min_time):
+    game.init_display()
+    frame_rgb = np.ascontiguousarray(SyntheticSource().render(0)[:, :, ::-1])
+    benchmarks = {}
+    benchmarks.update(primitive_benchmarks(frame_rgb))
+    benchmarks.update(frame_benchmarks(frame_rgb))
+    if not names_filter or any(f in "pose_step" for f in names_filter):
+        benchmarks.update(pose_benchmarks(clip))
+
+    results = {}
+    for name, fn in benchmarks.items():
+        if names_filter and not any(f in name for f in names_filter):
+            continue
+        results[name] = measure(fn, min_time)
+        print(f"{name:<26} {results[name]['us']:>10.1f} µs")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Lista de (nome, antes, depois, razão) dos benchmarks que pioraram além do limite"""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        ratio = result["us"] / old["us"]
+        marker = "  <-- regressão" if ratio > 1 + threshold else ""
+        print(f"{name:<26} {old['us']:>10.1f} -> {result['us']:>10.1f} µs ({ratio:5.2f}x){marker}")
+        if marker:
+            regressions.append((name, old["us"], result["us"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", help="arquivo JSON para salvar os resultados")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="piora relativa tolerada antes de falhar (padrão: 0.15)")
+    parser.add_argument("--filter", nargs="+", help="roda só benchmarks cujo nome contém o texto")
+    parser.add_argument("--clip", help="vídeo ou diretório de frames para o passo de pose")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="tempo mínimo (s) medido por benchmark")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.clip, args.min_time)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) acima do limite de {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Custo da telemetria por tick e vazão da leitura mapeada em memória.
+
+Escrita: joga a mesma partida (semente fixa, piloto automático) sem e com o
+``TelemetryWriter`` ligado ao ``on_tick`` e mede o custo extra por tick,
+além dos percentis de cada ``record`` (o que o frame pode sentir: a gravação
+em disco fica na thread). Leitura: grava ``--sessions`` sessões num
+diretório temporário e mede registros/s e MB/s para mapear todas e
+calcular algumas estatísticas por sessão.
+
+Uso: python benchmarks/bench_telemetry.py [--ticks 200000] [--sessions 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from game_core import GameEngine  # noqa: E402
+from telemetry import RECORD, TelemetryWriter, iter_telemetry  # noqa: E402
+
+LANDMARKS = ((0.6, 0.5), (0.4, 0.5), (0.65, 0.7), (0.35, 0.7))
+
+
+def autopilot(engine):
+    """Flap quando o pássaro desce abaixo do vão do próximo cano"""
+    bird = engine.bird
+    for pipe in engine.pipes:
+        if pipe.x + pipe.width > bird.left:
+            return bird.y >= pipe.gap_y + 145 and bird.velocity >= 0
+    return bird.y >= 500 and bird.velocity >= 0
+
+
+def play(engine, ticks, seed):
+    """``ticks`` ticks com o piloto (recomeçando a cada game over); retorna os segundos"""
+    engine.rng.seed(seed)
+    engine.reset()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if engine.game_over:
+            engine.reset()
+        if autopilot(engine):
+            engine.flap()
+        engine.advance(engine.dt)
+    return time.perf_counter() - start
+
+
+def bench_write(ticks, directory):
+    engine = GameEngine(rng=random.Random())
+    base = play(engine, ticks, 1)
+
+    writer = TelemetryWriter(os.path.join(directory, "write.tlm"))
+    engine.on_tick = lambda engine: writer.record(engine, LANDMARKS)
+    with_telemetry = play(engine, ticks, 1)
+
+    # Cada record isolado (inclui a troca de buffer quando enche)
+    calls = np.empty(ticks)
+    clock = time.perf_counter
+    for i in range(ticks):
+        start = clock()
+        writer.record(engine, LANDMARKS)
+        calls[i] = clock() - start
+    writer.close()
+
+    calls *= 1e6
+    print(f"escrita: {ticks} ticks, {(with_telemetry - base) / ticks * 1e6:.2f} µs extras por "
+          f"tick ({base / ticks * 1e6:.2f} -> {with_telemetry / ticks * 1e6:.2f} µs)")
+    print(f"record: p50 {np.percentile(calls, 50):.2f} µs, p99 {np.percentile(calls, 99):.2f} "
+          f"µs, p99.9 {np.percentile(calls, 99.9):.2f} µs, máx {calls.max():.1f} µs; "
+          f"buffers extras: {writer.overflows}")
+
+
+def bench_read(sessions, ticks_per_session, directory):
+    engine = GameEngine(rng=random.Random())
+    engine.rng.seed(2)
+    for index in range(sessions):
+        writer = TelemetryWriter(os.path.join(directory, f"session-{index:05d}.tlm"))
+        writer.new_round()
+        engine.reset()
+        for _ in range(ticks_per_session):
+            if engine.game_over:
+                engine.reset()
+                writer.new_round()
+            engine.flap() if autopilot(engine) else None
+            engine.step()
+            writer.record(engine, LANDMARKS)
+        writer.close()
+
+    start = time.perf_counter()
+    records = flaps = 0
+    heights = []
+    for _, log in iter_telemetry(directory):
+        records += len(log)
+        flaps += int(log["flap"].sum())
+        heights.append(float(log["bird_y"].mean()))
+    elapsed = time.perf_counter() - start
+
+    megabytes = records * RECORD.size / 1e6
+    print(f"leitura: {sessions} sessões, {records} registros ({megabytes:.1f} MB) em "
+          f"{elapsed * 1000:.0f} ms: {records / elapsed / 1e6:.1f} M registros/s, "
+          f"{megabytes / elapsed:.0f} MB/s ({flaps} flaps, y médio {np.mean(heights):.0f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=200_000, help="ticks medidos na escrita")
+    parser.add_argument("--sessions", type=int, default=1000, help="sessões lidas")
+    parser.add_argument("--session-ticks", type=int, default=3600,
+                        help="ticks por sessão (3600 = um minuto a 60 Hz)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        bench_write(args.ticks, directory)
+        os.remove(os.path.join(directory, "write.tlm"))
+        bench_read(args.sessions, args.session_ticks, directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Captura da webcam em uma thread que mantém só o frame mais recente.
+
+O ``cv2.VideoCapture`` guarda vários frames no buffer do driver; lendo uma
+vez por tick o jogo acaba processando frames com 100+ ms de atraso. Aqui uma
+thread drena o dispositivo continuamente e guarda apenas o último frame e o
+instante em que foi capturado.
+"""
+
+import threading
+import time
+
+import cv2
+
+# Formatos tentados, em ordem, quando o preferido não é aceito
+FOURCC_FALLBACKS = ("MJPG", "YUYV")
+
+
+def _fourcc_to_str(value):
+    value = int(value)
+    return "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+
+class Camera:
+    """Webcam com negociação de formato e leitura do frame mais recente"""
+
+    def __init__(self, index=0, width=640, height=480, fps=30, fourcc="MJPG"):
+        self.cap = cv2.VideoCapture(index)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        if self.cap.isOpened():
+            self._negotiate(width, height, fps, fourcc)
+
+        self._lock = threading.Lock()
+        self._new_frame = threading.Condition(self._lock)
+        self._frame = None
+        self._timestamp = None
+        self._frame_id = 0
+        self._running = True
+        # Pausada: a thread para de ler (e decodificar) frames, mas o dispositivo fica aberto
+        self._paused = False
+        self._thread = threading.Thread(target=self._run, name="camera", daemon=True)
+        self._thread.start()
+
+    def _negotiate(self, width, height, fps, fourcc):
+        """Configura formato, resolução e FPS e lê de volta o que o driver aceitou"""
+        # Um buffer mínimo reduz a latência nos backends que respeitam a opção
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        for candidate in (fourcc,) + tuple(f for f in FOURCC_FALLBACKS if f != fourcc):
+            if self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*candidate)):
+                break
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or width
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or fps
+        self.fourcc = _fourcc_to_str(self.cap.get(cv2.CAP_PROP_FOURCC)) or fourcc
+
+    def _run(self):
+        """Drena o dispositivo continuamente, guardando só o último frame"""
+        while self._running:
+            with self._lock:
+                self._new_frame.wait_for(lambda: not self._paused or not self._running)
+            ret, frame = self.cap.read()
+            if not ret:
+                time.sleep(0.005)
+                continue
+            timestamp = time.monotonic()
+            with self._lock:
+                self._frame = frame
+                self._timestamp = timestamp
+                self._frame_id += 1
+                self._new_frame.notify_all()
+
+    def read(self):
+        """Retorna (frame, timestamp, frame_id) mais recentes, sem bloquear"""
+        with self._lock:
+            return self._frame, self._timestamp, self._frame_id
+
+    def wait_new(self, last_id, timeout=0.1):
+        """Espera um frame mais novo que ``last_id`` (usado fora do loop de renderização)"""
+        with self._lock:
+            self._new_frame.wait_for(lambda: self._frame_id != last_id or not self._running,
+                                     timeout)
+            return self._frame, self._timestamp, self._frame_id
+
+    def pause(self):
+        """Para a captura (telas sem câmera); ``resume`` volta sem reabrir o dispositivo"""
+        with self._lock:
+            self._paused = True
+
+    def resume(self):
+        with self._lock:
+            self._paused = False
+            self._new_frame.notify_all()
+
+    def release(self):
+        with self._lock:
+            self._running = False
+            self._new_frame.notify_all()
+        self._thread.join(timeout=1)
+        self.cap.release()
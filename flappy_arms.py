@@ -1,23 +1,40 @@
+import time
+
+# Início do processo, para medir o tempo até o primeiro frame
+STARTUP_TIME = time.perf_counter()
+
 import pygame
-import cv2
-import mediapipe as mp
+import argparse
 import random
 import sys
+import threading
 
-# Inicializar Pygame
-pygame.init()
+import game_core
+from frame_scheduler import FrameScheduler
+from game_core import (SCREEN_WIDTH, SCREEN_HEIGHT, PIPE_GAP, BIRD_SIZE, GameEngine,
+                       MultiGameEngine)
+from latency_trace import LatencyTracer
+from leaderboard import ScoreStore, default_path
+from replay import Ghost, ReplayInput, Run, new_seed
+from profiler import profiler
+from render_cache import LayerCache, SpriteAtlas, TextCache
+from render_scale import RenderView
+from spectator import SpectatorServer, parse_address
+from telemetry import TelemetryWriter, session_path
 
-try:
-    logo_image = pygame.image.load("bird_logo.png")
-    logo_image = pygame.transform.scale(logo_image, (200, 200))
-except:
-    logo_image = None
-
-# Configurações da tela
-SCREEN_WIDTH = 1200
-SCREEN_HEIGHT = 800
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Flappy Arms - Gym Edition")
+# Tela, imagens, relógio e fontes são criados em init_display() (sem efeitos no import)
+# ``screen`` é onde as telas desenham: a janela ou, nas telas de jogo, a superfície
+# reduzida de ``view`` (veja use_view)
+screen = None
+window = None
+view = None
+# Escala de ``screen`` em relação ao tamanho lógico (SCREEN_WIDTH x SCREEN_HEIGHT)
+draw_scale = 1.0
+logo_image = None
+bird_image = None
+clock = None
+frame_scheduler = None
+font_small = font_large = font_medium = font_title = font_overlay = None
 
 # Cores
 WHITE = (255, 255, 255)
@@ -33,30 +50,209 @@ ORANGE = (255, 165, 0)
 GRAY = (200, 200, 200)
 DARK_GRAY = (100, 100, 100)
 
-# Configurações do jogo
-GRAVITY = 0.5
-FLAP_STRENGTH = -10
-PIPE_WIDTH = 70
-PIPE_GAP = 200
-PIPE_SPEED = 3
-BIRD_SIZE = 90
-
-# Carregar imagem do pássaro
-try:
-    _bird_img = pygame.image.load("bird.png").convert_alpha()
-    bird_image = pygame.transform.scale(_bird_img, (BIRD_SIZE, BIRD_SIZE))
-except Exception:
-    bird_image = None
+# Cor de cada jogador no multijogador (pássaro e placar)
+PLAYER_COLORS = [YELLOW, (255, 105, 180), (0, 200, 255), (160, 255, 90)]
+MAX_PLAYERS = len(PLAYER_COLORS)
+# Opacidade do pássaro fantasma (melhor partida gravada)
+GHOST_ALPHA = 110
 
 # FPS
-clock = pygame.time.Clock()
 FPS = 60
+# FPS das telas de menu e game over (ativas; ociosas caem para a taxa do scheduler)
+MENU_FPS = 30
+# Acima disto, redesenhar região por região custa mais que o frame inteiro
+MAX_DIRTY_RECTS = 16
+# Eventos que contam como entrada (acordam a tela ociosa)
+WAKE_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+
+# Camadas estáticas (gradiente do céu) renderizadas uma única vez
+layer_cache = LayerCache()
+SKY_THEME = (BLUE, LIGHT_BLUE)
+
+# Formas estáticas (nuvens, estrelas, canos, botões, painéis) com alfa por pixel
+sprite_atlas = SpriteAtlas()
+# Folga em volta dos painéis no atlas (sombras e molduras passam do retângulo)
+SHAPE_MARGIN = 10
+# Tamanhos de estrela pré-renderizados para o brilho do menu
+STAR_TWINKLE_SIZES = (8, 9, 10, 11)
+
+# Buffers e Surfaces reutilizados pela pré-visualização da câmera (criada no primeiro frame)
+camera_preview = None
+
+# Imagem do pássaro tingida com a cor de cada jogador (criada na primeira rodada)
+player_bird_images = {}
+
+# Imagens reduzidas para a escala de renderização, por (id da imagem, escala), e fontes por tamanho
+scaled_images = {}
+scaled_fonts = {}
+# Fonte -> tamanho com que foi criada (para recriá-la em outra escala)
+font_sizes = {}
+
+# Posições das estrelas decorativas do menu
+MENU_STAR_POSITIONS = [
+    (150, 80), (950, 120), (300, 450), (1000, 400), (500, 150),
+    (200, 200), (800, 180), (400, 350), (900, 320)
+]
+
+# Pré-visualização da câmera no painel do menu (x, y, largura, altura)
+MENU_CAMERA_RECT = ((SCREEN_WIDTH - 450) // 2, 295 + 70, 450, 250)
+
+# HUD das telas de jogo, no layout lógico (px() converte para a escala de desenho)
+# Caixa do placar (x, y, largura, altura), recuo do texto e passo entre jogadores
+SCORE_BOX_RECT = (5, 5, 200, 60)
+SCORE_TEXT_INSET = 10
+SCORE_BOX_STEP = 210
+# Pré-visualização da câmera: ao lado do placar (solo) ou no canto direito (multijogador)
+PLAY_CAMERA_SIZE = (140, 105)
+PLAY_CAMERA_POS = (250, 10)
+MULTI_CAMERA_POS = (SCREEN_WIDTH - PLAY_CAMERA_SIZE[0] - 10, 10)
+# Indicador "ARMS UP!", centralizado embaixo
+ARMS_INDICATOR_SIZE = (250, 50)
+ARMS_INDICATOR_RECT = ((SCREEN_WIDTH - ARMS_INDICATOR_SIZE[0]) // 2, SCREEN_HEIGHT - 60,
+                       *ARMS_INDICATOR_SIZE)
+# Rótulo do jogador acima do pássaro e legenda do replay (distâncias verticais)
+PLAYER_LABEL_GAP = 15
+CAPTION_Y = SCREEN_HEIGHT - 30
+
+# Detector com captura pausada (telas sem câmera), retomado na próxima entrada
+camera_pause = {"detector": None}
+
+# Surface do overlay de desempenho (F3) e quando foi atualizada
+_overlay = {"surface": None, "updated": 0}
+
+# Superfícies de texto renderizadas (em regime, nenhum font.render por frame)
+text_cache = TextCache()
+
+# Marcos da inicialização (perf_counter): primeiro frame e detector pronto
+startup = {"first_frame": None, "ready": None, "reported": False}
+
+# ==================== INICIALIZAÇÃO ====================
+
+def init_display(idle_after=15.0, partial=True, render_scale=1.0, dynamic_scale=False):
+    """Abre a janela e carrega imagens, fontes e o agendador de frames.
+
+    ``render_scale`` < 1 desenha as telas de jogo numa superfície menor,
+    ampliada para a janela a cada frame; ``dynamic_scale`` reduz a escala
+    sozinho quando o frame passa do orçamento.
+    """
+    global screen, window, view, logo_image, bird_image, clock, frame_scheduler
+    global font_small, font_large, font_medium, font_title, font_overlay
+    
+    # Inicializar Pygame
+    pygame.init()
+    
+    # Configurações da tela (tamanho e física do jogo vêm do game_core)
+    screen = window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Flappy Arms - Gym Edition")
+    view = RenderView(window, render_scale, dynamic_scale, budget_ms=1000 / FPS)
+    
+    try:
+        logo_image = pygame.image.load("bird_logo.png")
+        logo_image = pygame.transform.scale(logo_image, (200, 200))
+    except:
+        logo_image = None
+    
+    # Carregar imagem do pássaro
+    try:
+        _bird_img = pygame.image.load("bird.png").convert_alpha()
+        bird_image = pygame.transform.scale(_bird_img, (BIRD_SIZE, BIRD_SIZE))
+    except Exception:
+        bird_image = None
+    
+    clock = pygame.time.Clock()
+    frame_scheduler = FrameScheduler(clock, idle_after=idle_after, partial=partial)
+    
+    # Fontes
+    font_small = pygame.font.Font(None, 36)
+    font_large = pygame.font.Font(None, 72)
+    font_medium = pygame.font.Font(None, 48)
+    font_title = pygame.font.Font(None, 90)
+    font_overlay = pygame.font.Font(None, 24)
+    for font, size in ((font_small, 36), (font_large, 72), (font_medium, 48), (font_title, 90)):
+        font_sizes[font] = size
+
+# ==================== ESCALA DE RENDERIZAÇÃO ====================
+
+def use_view(active):
+    """Desenha na superfície reduzida de ``view`` (telas de jogo) ou direto na janela"""
+    global screen, draw_scale
+    screen = view.surface if active else window
+    draw_scale = view.scale if active else 1.0
 
-# Fontes
-font_small = pygame.font.Font(None, 36)
-font_large = pygame.font.Font(None, 72)
-font_medium = pygame.font.Font(None, 48)
-font_title = pygame.font.Font(None, 90)
+def px(value):
+    """Coordenada lógica (tela de SCREEN_WIDTH x SCREEN_HEIGHT) -> pixel de ``screen``"""
+    return int(value * draw_scale)
+
+def px_rect(rect):
+    """Retângulo lógico (x, y, largura, altura) -> pixels de ``screen``"""
+    x, y, width, height = rect
+    return px(x), px(y), px(width), px(height)
+
+def scaled_image(image):
+    """``image`` reduzida para a escala de desenho (criada uma vez por escala)"""
+    if draw_scale == 1.0:
+        return image
+    key = (id(image), draw_scale)
+    scaled = scaled_images.get(key)
+    if scaled is None:
+        width, height = image.get_size()
+        scaled = pygame.transform.smoothscale(image, (max(px(width), 1), max(px(height), 1)))
+        scaled_images[key] = scaled
+    return scaled
+
+def view_font(font):
+    """``font`` no tamanho da escala de desenho (criada uma vez por escala)"""
+    if draw_scale == 1.0:
+        return font
+    size = max(px(font_sizes[font]), 8)
+    scaled = scaled_fonts.get(size)
+    if scaled is None:
+        scaled = pygame.font.Font(None, size)
+        scaled_fonts[size] = scaled
+    return scaled
+
+class DetectorLoader:
+    """Cria o detector de pose e aquece câmera e modelo em uma thread.
+
+    O menu já é desenhado enquanto isso; ``detector`` fica None até tudo
+    estar pronto (ou ``error`` guarda a exceção da criação).
+    """
+    
+    def __init__(self, inference, **options):
+        self.detector = None
+        self.error = None
+        self._pending = None
+        self._thread = threading.Thread(target=self._load, args=(inference,), kwargs=options,
+                                        daemon=True)
+    
+    def start(self):
+        self._thread.start()
+    
+    def _load(self, inference, **options):
+        try:
+            detector = create_pose_detector(inference, **options)
+            self._pending = detector
+            if not detector.warm_up(timeout=10.0):
+                print("Aviso: a fonte de vídeo não entregou frames no aquecimento")
+            startup["ready"] = time.perf_counter()
+            self.detector = detector
+        except Exception as exc:
+            self.error = exc
+    
+    def release(self):
+        """Libera o detector (espera a thread terminar, se ainda carregando)"""
+        self._thread.join(timeout=10.0)
+        if self._pending is not None:
+            self._pending.release()
+            self._pending = None
+
+def report_startup():
+    """Imprime, uma vez, o tempo até o primeiro frame e até o detector ficar pronto"""
+    if startup["reported"] or startup["first_frame"] is None or startup["ready"] is None:
+        return
+    startup["reported"] = True
+    print(f"Inicialização: primeiro frame em {(startup['first_frame'] - STARTUP_TIME) * 1000:.0f} ms, "
+          f"câmera e modelo prontos em {(startup['ready'] - STARTUP_TIME) * 1000:.0f} ms")
 
 # ==================== CLASSES NOVAS ====================
 
@@ -68,181 +264,119 @@ class Cloud:
         self.speed = speed
         self.size = size
         
-    def update(self):
-        self.x += self.speed
+    def update(self, steps=1):
+        # ``steps`` frames de uma vez (telas ociosas rodam a uma taxa menor)
+        self.x += self.speed * steps
         if self.x > SCREEN_WIDTH + 100:
             self.x = -100
+    
+    def _sprite(self):
+        """(tamanho base, tamanho da superfície, origem) do sprite no atlas"""
+        base_size = px(40 * self.size)
+        size = (int(base_size * 3.8) + 4, int(base_size * 2.2) + 4)
+        origin = (base_size + 2, int(base_size * 1.2) + 2)
+        return base_size, size, origin
+    
+    def rect(self):
+        """Retângulo da tela que a nuvem cobre (região suja quando ela anda)"""
+        _, size, origin = self._sprite()
+        return pygame.Rect(px(self.x) - origin[0], px(self.y) - origin[1], *size)
             
-    def draw(self, screen):
-        # Desenhar nuvem com múltiplos círculos
-        base_size = int(40 * self.size)
+    @staticmethod
+    def paint(surface, base_size):
+        """Desenha a nuvem (múltiplos círculos) com o centro do primeiro em (base, 1,2 base)"""
         color = WHITE
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), base_size)
-        pygame.draw.circle(screen, color, (int(self.x + base_size), int(self.y)), int(base_size * 0.8))
-        pygame.draw.circle(screen, color, (int(self.x + base_size * 1.8), int(self.y)), base_size)
-        pygame.draw.circle(screen, color, (int(self.x + base_size * 0.5), int(self.y - base_size * 0.5)), int(base_size * 0.7))
-        pygame.draw.circle(screen, color, (int(self.x + base_size * 1.3), int(self.y - base_size * 0.5)), int(base_size * 0.7))
+        x, y = base_size + 2, int(base_size * 1.2) + 2
+        pygame.draw.circle(surface, color, (x, y), base_size)
+        pygame.draw.circle(surface, color, (int(x + base_size), y), int(base_size * 0.8))
+        pygame.draw.circle(surface, color, (int(x + base_size * 1.8), y), base_size)
+        pygame.draw.circle(surface, color, (int(x + base_size * 0.5), int(y - base_size * 0.5)), int(base_size * 0.7))
+        pygame.draw.circle(surface, color, (int(x + base_size * 1.3), int(y - base_size * 0.5)), int(base_size * 0.7))
+            
+    def draw(self, screen):
+        # Nuvem pré-renderizada no atlas, uma por tamanho
+        base_size, size, origin = self._sprite()
+        sprite_atlas.blit(screen, (px(self.x), px(self.y)), "cloud", base_size, size,
+                          Cloud.paint, origin)
 
 # ==================== CLASSES ORIGINAIS ====================
 
-class Bird:
+class Bird(game_core.Bird):
     def __init__(self):
-        self.x = 100
-        self.y = SCREEN_HEIGHT // 2
-        self.velocity = 0
-        self.size = BIRD_SIZE
+        super().__init__()
         self.image = bird_image
-        
-    def flap(self):
-        self.velocity = FLAP_STRENGTH
-        
-    def update(self):
-        self.velocity += GRAVITY
-        self.y += self.velocity
-        
-        # Limites da tela
-        if self.y < 0:
-            self.y = 0
-            self.velocity = 0
-        if self.y > SCREEN_HEIGHT - self.size:
-            self.y = SCREEN_HEIGHT - self.size
-            self.velocity = 0
+        self.color = YELLOW
             
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        # Posição interpolada entre os dois últimos ticks da simulação
+        y = self.interpolated_y(alpha)
         if self.image is not None:
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.image, rect)
+            image = scaled_image(self.image)
+            screen.blit(image, image.get_rect(center=(px(self.x), px(y))))
         else:
             # Fallback: desenho do pássaro (círculo amarelo com olho e bico)
-            pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), self.size // 2)
-            pygame.draw.circle(screen, BLACK, (int(self.x + 10), int(self.y - 5)), 5)
+            pygame.draw.circle(screen, self.color, (px(self.x), px(y)), px(self.size // 2))
+            pygame.draw.circle(screen, BLACK, (px(self.x + 10), px(y - 5)), max(px(5), 1))
             pygame.draw.polygon(screen, RED, [
-                (self.x + self.size // 2, self.y),
-                (self.x + self.size // 2 + 15, self.y - 5),
-                (self.x + self.size // 2 + 15, self.y + 5)
+                (px(self.x + self.size // 2), px(y)),
+                (px(self.x + self.size // 2 + 15), px(y - 5)),
+                (px(self.x + self.size // 2 + 15), px(y + 5))
             ])
         
     def get_rect(self):
-        return pygame.Rect(self.x - self.size // 2, self.y - self.size // 2, self.size, self.size)
+        return pygame.Rect(*self.bounds()[:2], self.size, self.size)
 
-class Pipe:
-    def __init__(self, x):
-        self.x = x
-        self.gap_y = random.randint(150, SCREEN_HEIGHT - PIPE_GAP - 150)
-        self.width = PIPE_WIDTH
-        self.scored = False
-        
-    def update(self):
-        self.x -= PIPE_SPEED
-        
-    def draw(self, screen):
-        # Cano superior
-        pygame.draw.rect(screen, GREEN, (self.x, 0, self.width, self.gap_y))
-        pygame.draw.rect(screen, (0, 100, 0), (self.x, 0, self.width, self.gap_y), 3)
-        
-        # Cano inferior
-        pygame.draw.rect(screen, GREEN, (self.x, self.gap_y + PIPE_GAP, self.width, SCREEN_HEIGHT))
-        pygame.draw.rect(screen, (0, 100, 0), (self.x, self.gap_y + PIPE_GAP, self.width, SCREEN_HEIGHT), 3)
-        
-    def collides_with(self, bird):
-        bird_rect = bird.get_rect()
-        
-        # Cano superior
-        top_pipe = pygame.Rect(self.x, 0, self.width, self.gap_y)
-        # Cano inferior
-        bottom_pipe = pygame.Rect(self.x, self.gap_y + PIPE_GAP, self.width, SCREEN_HEIGHT)
-        
-        return bird_rect.colliderect(top_pipe) or bird_rect.colliderect(bottom_pipe)
+class GhostBird(Bird):
+    """Pássaro da melhor partida gravada, translúcido"""
     
-    def is_off_screen(self):
-        return self.x < -self.width
-
-class PoseDetector:
     def __init__(self):
-        self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.cap = cv2.VideoCapture(0)
-        self.baseline_shoulder_y = None
-        self.calibrated = False
-        self.arms_raised = False
-        self.last_raised = False
-        
-    def calibrate(self):
-        """Calibra a posição inicial dos ombros"""
-        ret, frame = self.cap.read()
-        if ret:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.pose.process(frame_rgb)
-            
-            if results.pose_landmarks:
-                # Pegar posição Y dos ombros
-                left_shoulder = results.pose_landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-                right_shoulder = results.pose_landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-                
-                self.baseline_shoulder_y = (left_shoulder.y + right_shoulder.y) / 2
-                self.calibrated = True
-                return True
-        return False
-    
-    def detect_arms_raised(self):
-        """Detecta se os braços estão levantados"""
-        ret, frame = self.cap.read()
-        if not ret:
-            return False, None
-            
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.pose.process(frame_rgb)
+        super().__init__()
+        self.image = ghost_image()
+    
+    def draw(self, screen, alpha=1.0):
+        y = self.interpolated_y(alpha)
+        image = scaled_image(self.image)
+        screen.blit(image, image.get_rect(center=(px(self.x), px(y))))
+
+class Pipe(game_core.Pipe):
+    __slots__ = ()
+    
+    @staticmethod
+    def paint(surface, size):
+        """Coluna de cano da altura da tela, com borda nos quatro lados"""
+        width, height = size
+        pygame.draw.rect(surface, GREEN, (0, 0, width, height))
+        pygame.draw.rect(surface, (0, 100, 0), (0, 0, width, height), 3)
+    
+    def draw(self, screen, alpha=1.0):
+        x = px(self.interpolated_x(alpha))
+        # Coluna na escala de desenho (uma por escala no atlas)
+        size = width, height = px(self.width), px(SCREEN_HEIGHT)
+        page, area, _ = sprite_atlas.get("pipe", size, size, Pipe.paint)
+        left, top = area.topleft
         
-        if results.pose_landmarks and self.calibrated:
-            # Pegar posição dos pulsos e ombros
-            left_wrist = results.pose_landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_WRIST]
-            right_wrist = results.pose_landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_WRIST]
-            left_shoulder = results.pose_landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-            right_shoulder = results.pose_landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-            
-            # Verificar se os pulsos estão acima dos ombros
-            left_raised = left_wrist.y < left_shoulder.y - 0.1
-            right_raised = right_wrist.y < right_shoulder.y - 0.1
-            
-            # Detectar apenas a transição de não-levantado para levantado
-            currently_raised = left_raised or right_raised
-            flap_triggered = currently_raised and not self.last_raised
-            
-            self.last_raised = currently_raised
-            self.arms_raised = currently_raised
-            
-            return flap_triggered, cv2.flip(frame, 1)
+        # Cano superior: topo da coluna mais a borda de baixo
+        body = max(px(self.gap_y) - 3, 0)
+        screen.blit(page, (x, 0), (left, top, width, body))
+        screen.blit(page, (x, body), (left, top + height - 3, width, 3))
         
-        return False, cv2.flip(frame, 1) if ret else None
-    
-    def release(self):
-        self.cap.release()
+        # Cano inferior (a borda de baixo fica fora da tela, como antes)
+        bottom_y = px(self.gap_y + PIPE_GAP)
+        screen.blit(page, (x, bottom_y), (left, top, width, height - bottom_y))
 
 # ==================== FUNÇÕES NOVAS ====================
 
 def draw_text_with_outline(text, font, color, outline_color, x, y, center=False):
     """Desenha texto com contorno"""
-    # Desenhar contorno
-    for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-        text_surface = font.render(text, True, outline_color)
+    with profiler.stage("text"):
+        text_surface = text_cache.get(text, font, color, outline_color)
         text_rect = text_surface.get_rect()
         if center:
-            text_rect.center = (x + dx, y + dy)
+            text_rect.center = (x, y)
         else:
-            text_rect.topleft = (x + dx, y + dy)
+            pad = TextCache.OUTLINE_WIDTH
+            text_rect.topleft = (x - pad, y - pad)
         screen.blit(text_surface, text_rect)
-    
-    # Desenhar texto principal
-    text_surface = font.render(text, True, color)
-    text_rect = text_surface.get_rect()
-    if center:
-        text_rect.center = (x, y)
-    else:
-        text_rect.topleft = (x, y)
-    screen.blit(text_surface, text_rect)
 
 def draw_rounded_rect(surface, color, rect, radius=20, border=0, border_color=None):
     """Desenha retângulo com bordas arredondadas"""
@@ -285,17 +419,32 @@ def draw_button(text, x, y, width, height, color, hover_color, text_color=WHITE)
     
     button_color = hover_color if is_hover else color
     
-    # Sombra
-    draw_rounded_rect(screen, (0, 0, 0, 100), (x + 5, y + 5, width, height), 15)
-    
-    # Botão
-    draw_rounded_rect(screen, button_color, (x, y, width, height), 15, 4, (255, 255, 255))
+    # Sombra e botão (forma do atlas, uma por cor)
+    blit_shape(screen, "button", draw_button_shape, (x, y, width, height), button_color)
     
     # Texto
     draw_text(text, font_medium, text_color, x + width // 2, y + height // 2, center=True)
     
     return is_hover
 
+def draw_button_shape(surface, params):
+    """Sombra translúcida e corpo do botão (forma do atlas)"""
+    (x, y, width, height), color = params
+    draw_rounded_rect(surface, (0, 0, 0, 100), (x + 5, y + 5, width, height), 15)
+    draw_rounded_rect(surface, color, (x, y, width, height), 15, 4, (255, 255, 255))
+
+def blit_shape(surface, name, painter, rect, style=None):
+    """Blita uma forma estática (painel, moldura, botão) do atlas em ``rect``.
+
+    O painter recebe o retângulo deslocado para dentro da folga SHAPE_MARGIN
+    (e ``style``, se houver); a forma é renderizada uma vez por tamanho.
+    """
+    x, y, width, height = rect
+    local = (SHAPE_MARGIN, SHAPE_MARGIN, width, height)
+    params = local if style is None else (local, style)
+    size = (width + 2 * SHAPE_MARGIN, height + 2 * SHAPE_MARGIN)
+    sprite_atlas.blit(surface, (x, y), name, params, size, painter, (SHAPE_MARGIN, SHAPE_MARGIN))
+
 def draw_star(surface, color, x, y, size):
     """Desenha uma estrela decorativa"""
     points = []
@@ -309,40 +458,459 @@ def draw_star(surface, color, x, y, size):
                       y + r * pygame.math.Vector2(1, 0).rotate_rad(angle).y))
     pygame.draw.polygon(surface, color, points)
 
+def snap_star_size(size):
+    """Tamanho pré-renderizado mais próximo de ``size``"""
+    return min(STAR_TWINKLE_SIZES, key=lambda s: abs(s - size))
+
+def menu_star_sizes():
+    """Tamanho de cada estrela do menu neste instante (brilho alternado)"""
+    alpha = abs(pygame.time.get_ticks() % 2000 - 1000) / 1000
+    return [snap_star_size(8 + 3 * alpha if i % 2 == 0 else 8 + 3 * (1 - alpha))
+            for i in range(len(MENU_STAR_POSITIONS))]
+
+def blit_star(surface, color, x, y, size):
+    """Estrela do atlas, no tamanho pré-renderizado mais próximo de ``size``"""
+    size = snap_star_size(size)
+    center = size + 1
+    sprite_atlas.blit(surface, (x, y), "star", (color, size), (2 * center, 2 * center),
+                      lambda star, params: draw_star(star, color, center, center, size),
+                      (center, center))
+
+def draw_sky_gradient(surface, theme):
+    """Desenha o gradiente do céu (usado só ao montar o cache de camadas)"""
+    top, bottom = theme
+    width, height = surface.get_size()
+    for i in range(height):
+        color_value = top[0] + (bottom[0] - top[0]) * i // height
+        pygame.draw.line(surface, (color_value, color_value + 30, 235), (0, i), (width, i))
+
+def draw_background(surface):
+    """Desenha o fundo a partir do cache (uma camada para a janela, outra para a vista reduzida)"""
+    with profiler.stage("background"):
+        layer_cache.blit(surface, "sky" if surface is window else "sky_view", draw_sky_gradient,
+                         SKY_THEME, opaque=True)
+
+def draw_menu_panel(surface, rect):
+    """Painel do menu com sombra (forma do atlas)"""
+    panel_x, panel_y, panel_width, panel_height = rect
+    
+    # Sombra do painel
+    draw_rounded_rect(surface, (100, 150, 200, 50), 
+                     (panel_x + 8, panel_y + 8, panel_width, panel_height), 25)
+    
+    # Painel com borda
+    draw_rounded_rect(surface, LIGHT_BLUE, 
+                     (panel_x, panel_y, panel_width, panel_height), 25, 5, WHITE)
+
+def draw_game_over_panel(surface, rect):
+    """Painel de game over (forma do atlas)"""
+    draw_rounded_rect(surface, (255, 200, 200), rect, 30, 6, RED)
+
+def draw_score_box(surface, rect):
+    """Fundo do placar (forma do atlas)"""
+    draw_rounded_rect(surface, (255, 255, 255, 200), rect, 15)
+
+def draw_indicator_box(surface, rect):
+    """Fundo do indicador de braços levantados (forma do atlas)"""
+    draw_rounded_rect(surface, GREEN, rect, 15)
+
 # ==================== FUNÇÕES ORIGINAIS ====================
 
 def draw_text(text, font, color, x, y, center=False):
     """Desenha texto na tela"""
-    text_surface = font.render(text, True, color)
-    text_rect = text_surface.get_rect()
-    if center:
-        text_rect.center = (x, y)
-    else:
-        text_rect.topleft = (x, y)
-    screen.blit(text_surface, text_rect)
+    with profiler.stage("text"):
+        text_surface = text_cache.get(text, font, color)
+        text_rect = text_surface.get_rect()
+        if center:
+            text_rect.center = (x, y)
+        else:
+            text_rect.topleft = (x, y)
+        screen.blit(text_surface, text_rect)
+
+def draw_camera_frame(surface, rect):
+    """Moldura arredondada por baixo do feed da câmera (forma do atlas)"""
+    x, y, width, height = rect
+    draw_rounded_rect(surface, WHITE, (x - 5, y - 5, width + 10, height + 10), 20)
+    draw_rounded_rect(surface, LIGHT_BLUE, (x - 3, y - 3, width + 6, height + 6), 18)
+
+def draw_camera_outline(surface, rect):
+    """Borda decorativa por cima do feed da câmera (forma do atlas)"""
+    draw_rounded_rect_border(surface, WHITE, rect, 15, 3)
 
 def draw_camera_feed(frame, x, y, width, height, rounded=True):
-    """Desenha o feed da câmera na tela do Pygame"""
-    if frame is not None:
-        frame_small = cv2.resize(frame, (width, height))
-        frame_rgb = cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB)
-        frame_surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-        
+    """Desenha o feed da câmera (frame RGB da inferência, sem espelhar) na tela do Pygame"""
+    global camera_preview
+    if frame is None:
+        return
+    with profiler.stage("camera_feed"):
         if rounded:
             # Desenhar borda arredondada branca
-            draw_rounded_rect(screen, WHITE, (x - 5, y - 5, width + 10, height + 10), 20)
-            draw_rounded_rect(screen, LIGHT_BLUE, (x - 3, y - 3, width + 6, height + 6), 18)
-            
-        screen.blit(frame_surface, (x, y))
+            blit_shape(screen, "camera_frame", draw_camera_frame, (x, y, width, height))
+        
+        # Fora da região sendo redesenhada (clip), o frame nem é convertido
+        if screen.get_clip().colliderect((x, y, width, height)):
+            if camera_preview is None:
+                # Só há frame depois que o detector (e o OpenCV) carregou
+                from preview import CameraPreview
+                camera_preview = CameraPreview()
+            # Espelha e reduz em uma passada, dentro de uma Surface reutilizada
+            frame_surface = camera_preview.render(frame, (width, height))
+            screen.blit(frame_surface, (x, y))
         
         if rounded:
             # Adicionar borda decorativa
-            draw_rounded_rect_border(screen, WHITE, (x, y, width, height), 15, 3)
+            blit_shape(screen, "camera_outline", draw_camera_outline, (x, y, width, height))
+
+def draw_profiler_overlay():
+    """Overlay de desempenho (F3): p50/p95/p99 por etapa e FPS efetivo"""
+    now = pygame.time.get_ticks()
+    # Logo depois do F3 ainda não há frame medido: o overlay aparece no próximo
+    if profiler.percentiles("frame") is None:
+        return
+    # Reconstruído a cada meio segundo para o próprio overlay não pesar no frame
+    if _overlay["surface"] is None or now - _overlay["updated"] >= 500:
+        lines = [f"FPS {profiler.fps():5.1f}   frame {profiler.frame}",
+                 "etapa           p50    p95    p99 (ms)"]
+        for name in ["frame"] + profiler.stage_names():
+            stats = profiler.percentiles(name)
+            if stats is None:
+                continue
+            p50, p95, p99 = stats
+            lines.append(f"{name:<12} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        rendered = [font_overlay.render(line, True, WHITE) for line in lines]
+        width = max(line.get_width() for line in rendered) + 20
+        surface = pygame.Surface((width, 22 * len(rendered) + 10), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for i, line in enumerate(rendered):
+            surface.blit(line, (10, 5 + 22 * i))
+        _overlay["surface"] = surface
+        _overlay["updated"] = now
+    surface = _overlay["surface"]
+    # Direto na janela: o overlay fica nítido mesmo com a cena em escala reduzida
+    window.blit(surface, (window.get_width() - surface.get_width() - 10, 10))
+
+def present_frame(screen_name, fps):
+    """Mostra o frame (com o overlay de desempenho, se ativo) e espera o próximo"""
+    if screen is not window:
+        # Cena desenhada em escala reduzida: um único scale até a janela
+        with profiler.stage("scale"):
+            view.present()
+    if profiler.overlay_visible:
+        draw_profiler_overlay()
+    with profiler.stage("flip"):
+        # Tela inteira ou só as regiões marcadas pela tela
+        frame_scheduler.present()
+    if startup["first_frame"] is None:
+        startup["first_frame"] = time.perf_counter()
+    elapsed = frame_scheduler.wait(fps)
+    # Escala dinâmica: o tempo de trabalho do frame (sem a espera) decide a escala
+    if view.dynamic and screen is not window and view.adjust(clock.get_rawtime()):
+        use_view(True)
+        frame_scheduler.mark_all()
+    profiler.end_frame(screen_name)
+    return elapsed
+
+def redraw(draw, dirty):
+    """Desenha a cena inteira ou, se possível, só dentro das regiões ``dirty``.
+
+    Cada região é redesenhada com clip na tela: o fundo opaco cobre a região
+    e o restante da cena é refeito por cima, como no frame completo.
+    """
+    if profiler.overlay_visible or len(dirty) > MAX_DIRTY_RECTS:
+        frame_scheduler.mark_all()
+    if frame_scheduler.needs_full():
+        draw()
+        return
+    for rect in dirty:
+        screen.set_clip(rect)
+        draw()
+        frame_scheduler.mark(rect)
+    screen.set_clip(None)
+
+def move_clouds(clouds, steps=1):
+    """Avança as nuvens; retorna as regiões da tela que mudaram"""
+    dirty = []
+    for cloud in clouds:
+        before = cloud.rect()
+        cloud.update(steps)
+        after = cloud.rect()
+        if after != before:
+            dirty.extend([before.union(after)] if before.colliderect(after) else [before, after])
+    return dirty
+
+def wake_up():
+    """Entrada do usuário: sai do modo ocioso e retoma a câmera na hora"""
+    frame_scheduler.input()
+    frame_scheduler.mark_all()
+    detector = camera_pause["detector"]
+    if detector is not None:
+        camera_pause["detector"] = None
+        detector.resume()
+
+def pause_camera(detector):
+    """Pausa captura e inferência até a próxima entrada (ou o jogo)"""
+    if detector is not None and camera_pause["detector"] is None:
+        detector.pause()
+        camera_pause["detector"] = detector
+
+# ==================== DESENHO DAS TELAS ====================
+
+def draw_menu_frame(pose_detector, frame, clouds, calibrating, idle=False, star_sizes=None,
+                    best_run=None):
+    """Desenha um frame do menu (as nuvens são movidas pelo chamador)"""
+    # Gradiente de fundo
+    draw_background(screen)
+    
+    # Desenhar nuvens
+    for cloud in clouds:
+        cloud.draw(screen)
+    
+    # Desenhar estrelas decorativas
+    if star_sizes is None:
+        star_sizes = menu_star_sizes()
+    for (sx, sy), size in zip(MENU_STAR_POSITIONS, star_sizes):
+        blit_star(screen, (255, 255, 200), sx, sy, size)
+    
+    # Desenhar logo do pássaro se existir
+    logo_height = 200  # mesmo tamanho do scale da logo
+    if logo_image:
+        logo_x = SCREEN_WIDTH // 2 - 100
+        logo_y = 10
+        screen.blit(logo_image, (logo_x, logo_y))
+        title_y = logo_y + logo_height + 20  # título logo abaixo da logo
+    else:
+        title_y = 70
+    
+    # Título "FLAPPY ARMS" com efeito
+    draw_text_with_outline("FLAPPY ARMS", font_title, WHITE, ORANGE, SCREEN_WIDTH // 2, title_y, center=True)
+    
+    # Subtítulo
+    draw_text("Wave to Play!", font_medium, GOLD, SCREEN_WIDTH // 2, title_y + 80, center=True)
+    
+    # Painel principal
+    panel_width = 500
+    panel_height = 360
+    panel_x = (SCREEN_WIDTH - panel_width) // 2
+    panel_y = 295
+    
+    # Painel com sombra e borda (forma do atlas)
+    blit_shape(screen, "menu_panel", draw_menu_panel,
+               (panel_x, panel_y, panel_width, panel_height))
+    
+    # Título do painel
+    if pose_detector is None:
+        draw_text("Loading camera...", font_small, (50, 100, 150),
+                 SCREEN_WIDTH // 2, panel_y + 30, center=True)
+    elif idle:
+        draw_text("Press any key to wake the camera", font_small, (50, 100, 150),
+                 SCREEN_WIDTH // 2, panel_y + 30, center=True)
+    elif not pose_detector.calibrated and hasattr(pose_detector, "players"):
+        draw_text(f'Press "C" to CALIBRATE ({pose_detector.calibrated_count}/'
+                  f'{len(pose_detector.players)} players)', font_small, (50, 100, 150),
+                 SCREEN_WIDTH // 2, panel_y + 30, center=True)
+    elif not pose_detector.calibrated:
+        draw_text('Press "C" to CALIBRATE', font_small, (50, 100, 150), 
+                 SCREEN_WIDTH // 2, panel_y + 30, center=True)
+    else:
+        draw_text('CALIBRATED!', font_medium, GREEN, 
+                 SCREEN_WIDTH // 2, panel_y + 30, center=True)
+    
+    # Feed da câmera
+    cam_x, cam_y, cam_width, cam_height = MENU_CAMERA_RECT
+    
+    draw_camera_feed(frame, cam_x, cam_y, cam_width, cam_height, rounded=True)
+    
+    # Botão JOGAR (abaixo da câmera)
+    if pose_detector is not None and pose_detector.calibrated:
+        button_width = 300
+        button_height = 70
+        button_x = (SCREEN_WIDTH - button_width) // 2
+        button_y = cam_y + cam_height + 50
+        
+        # Setas decorativas
+        arrow_y = button_y + button_height // 2
+        for arrow_x in [button_x - 60, button_x + button_width + 30]:
+            pygame.draw.polygon(screen, GOLD, [
+                (arrow_x, arrow_y - 15),
+                (arrow_x, arrow_y + 15),
+                (arrow_x + 25, arrow_y)
+            ])
+        
+        draw_button("PLAY", button_x, button_y, button_width, button_height, 
+                   GOLD, ORANGE, WHITE)
+        
+        draw_text('Press SPACE', font_small, WHITE, 
+                 SCREEN_WIDTH // 2, button_y + button_height + 25, center=True)
+    elif calibrating:
+        draw_text("Calibrating...", font_medium, YELLOW, 
+                 SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120, center=True)
+    
+    if best_run is not None:
+        draw_text(f"R - Watch best run ({best_run.score})", font_small, WHITE,
+                  20, SCREEN_HEIGHT - 45)
+
+def draw_leaderboard(leaders, x, y, width, height):
+    """Painel com o top do dia (jogador e pontos)"""
+    blit_shape(screen, "leaderboard_panel", draw_score_box, (x, y, width, height))
+    draw_text("TODAY", font_medium, GOLD, x + width // 2, y + 35, center=True)
+    if not leaders:
+        draw_text("No scores yet", font_small, (50, 50, 50), x + width // 2, y + 100, center=True)
+    for rank, (player, player_score, _) in enumerate(leaders, 1):
+        row_y = y + 60 + 45 * rank
+        draw_text(f"{rank}. {player[:10]}", font_small, BLACK, x + 20, row_y - 12)
+        score_surface = text_cache.get(str(player_score), font_small, BLACK)
+        screen.blit(score_surface, (x + width - 20 - score_surface.get_width(), row_y - 12))
+
+def draw_game_over_frame(score, high_score, clouds, player_scores=None, leaders=None):
+    """Desenha um frame da tela de game over (as nuvens são movidas pelo chamador)"""
+    # Gradiente de fundo
+    draw_background(screen)
+    
+    # Desenhar nuvens
+    for cloud in clouds:
+        cloud.draw(screen)
+    
+    # Painel de Game Over
+    panel_width = 600
+    panel_height = 400
+    panel_x = (SCREEN_WIDTH - panel_width) // 2
+    panel_y = 200
+    
+    blit_shape(screen, "game_over_panel", draw_game_over_panel,
+               (panel_x, panel_y, panel_width, panel_height))
+    
+    draw_text_with_outline("GAME OVER!", font_large, RED, (100, 0, 0), 
+                          SCREEN_WIDTH // 2, panel_y + 60, center=True)
+    
+    if player_scores:
+        # Multijogador: placar de cada jogador, na cor dele
+        slot = panel_width // len(player_scores)
+        for i, player_score in enumerate(player_scores):
+            draw_text_with_outline(f"P{i + 1}: {player_score}", font_medium, PLAYER_COLORS[i],
+                                   BLACK, panel_x + slot * i + slot // 2, panel_y + 150,
+                                   center=True)
+    else:
+        draw_text(f"Score: {score}", font_medium, BLACK, 
+                 SCREEN_WIDTH // 2, panel_y + 150, center=True)
+    draw_text(f"High Score: {high_score}", font_medium, GOLD, 
+             SCREEN_WIDTH // 2, panel_y + 210, center=True)
+    
+    # Botões
+    button_y = panel_y + 280
+    draw_text("SPACE - Play Again", font_small, (50, 50, 50), 
+             SCREEN_WIDTH // 2, button_y, center=True)
+    draw_text("ESC - Menu", font_small, (50, 50, 50), 
+             SCREEN_WIDTH // 2, button_y + 50, center=True)
+    
+    # Placar persistente, ao lado do painel
+    if leaders is not None:
+        draw_leaderboard(leaders, panel_x + panel_width + 25, panel_y, 255, panel_height)
+
+def draw_play_frame(engine, alpha, clouds, camera_frame, arms_raised, ghost=None):
+    """Desenha um frame do jogo, interpolando a simulação por ``alpha``"""
+    # Desenhar gradiente de fundo
+    draw_background(screen)
+    
+    # Desenhar nuvens
+    for cloud in clouds:
+        cloud.update()
+        cloud.draw(screen)
+    
+    # Desenhar canos
+    for pipe in engine.pipes:
+        pipe.draw(screen, alpha)
+    
+    # Fantasma da melhor partida (por baixo do pássaro ao vivo)
+    if ghost is not None and not ghost.finished:
+        ghost.bird.draw(screen, alpha)
+    
+    # Desenhar pássaro
+    engine.bird.draw(screen, alpha)
+    
+    # Desenhar pontuação com estilo
+    score_text = f"Score: {engine.score}"
+    box_x, box_y = SCORE_BOX_RECT[:2]
+    blit_shape(screen, "score_box", draw_score_box, px_rect(SCORE_BOX_RECT))
+    draw_text(score_text, view_font(font_medium), BLACK, px(box_x + SCORE_TEXT_INSET),
+              px(box_y + SCORE_TEXT_INSET))
+    
+    # Desenhar feed da câmera (pequeno no canto)
+    if camera_frame is not None:
+        draw_camera_feed(camera_frame, *px_rect(PLAY_CAMERA_POS + PLAY_CAMERA_SIZE),
+                         rounded=False)
+    
+    # Indicador de braços levantados
+    if arms_raised:
+        _, indicator_y, _, indicator_height = ARMS_INDICATOR_RECT
+        blit_shape(screen, "arms_indicator", draw_indicator_box, px_rect(ARMS_INDICATOR_RECT))
+        draw_text("ARMS UP!", view_font(font_small), WHITE, 
+                px(SCREEN_WIDTH // 2), px(indicator_y + indicator_height // 2), center=True)
+
+def ghost_image():
+    """Imagem do pássaro (ou do círculo de fallback) com transparência, criada uma vez"""
+    image = player_bird_images.get("ghost")
+    if image is None:
+        if bird_image is not None:
+            image = bird_image.copy()
+        else:
+            image = pygame.Surface((BIRD_SIZE, BIRD_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(image, WHITE, (BIRD_SIZE // 2, BIRD_SIZE // 2), BIRD_SIZE // 2)
+        image.fill((255, 255, 255, GHOST_ALPHA), special_flags=pygame.BLEND_RGBA_MULT)
+        player_bird_images["ghost"] = image
+    return image
+
+def player_bird_image(player):
+    """Imagem do pássaro tingida com a cor do jogador (None sem bird.png)"""
+    if bird_image is None or player == 0:
+        return bird_image
+    image = player_bird_images.get(player)
+    if image is None:
+        image = bird_image.copy()
+        image.fill(PLAYER_COLORS[player] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+        player_bird_images[player] = image
+    return image
+
+def draw_multiplayer_frame(engine, alpha, clouds, camera_frame, arms_raised):
+    """Frame multijogador: um pássaro e um placar por jogador, canos compartilhados"""
+    draw_background(screen)
+    
+    for cloud in clouds:
+        cloud.update()
+        cloud.draw(screen)
+    
+    for pipe in engine.pipes:
+        pipe.draw(screen, alpha)
+    
+    # Pássaros vivos, com o número do jogador em cima
+    for i, bird in enumerate(engine.birds):
+        if engine.alive[i]:
+            bird.draw(screen, alpha)
+            draw_text_with_outline(f"P{i + 1}", view_font(font_small), PLAYER_COLORS[i], BLACK,
+                                   px(bird.x),
+                                   px(bird.interpolated_y(alpha) - bird.size // 2 - PLAYER_LABEL_GAP),
+                                   center=True)
+    
+    # Placar por jogador (verde com os braços levantados)
+    for i, score in enumerate(engine.scores):
+        x, y, width, height = SCORE_BOX_RECT
+        x += SCORE_BOX_STEP * i
+        blit_shape(screen, "score_box", draw_score_box, px_rect((x, y, width, height)))
+        status = f"P{i + 1}: {score}" if engine.alive[i] else f"P{i + 1}: {score} OUT"
+        draw_text(status, view_font(font_medium), GREEN if arms_raised[i] else BLACK,
+                  px(x + SCORE_TEXT_INSET), px(y + SCORE_TEXT_INSET))
+    
+    # Feed da câmera (pequeno, canto direito: os placares ocupam a esquerda)
+    if camera_frame is not None:
+        draw_camera_feed(camera_frame, *px_rect(MULTI_CAMERA_POS + PLAY_CAMERA_SIZE),
+                         rounded=False)
 
 # ==================== TELA DE MENU REFORMULADA ====================
 
-def menu_screen(pose_detector):
-    """Tela de menu inicial com design aprimorado"""
+def menu_screen(loader, best_run=None):
+    """Tela de menu inicial com design aprimorado (o detector pode ainda estar carregando).
+
+    Com ``best_run``, R mostra o replay da melhor partida gravada.
+    """
     waiting = True
     calibrating = False
     
@@ -354,205 +922,368 @@ def menu_screen(pose_detector):
         Cloud(200, 300, 0.15, 1.1),
         Cloud(800, 250, 0.35, 0.9),
     ]
-    
-    star_positions = [
-        (150, 80), (950, 120), (300, 450), (1000, 400), (500, 150),
-        (200, 200), (800, 180), (400, 350), (900, 320)
-    ]
+    use_view(False)
+    # Vindo do game over a câmera pode estar pausada: a pré-visualização volta a andar
+    wake_up()
+    scene = None
+    last_star_sizes = menu_star_sizes()
     
     while waiting:
+        if loader.error is not None:
+            raise loader.error
+        pose_detector = loader.detector
+        report_startup()
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return "quit"
+            if event.type in WAKE_EVENTS:
+                wake_up()
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_c:
+                if event.key == pygame.K_c and pose_detector is not None:
                     calibrating = True
                     if pose_detector.calibrate():
                         return "play"
-                if event.key == pygame.K_SPACE and pose_detector.calibrated:
+                if event.key == pygame.K_SPACE and pose_detector is not None \
+                        and pose_detector.calibrated:
                     return "play"
+                if event.key == pygame.K_r and best_run is not None:
+                    return "replay"
                 if event.key == pygame.K_ESCAPE:
                     return "quit"
+                if event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
         
-        # Pegar frame da câmera
-        _, frame = pose_detector.cap.read()
-        if frame is not None:
-            frame = cv2.flip(frame, 1)
-        
-        # Gradiente de fundo
-        for i in range(SCREEN_HEIGHT):
-            color_value = BLUE[0] + (LIGHT_BLUE[0] - BLUE[0]) * i // SCREEN_HEIGHT
-            pygame.draw.line(screen, (color_value, color_value + 30, 235), (0, i), (SCREEN_WIDTH, i))
-        
-        # Atualizar e desenhar nuvens
-        for cloud in clouds:
-            cloud.update()
-            cloud.draw(screen)
-        
-        # Desenhar estrelas decorativas
-        for i, (sx, sy) in enumerate(star_positions):
-            alpha = abs(pygame.time.get_ticks() % 2000 - 1000) / 1000
-            size = 8 + 3 * alpha if i % 2 == 0 else 8 + 3 * (1 - alpha)
-            draw_star(screen, (255, 255, 200), sx, sy, size)
-        
-        # Desenhar logo do pássaro se existir
-        logo_height = 200  # mesmo tamanho do scale da logo
-        if logo_image:
-            logo_x = SCREEN_WIDTH // 2 - 100
-            logo_y = 10
-            screen.blit(logo_image, (logo_x, logo_y))
-            title_y = logo_y + logo_height + 20  # título logo abaixo da logo
-        else:
-            title_y = 70
-        
-        # Título "FLAPPY ARMS" com efeito
-        draw_text_with_outline("FLAPPY ARMS", font_title, WHITE, ORANGE, SCREEN_WIDTH // 2, title_y, center=True)
+        # Sem entrada por um tempo: taxa ociosa e câmera pausada (pré-visualização congelada)
+        idle = frame_scheduler.idle()
+        if idle:
+            pause_camera(pose_detector)
+        frame_scheduler.enter("menu_idle" if idle else "menu")
+        fps = frame_scheduler.fps(MENU_FPS)
         
-        # Subtítulo
-        draw_text("Wave to Play!", font_medium, GOLD, SCREEN_WIDTH // 2, title_y + 80, center=True)
-        
-        # Painel principal
-        panel_width = 500
-        panel_height = 360
-        panel_x = (SCREEN_WIDTH - panel_width) // 2
-        panel_y = 295
-        
-        # Sombra do painel
-        draw_rounded_rect(screen, (100, 150, 200, 50), 
-                         (panel_x + 8, panel_y + 8, panel_width, panel_height), 25)
-        
-        # Painel com borda
-        draw_rounded_rect(screen, LIGHT_BLUE, 
-                         (panel_x, panel_y, panel_width, panel_height), 25, 5, WHITE)
-        
-        # Título do painel
-        if not pose_detector.calibrated:
-            draw_text('Press "C" to CALIBRATE', font_small, (50, 100, 150), 
-                     SCREEN_WIDTH // 2, panel_y + 30, center=True)
-        else:
-            draw_text('CALIBRATED!', font_medium, GREEN, 
-                     SCREEN_WIDTH // 2, panel_y + 30, center=True)
+        # Pegar frame da câmera
+        frame = None
+        dirty = []
+        if pose_detector is not None:
+            last_capture = pose_detector.capture_time
+            frame = pose_detector.read_frame()
+            if pose_detector.capture_time != last_capture:
+                dirty.append(MENU_CAMERA_RECT)
         
-        # Feed da câmera
-        cam_width = 450
-        cam_height = 250
-        cam_x = (SCREEN_WIDTH - cam_width) // 2
-        cam_y = panel_y + 70
+        # Textos e botões mudam só com o estado da tela
+        calibrated = pose_detector is not None and pose_detector.calibrated
+        players_ready = getattr(pose_detector, "calibrated_count", None)
+        if (pose_detector is None, calibrated, players_ready, calibrating, idle) != scene:
+            scene = (pose_detector is None, calibrated, players_ready, calibrating, idle)
+            frame_scheduler.mark_all()
         
-        draw_camera_feed(frame, cam_x, cam_y, cam_width, cam_height, rounded=True)
+        star_sizes = menu_star_sizes()
+        if star_sizes != last_star_sizes:
+            dirty.extend((sx - 12, sy - 12, 24, 24) for (sx, sy), size, last
+                         in zip(MENU_STAR_POSITIONS, star_sizes, last_star_sizes) if size != last)
+            last_star_sizes = star_sizes
+        dirty.extend(move_clouds(clouds, MENU_FPS // fps))
         
-        # Botão JOGAR (abaixo da câmera)
-        if pose_detector.calibrated:
-            button_width = 300
-            button_height = 70
-            button_x = (SCREEN_WIDTH - button_width) // 2
-            button_y = cam_y + cam_height + 50
-            
-            # Setas decorativas
-            arrow_y = button_y + button_height // 2
-            for arrow_x in [button_x - 60, button_x + button_width + 30]:
-                pygame.draw.polygon(screen, GOLD, [
-                    (arrow_x, arrow_y - 15),
-                    (arrow_x, arrow_y + 15),
-                    (arrow_x + 25, arrow_y)
-                ])
-            
-            draw_button("PLAY", button_x, button_y, button_width, button_height, 
-                       GOLD, ORANGE, WHITE)
-            
-            draw_text('Press SPACE', font_small, WHITE, 
-                     SCREEN_WIDTH // 2, button_y + button_height + 25, center=True)
-        elif calibrating:
-            draw_text("Calibrating...", font_medium, YELLOW, 
-                     SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120, center=True)
+        redraw(lambda: draw_menu_frame(pose_detector, frame, clouds, calibrating, idle, star_sizes,
+                                       best_run), dirty)
         
-        pygame.display.flip()
-        clock.tick(30)
+        present_frame("menu", fps)
     
     return "quit"
 
 # ==================== TELA DE GAME OVER REFORMULADA ====================
 
-def game_over_screen(score, high_score):
-    """Tela de game over com design aprimorado"""
+def game_over_screen(score, high_score, pose_detector=None, player_scores=None, leaderboard=None):
+    """Tela de game over com design aprimorado (câmera pausada, só as nuvens se mexem).
+
+    Com ``leaderboard`` (ScoreStore) mostra o top do dia, que se atualiza
+    quando a pontuação desta partida chega ao banco.
+    """
     waiting = True
     clouds = [
         Cloud(100, 100, 0.3, 1.2),
         Cloud(400, 150, 0.2, 0.8),
         Cloud(700, 80, 0.25, 1.0),
     ]
+    use_view(False)
+    pause_camera(pose_detector)
+    frame_scheduler.input()
+    leaders_version = None
     
     while waiting:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return "quit"
+            if event.type in WAKE_EVENTS:
+                frame_scheduler.input()
+                frame_scheduler.mark_all()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     return "play"
                 if event.key == pygame.K_ESCAPE:
                     return "menu"
+                if event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
         
-        # Gradiente de fundo
-        for i in range(SCREEN_HEIGHT):
-            color_value = BLUE[0] + (LIGHT_BLUE[0] - BLUE[0]) * i // SCREEN_HEIGHT
-            pygame.draw.line(screen, (color_value, color_value + 30, 235), (0, i), (SCREEN_WIDTH, i))
+        idle = frame_scheduler.idle()
+        frame_scheduler.enter("game_over_idle" if idle else "game_over")
+        fps = frame_scheduler.fps(MENU_FPS)
         
-        # Desenhar nuvens
-        for cloud in clouds:
-            cloud.update()
-            cloud.draw(screen)
+        # Placar novo gravado: a tela inteira é redesenhada
+        leaders = None
+        if leaderboard is not None:
+            leaders = leaderboard.top(5, "daily")
+            if leaderboard.version != leaders_version:
+                leaders_version = leaderboard.version
+                frame_scheduler.mark_all()
         
-        # Painel de Game Over
-        panel_width = 600
-        panel_height = 400
-        panel_x = (SCREEN_WIDTH - panel_width) // 2
-        panel_y = 200
+        # Só as regiões das nuvens que andaram são redesenhadas
+        dirty = move_clouds(clouds, MENU_FPS // fps)
+        redraw(lambda: draw_game_over_frame(score, high_score, clouds, player_scores, leaders),
+               dirty)
         
-        draw_rounded_rect(screen, (255, 200, 200), 
-                         (panel_x, panel_y, panel_width, panel_height), 30, 6, RED)
+        present_frame("game_over", fps)
+    
+    return "quit"
+
+def replay_round(run, play_fps):
+    """Refaz ``run`` na tela com os flaps gravados; retorna o próximo estado"""
+    frame_scheduler.enter("replay")
+    use_view(True)
+    engine = GameEngine(bird_factory=Bird, pipe_factory=Pipe, seed=run.seed)
+    # Cada flap gravado é agendado logo depois do tick anterior ao dele
+    recorded = ReplayInput(run)
+    recorded.feed(engine)
+    engine.on_tick = recorded.feed
+    clouds = [
+        Cloud(random.randint(0, SCREEN_WIDTH), random.randint(50, 300), 
+              random.uniform(0.2, 0.4), random.uniform(0.8, 1.2))
+        for _ in range(5)
+    ]
+    frame_time = engine.dt
+    
+    while not engine.game_over:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return "quit"
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return "menu"
         
-        draw_text_with_outline("GAME OVER!", font_large, RED, (100, 0, 0), 
-                              SCREEN_WIDTH // 2, panel_y + 60, center=True)
+        with profiler.stage("update"):
+            alpha = engine.advance(frame_time)
         
-        draw_text(f"Score: {score}", font_medium, BLACK, 
-                 SCREEN_WIDTH // 2, panel_y + 150, center=True)
-        draw_text(f"High Score: {high_score}", font_medium, GOLD, 
-                 SCREEN_WIDTH // 2, panel_y + 210, center=True)
+        frame_scheduler.mark_all()
+        draw_play_frame(engine, alpha, clouds, None, False)
+        draw_text(f"REPLAY - best run ({run.score})", view_font(font_small), WHITE,
+                  px(SCREEN_WIDTH // 2), px(CAPTION_Y), center=True)
+        frame_time = present_frame("replay", play_fps) / 1000
+    
+    return "menu"
+
+def chain_ticks(hooks):
+    """Um ``on_tick`` que chama cada hook em ordem (None sem hooks; o próprio, se for um só)"""
+    if len(hooks) <= 1:
+        return hooks[0] if hooks else None
+    def on_tick(engine):
+        for hook in hooks:
+            hook(engine)
+    return on_tick
+
+def player_name(names, player, players):
+    """Nome do jogador para o placar: o informado ou o padrão (guest, P1, P2...)"""
+    if player < len(names):
+        return names[player]
+    return f"P{player + 1}" if players > 1 else None
+
+def trace_flap(tracer, detector, tick):
+    """Registra no traçador de latência o flap que ``detector`` acabou de disparar"""
+    if tracer is not None:
+        tracer.flap(detector.capture_time, getattr(detector, "inference_ms", 0.0), tick,
+                    time.monotonic())
+
+def multiplayer_round(group, play_fps, tracer=None):
+    """Uma partida multijogador; retorna (próximo estado, pontuação de cada jogador)"""
+    wake_up()
+    frame_scheduler.enter("play")
+    use_view(True)
+    group.reset_stats()
+    
+    players = len(group.players)
+    engine = MultiGameEngine(players, bird_factory=Bird, pipe_factory=Pipe)
+    for i, bird in enumerate(engine.birds):
+        bird.image = player_bird_image(i)
+        bird.color = PLAYER_COLORS[i]
+    frame_time = engine.dt
+    
+    game_clouds = [
+        Cloud(random.randint(0, SCREEN_WIDTH), random.randint(50, 300), 
+              random.uniform(0.2, 0.4), random.uniform(0.8, 1.2))
+        for _ in range(5)
+    ]
+    
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return "quit", engine.scores
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return "menu", engine.scores
+                if event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
         
-        # Botões
-        button_y = panel_y + 280
-        draw_text("SPACE - Play Again", font_small, (50, 50, 50), 
-                 SCREEN_WIDTH // 2, button_y, center=True)
-        draw_text("ESC - Menu", font_small, (50, 50, 50), 
-                 SCREEN_WIDTH // 2, button_y + 50, center=True)
+        # Um flap por jogador, cada um no seu pássaro
+        flaps, camera_frame = group.detect_flaps()
+        for i, flap in enumerate(flaps):
+            if flap:
+                engine.flap(i)
+                trace_flap(tracer, group.players[i], engine.tick)
         
-        pygame.display.flip()
-        clock.tick(30)
-    
-    return "quit"
+        with profiler.stage("update"):
+            alpha = engine.advance(frame_time)
+        if tracer is not None:
+            tracer.advanced(engine.tick, time.monotonic())
+        
+        frame_scheduler.mark_all()
+        draw_multiplayer_frame(engine, alpha, game_clouds, camera_frame,
+                               group.arms_raised_by_player)
+        frame_time = present_frame("play", play_fps) / 1000
+        if tracer is not None:
+            tracer.presented(frame_scheduler.presented_at)
+        
+        if engine.game_over:
+            if tracer is not None:
+                tracer.discard()
+            return "game_over", engine.scores
 
 # ==================== LOOP PRINCIPAL DO JOGO ====================
 
-def main():
+def create_pose_detector(inference="inline", source=0, camera_size=(640, 480),
+                         camera_fps=30, camera_format="MJPG", realtime=True,
+                         record_landmarks=None, cpu_budget=None, gesture=False, players=1,
+                         detector="pose", **pose_settings):
+    """Cria o detector de pose: inline (no loop do jogo) ou em processo separado.
+
+    ``source`` é o índice da webcam, um vídeo, um diretório de frames ou uma
+    gravação de landmarks (.npz), que dispensa câmera e MediaPipe.
+    ``pose_settings`` (model_complexity, inference_size, roi) vão para o
+    PoseEstimator. Com ``cpu_budget`` (fração de um núcleo) a inferência inline
+    roda em taxa adaptativa, com previsão dos landmarks entre inferências.
+    Com ``gesture`` o flap dispara no início do movimento (GestureEngine).
+    Com ``players`` > 1 retorna um PlayerGroup: ``source`` (uma fonte ou uma
+    lista, uma por jogador) é repartida em faixas ou vira uma câmera por jogador.
+    Com ``detector="motion"`` os braços são detectados por diferença de
+    frames (MotionDetector), sem MediaPipe, para máquinas fracas.
+    Os módulos de visão (OpenCV, MediaPipe) só são importados aqui.
+    """
+    if players > 1:
+        from pose_pool import create_player_group
+        sources = list(source) if isinstance(source, (list, tuple)) else [source]
+        return create_player_group(players, sources, camera_size, camera_fps, camera_format,
+                                   realtime, gesture=gesture, **pose_settings)
+    
+    from gesture_engine import GestureEngine
+    from input_sources import LandmarkRecorder, LandmarkReplayDetector, open_source
+    
+    recorder = LandmarkRecorder(record_landmarks) if record_landmarks else None
+    gesture = GestureEngine() if gesture else None
+    if str(source).endswith(".npz"):
+        return LandmarkReplayDetector(source, realtime=realtime, recorder=recorder,
+                                      gesture=gesture)
+    if inference == "process":
+        from pose_worker import ProcessPoseDetector
+        return ProcessPoseDetector(source, camera_size, camera_fps, camera_format,
+                                   realtime=realtime, recorder=recorder, gesture=gesture,
+                                   **pose_settings)
+    width, height = camera_size
+    camera = open_source(source, realtime, width=width, height=height, fps=camera_fps,
+                         fourcc=camera_format)
+    if detector == "motion":
+        from motion_detector import MotionDetector
+        return MotionDetector(camera)
+    from pose_detector import PoseDetector
+    from pose_governor import InferenceGovernor
+    governor = None
+    if cpu_budget:
+        fps = getattr(camera, "fps", camera_fps) or camera_fps
+        governor = InferenceGovernor(cpu_budget, max_hz=fps)
+    return PoseDetector(camera, recorder=recorder, governor=governor, gesture=gesture,
+                        **pose_settings)
+
+def main(inference="inline", profile_out=None, fast=False, idle_after=15.0, full_redraw=False,
+         players=1, latency_trace=False, latency_out=None, telemetry_dir=None,
+         scores_db=None, player_names=(), ghost=False, render_scale=1.0, dynamic_scale=False,
+         spectate=None, **source_options):
     """Loop principal do jogo"""
-    pose_detector = PoseDetector()
-    high_score = 0
+    init_display(idle_after, partial=not full_redraw, render_scale=render_scale,
+                 dynamic_scale=dynamic_scale)
+    if profile_out:
+        profiler.start_export(profile_out)
+    # Modo rápido: fontes gravadas sem seguir o relógio e jogo sem limite de FPS
+    play_fps = 0 if fast else FPS
+    # Câmera e modelo carregam em segundo plano enquanto o menu já aparece
+    loader = DetectorLoader(inference, realtime=not fast, players=players, **source_options)
+    loader.start()
+    # A CPU do worker de inferência (modo process) entra na conta de cada estado
+    frame_scheduler.extra_cpu = lambda: loader.detector.worker_cpu_time() if loader.detector else 0.0
+    # Placar persistente: o recorde sobrevive a reinícios
+    leaderboard = ScoreStore(scores_db) if scores_db else None
+    high_score = leaderboard.best() if leaderboard is not None else 0
+    # Melhor partida gravada: replay no menu (R) e, com ``ghost``, o fantasma a vencer
+    best_run = leaderboard.best_run() if leaderboard is not None else None
+    player_scores = None
+    # Latência do braço até o flip (histograma impresso no fim da sessão)
+    tracer = LatencyTracer() if latency_trace or latency_out else None
+    # Um registro binário por tick, gravado por uma thread (um arquivo por sessão)
+    telemetry = TelemetryWriter(session_path(telemetry_dir)) if telemetry_dir else None
+    # Estado de cada frame para espectadores na rede (spectator_viewer.py)
+    spectators = SpectatorServer(spectate) if spectate else None
     
     state = "menu"
     
     try:
         while True:
             if state == "menu":
-                state = menu_screen(pose_detector)
+                state = menu_screen(loader, best_run)
                 if state == "quit":
                     break
+                pose_detector = loader.detector
+            
+            elif state == "replay":
+                state = replay_round(best_run, play_fps)
                     
+            elif state == "play" and players > 1:
+                state, player_scores = multiplayer_round(pose_detector, play_fps, tracer)
+                score = max(player_scores)
+                high_score = max(high_score, score)
+                if state == "game_over" and leaderboard is not None:
+                    for i, player_score in enumerate(player_scores):
+                        leaderboard.submit(player_score, player_name(player_names, i, players))
+            
             elif state == "play":
-                # Inicializar jogo
-                bird = Bird()
-                pipes = [Pipe(SCREEN_WIDTH + 200)]
+                # Câmera de volta (pausada no game over) e frames completos
+                wake_up()
+                frame_scheduler.enter("play")
+                use_view(True)
+                
+                # Inicializar jogo (física em passo fixo, independente da renderização)
+                # Contra o fantasma, a partida usa a semente dele (mesmos canos)
+                racing = ghost and best_run is not None
+                engine = GameEngine(bird_factory=Bird, pipe_factory=Pipe,
+                                    seed=best_run.seed if racing else new_seed())
+                ghost_run = Ghost(best_run, GhostBird, Pipe) if racing else None
+                # Depois de cada tick: telemetria e espectadores (um snapshot por tick)
+                tick_hooks = []
+                if telemetry is not None:
+                    telemetry.new_round()
+                    tick_hooks.append(
+                        lambda engine: telemetry.record(engine, pose_detector.landmarks))
+                if spectators is not None:
+                    tick_hooks.append(
+                        lambda engine: spectators.publish(engine, pose_detector.arms_raised))
+                engine.on_tick = chain_ticks(tick_hooks)
                 score = 0
                 running = True
+                frame_time = engine.dt
                 
                 # Nuvens de fundo
                 game_clouds = [
@@ -571,88 +1302,52 @@ def main():
                             if event.key == pygame.K_ESCAPE:
                                 running = False
                                 state = "menu"
+                            if event.key == pygame.K_F3:
+                                profiler.toggle_overlay()
                     
                     # Detectar braços levantados
                     flap_triggered, camera_frame = pose_detector.detect_arms_raised()
                     if flap_triggered:
-                        bird.flap()
-                    
-                    # Atualizar pássaro
-                    bird.update()
-                    
-                    # Atualizar canos
-                    for pipe in pipes:
-                        pipe.update()
-                        
-                        # Verificar colisão
-                        if pipe.collides_with(bird):
-                            running = False
-                            if score > high_score:
-                                high_score = score
-                            state = "game_over"
-                        
-                        # Pontuar
-                        if not pipe.scored and pipe.x + pipe.width < bird.x:
-                            pipe.scored = True
-                            score += 1
-                    
-                    # Remover canos fora da tela
-                    pipes = [p for p in pipes if not p.is_off_screen()]
+                        engine.flap()
+                        trace_flap(tracer, pose_detector, engine.tick)
                     
-                    # Adicionar novos canos
-                    if len(pipes) == 0 or pipes[-1].x < SCREEN_WIDTH - 300:
-                        pipes.append(Pipe(SCREEN_WIDTH))
+                    # Avançar a simulação pelo tempo real decorrido
+                    with profiler.stage("update"):
+                        alpha = engine.advance(frame_time)
+                        if ghost_run is not None:
+                            ghost_run.sync(engine.tick)
+                    if tracer is not None:
+                        tracer.advanced(engine.tick, time.monotonic())
+                    score = engine.score
                     
-                    # Verificar se o pássaro saiu da tela
-                    if bird.y >= SCREEN_HEIGHT - bird.size or bird.y <= 0:
+                    if engine.game_over and running:
                         running = False
                         if score > high_score:
                             high_score = score
+                        run = Run.from_engine(engine)
+                        if best_run is None or run.score > best_run.score:
+                            best_run = run
+                        if leaderboard is not None:
+                            leaderboard.submit(score, player_name(player_names, 0, players), run=run)
                         state = "game_over"
                     
-                    # Desenhar gradiente de fundo
-                    for i in range(SCREEN_HEIGHT):
-                        color_value = BLUE[0] + (LIGHT_BLUE[0] - BLUE[0]) * i // SCREEN_HEIGHT
-                        pygame.draw.line(screen, (color_value, color_value + 30, 235), (0, i), (SCREEN_WIDTH, i))
+                    frame_scheduler.mark_all()
+                    draw_play_frame(engine, alpha, game_clouds, camera_frame, pose_detector.arms_raised,
+                                    ghost_run)
                     
-                    # Desenhar nuvens
-                    for cloud in game_clouds:
-                        cloud.update()
-                        cloud.draw(screen)
-                    
-                    # Desenhar canos
-                    for pipe in pipes:
-                        pipe.draw(screen)
-                    
-                    # Desenhar pássaro
-                    bird.draw(screen)
-                    
-                    # Desenhar pontuação com estilo
-                    score_text = f"Score: {score}"
-                    draw_rounded_rect(screen, (255, 255, 255, 200), (5, 5, 200, 60), 15)
-                    draw_text(score_text, font_medium, BLACK, 15, 15)
-                    
-                    # Desenhar feed da câmera (pequeno no canto)
-                    if camera_frame is not None:
-                        draw_camera_feed(camera_frame, 250, 10, 140, 105, rounded=False)
-                    
-                    # Indicador de braços levantados
-                    if pose_detector.arms_raised:
-                        indicator_width = 250
-                        indicator_height = 50
-                        indicator_x = (SCREEN_WIDTH - indicator_width) // 2
-                        indicator_y = SCREEN_HEIGHT - 60
-                        
-                        draw_rounded_rect(screen, GREEN, 
-                                        (indicator_x, indicator_y, indicator_width, indicator_height), 15)
-                        draw_text("ARMS UP!", font_small, WHITE, 
-                                SCREEN_WIDTH // 2, indicator_y + 25, center=True)
-                    
-                    pygame.display.flip()
-                    clock.tick(FPS)
+                    frame_time = present_frame("play", play_fps) / 1000
+                    if tracer is not None:
+                        tracer.presented(frame_scheduler.presented_at)
+                
+                # Flaps que a partida não chegou a mostrar ficam fora do histograma
+                if tracer is not None:
+                    tracer.discard()
+                if telemetry is not None:
+                    telemetry.flush()
             
             elif state == "game_over":
-                state = game_over_screen(score, high_score)
+                state = game_over_screen(score, high_score, pose_detector, player_scores,
+                                         leaderboard)
                 if state == "quit":
                     break
             
@@ -660,8 +1355,152 @@ def main():
                 break
     
     finally:
-        pose_detector.release()
+        report = getattr(loader.detector, "governor_report", lambda: None)()
+        if report:
+            print("Governor: {inference_hz:.1f} Hz de inferência, {cpu_percent:.0f}% de CPU, "
+                  "+{added_flap_latency_ms:.0f} ms por flap confirmado ({flaps_predicted}/{flaps} "
+                  "pela previsão, {false_flaps} falsos)".format(**report))
+        report = getattr(loader.detector, "player_report", lambda: None)()
+        if report:
+            for player in report["players"]:
+                print("Jogador {player}: {hz:.1f} resultados/s, inferência p50 {inference_p50_ms:.0f} ms "
+                      "/ p95 {inference_p95_ms:.0f} ms, atraso p50 {latency_p50_ms:.0f} ms".format(**player))
+            print(f"Total: {report['total_hz']:.1f} resultados/s")
+        report = tracer.report() if tracer is not None else None
+        if report:
+            print("Latência braço -> flip ({flaps} flaps): p50 {p50_ms:.0f} ms, p95 {p95_ms:.0f} ms, "
+                  "p99 {p99_ms:.0f} ms, máx {max_ms:.0f} ms; médias: inferência "
+                  "{inference_ms:.0f} ms, espera do jogo {detect_wait_ms:.0f} ms, tick "
+                  "{tick_wait_ms:.0f} ms, desenho + flip {render_ms:.0f} ms".format(**report))
+            for line in tracer.histogram_lines():
+                print(line)
+        if tracer is not None and latency_out:
+            tracer.save(latency_out)
+        if leaderboard is not None:
+            leaderboard.close()
+        if telemetry is not None:
+            telemetry.close()
+            print(f"Telemetria: {telemetry.records} ticks em {telemetry.path}")
+        if spectators is not None:
+            print("Espectadores: {viewers} no fim, {bytes_per_s:.0f} B/s enviados, {packet_bytes:.1f} "
+                  "bytes por pacote ({keyframe_share:.0%} quadros-chave), RTT p50 {rtt_p50_ms:.0f} ms"
+                  " / p95 {rtt_p95_ms:.0f} ms".format(**spectators.report()))
+            spectators.close()
+        if view.dynamic:
+            print(f"Escala de renderização: {view.scale:.2f} no fim ({view.changes} trocas, "
+                  f"{view.reverted} desfeitas, pedida {view.max_scale:.2f})")
+        usage = frame_scheduler.report()
+        if usage:
+            print("CPU por estado: " + ", ".join(
+                f"{state} {r['cpu_s_per_min']:.1f} s/min ({r['wall_s']:.0f} s)"
+                for state, r in usage.items()))
+        loader.release()
+        profiler.close()
         pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Flappy Arms - Gym Edition")
+    parser.add_argument("--inference", choices=["inline", "process"], default="inline",
+                        help="onde rodar a detecção de pose (padrão: inline)")
+    parser.add_argument("--source", nargs="+", default=["0"],
+                        help="índice da webcam, vídeo, diretório de frames ou landmarks .npz "
+                             "(no multijogador: uma fonte repartida em faixas ou uma por jogador)")
+    parser.add_argument("--players", type=int, choices=range(1, MAX_PLAYERS + 1), default=1,
+                        help="jogadores na frente da câmera, cada um com o seu pássaro")
+    parser.add_argument("--camera-size", default="640x480",
+                        help="resolução pedida à câmera, LARGURAxALTURA")
+    parser.add_argument("--camera-fps", type=int, default=30, help="FPS pedido à câmera")
+    parser.add_argument("--camera-format", choices=["MJPG", "YUYV"], default="MJPG",
+                        help="formato de pixel preferido")
+    parser.add_argument("--profile-out", metavar="ARQUIVO",
+                        help="grava os tempos por etapa de cada frame (.csv ou .jsonl)")
+    parser.add_argument("--detector", choices=["pose", "motion"], default="pose",
+                        help="pose: MediaPipe Pose; motion: diferença de frames acima da linha "
+                             "dos ombros, sem MediaPipe (máquinas fracas)")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1, 2], default=1,
+                        help="modelo do MediaPipe Pose: 0 (lite), 1 (full), 2 (heavy)")
+    parser.add_argument("--inference-size", type=int, metavar="PIXELS",
+                        help="maior lado da imagem enviada ao MediaPipe (reduz antes de inferir)")
+    parser.add_argument("--roi", action="store_true",
+                        help="infere só na região dos braços rastreada do frame anterior")
+    parser.add_argument("--record-landmarks", metavar="ARQUIVO.npz",
+                        help="grava os landmarks usados na detecção, com timestamps")
+    parser.add_argument("--cpu-budget", type=float, metavar="FRAÇÃO",
+                        help="limita a inferência inline a esta fração de um núcleo (ex.: 0.5), "
+                             "prevendo os landmarks entre inferências")
+    parser.add_argument("--gesture", action="store_true",
+                        help="dispara o flap no início do movimento do braço (velocidade do pulso)")
+    parser.add_argument("--idle-after", type=float, default=15.0, metavar="SEGUNDOS",
+                        help="sem entrada por este tempo, menu e game over caem para 5 FPS e "
+                             "pausam a câmera (0 desliga)")
+    parser.add_argument("--full-redraw", action="store_true",
+                        help="sempre redesenha e envia a tela inteira (sem regiões sujas)")
+    parser.add_argument("--latency-trace", action="store_true",
+                        help="mede a latência do braço capturado até o flip que mostra o flap e "
+                             "imprime o histograma da sessão")
+    parser.add_argument("--latency-out", metavar="ARQUIVO.csv",
+                        help="grava a latência de cada flap (liga --latency-trace)")
+    parser.add_argument("--telemetry-dir", metavar="DIRETÓRIO",
+                        help="grava um registro binário por tick da partida (um arquivo .tlm "
+                             "por sessão; só no modo de um jogador)")
+    parser.add_argument("--scores-db", default=default_path(), metavar="ARQUIVO",
+                        help="banco SQLite do placar persistente (padrão: pasta de dados do "
+                             "usuário; vazio desliga)")
+    parser.add_argument("--player", nargs="+", default=[], metavar="NOME",
+                        help="nome de cada jogador no placar (padrão: guest, ou P1, P2...)")
+    parser.add_argument("--spectate", metavar="HOST:PORTA",
+                        help="transmite a partida por UDP para spectator_viewer.py (ex.: "
+                             "0.0.0.0:5005; só no modo de um jogador)")
+    parser.add_argument("--ghost", action="store_true",
+                        help="joga contra o fantasma da melhor partida (mesma semente, mesmos canos)")
+    parser.add_argument("--render-scale", type=float, default=1.0, metavar="FRAÇÃO",
+                        help="desenha as telas de jogo nesta fração da resolução da janela e "
+                             "amplia (ex.: 0.5)")
+    parser.add_argument("--dynamic-scale", action="store_true",
+                        help="reduz a escala de renderização sozinho quando o frame passa do "
+                             "orçamento de 1/60 s (e volta quando sobra tempo)")
+    parser.add_argument("--fast", action="store_true",
+                        help="reproduz a fonte gravada o mais rápido possível, sem limite de FPS")
+    args = parser.parse_args()
+    sources = [int(source) if source.isdigit() else source for source in args.source]
+    if args.players == 1 and len(sources) > 1:
+        parser.error("várias fontes só no modo multijogador (--players)")
+    if args.players > 1 and len(sources) not in (1, args.players):
+        parser.error(f"--players {args.players} precisa de uma fonte ou de {args.players}")
+    if args.players > 1 and (args.record_landmarks or args.cpu_budget or args.telemetry_dir
+                             or args.spectate):
+        parser.error("--record-landmarks, --cpu-budget, --telemetry-dir e --spectate não valem "
+                     "no modo multijogador")
+    if args.detector == "motion" and (args.players > 1 or args.inference == "process"
+                                      or args.gesture or args.record_landmarks
+                                      or args.cpu_budget):
+        parser.error("--detector motion roda no loop do jogo, com um jogador e sem --gesture, "
+                     "--record-landmarks ou --cpu-budget")
+    if not 0.25 <= args.render_scale <= 1.0:
+        parser.error("--render-scale precisa estar entre 0.25 e 1")
+    main(inference=args.inference,
+         profile_out=args.profile_out,
+         fast=args.fast,
+         idle_after=args.idle_after,
+         full_redraw=args.full_redraw,
+         players=args.players,
+         latency_trace=args.latency_trace,
+         latency_out=args.latency_out,
+         telemetry_dir=args.telemetry_dir,
+         scores_db=args.scores_db or None,
+         player_names=args.player,
+         ghost=args.ghost,
+         render_scale=args.render_scale,
+         dynamic_scale=args.dynamic_scale,
+         spectate=parse_address(args.spectate, "0.0.0.0") if args.spectate else None,
+         source=sources if args.players > 1 else sources[0],
+         record_landmarks=args.record_landmarks,
+         model_complexity=args.model_complexity,
+         inference_size=args.inference_size,
+         roi=args.roi,
+         cpu_budget=args.cpu_budget,
+         gesture=args.gesture,
+         detector=args.detector,
+         camera_size=tuple(int(v) for v in args.camera_size.lower().split("x")),
+         camera_fps=args.camera_fps,
+         camera_format=args.camera_format)
@@ -0,0 +1,121 @@
+"""Agendamento de frames com economia de energia (quiosque ligado o dia todo).
+
+- Regiões sujas: as telas marcam só o que mudou (``mark``) e ``present``
+  manda esses retângulos para ``pygame.display.update``; ``mark_all`` (troca
+  de tela, jogo, entrada) volta ao ``flip`` completo. Sem nada marcado, o
+  frame não toca no display.
+- Ocioso: sem entrada por ``idle_after`` segundos, ``fps`` cai para
+  ``idle_fps``; qualquer evento (``input``) volta à taxa ativa no mesmo frame.
+- Contabilidade: tempo de CPU (``time.process_time`` do jogo mais, se
+  houver, o do processo de inferência) e tempo de relógio por estado, para
+  relatar segundos de CPU por minuto em cada um.
+"""
+
+import time
+
+import pygame
+
+
+class FrameScheduler:
+    """Apresenta os frames (completos ou por regiões) e mede a CPU por estado"""
+
+    def __init__(self, clock, idle_fps=5, idle_after=15.0, partial=True, extra_cpu=None):
+        self.clock = clock
+        self.idle_fps = idle_fps
+        # Segundos sem entrada até ficar ocioso (0 = nunca)
+        self.idle_after = idle_after
+        # False: sempre flip completo (comportamento original)
+        self.partial = partial
+        # Função que retorna a CPU (s) gasta fora deste processo (ex.: worker de pose)
+        self.extra_cpu = extra_cpu
+        self.state = None
+        self.last_input = time.monotonic()
+        self._dirty = []
+        self._full = True
+        # estado -> [CPU (s), relógio (s)]
+        self._totals = {}
+        self._mark = None
+        # time.monotonic logo depois do último flip/update (fim da latência de entrada)
+        self.presented_at = None
+
+    # ---------- Estados e CPU ----------
+
+    def _cpu_now(self):
+        cpu = time.process_time()
+        if self.extra_cpu is not None:
+            cpu += self.extra_cpu()
+        return cpu
+
+    def _account(self):
+        now = (self._cpu_now(), time.monotonic())
+        if self.state is not None and self._mark is not None:
+            totals = self._totals.setdefault(self.state, [0.0, 0.0])
+            totals[0] += now[0] - self._mark[0]
+            totals[1] += now[1] - self._mark[1]
+        self._mark = now
+
+    def enter(self, state):
+        """Passa a contabilizar ``state``; a primeira apresentação é completa"""
+        if state == self.state:
+            return
+        self._account()
+        self.state = state
+        self._full = True
+
+    def report(self):
+        """Por estado: segundos de CPU por minuto, % de um núcleo e tempo no estado"""
+        self._account()
+        report = {}
+        for state, (cpu, wall) in self._totals.items():
+            if wall > 0:
+                report[state] = {"cpu_s_per_min": cpu / wall * 60,
+                                 "cpu_percent": cpu / wall * 100,
+                                 "wall_s": wall}
+        return report
+
+    # ---------- Entrada e ociosidade ----------
+
+    def input(self):
+        """Registra entrada do usuário (sai do modo ocioso na hora)"""
+        self.last_input = time.monotonic()
+
+    def idle(self):
+        return self.idle_after > 0 and time.monotonic() - self.last_input >= self.idle_after
+
+    def fps(self, active_fps):
+        """Taxa do próximo frame: ``active_fps`` ou a taxa ociosa"""
+        return self.idle_fps if self.idle() else active_fps
+
+    # ---------- Regiões sujas ----------
+
+    def mark(self, rect):
+        """Marca uma região da tela como alterada neste frame"""
+        if not self._full:
+            self._dirty.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        self._full = True
+
+    def needs_full(self):
+        """True se o próximo frame precisa ser desenhado inteiro"""
+        return self._full or not self.partial
+
+    def present(self):
+        """Envia ao display o que foi marcado; retorna o número de pixels atualizados"""
+        if self.needs_full():
+            pygame.display.flip()
+            width, height = pygame.display.get_surface().get_size()
+            pixels = width * height
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+            pixels = sum(rect.width * rect.height for rect in self._dirty)
+        else:
+            pixels = 0
+        self.presented_at = time.monotonic()
+        self._dirty = []
+        self._full = False
+        return pixels
+
+    def wait(self, fps):
+        """Espera o próximo frame (``clock.tick``); retorna os ms decorridos"""
+        return self.clock.tick(fps)
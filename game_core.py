@@ -0,0 +1,335 @@
+"""Lógica do jogo sem pygame: física, colisão, pontuação e passo fixo.
+
+Pode ser importado sem abrir janela. O ``GameEngine`` avança o estado em
+ticks de duração fixa (``TICK_RATE``), independentemente da taxa de
+renderização, e expõe um fator de interpolação para desenhar entre dois
+ticks.
+"""
+
+import random
+
+# Configurações da tela (tamanho do mundo do jogo)
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+
+# Configurações do jogo (por tick)
+GRAVITY = 0.5
+FLAP_STRENGTH = -10
+PIPE_WIDTH = 70
+PIPE_GAP = 200
+PIPE_SPEED = 3
+BIRD_SIZE = 90
+
+# Passo fixo da simulação
+TICK_RATE = 60
+# Máximo de tempo simulado por frame (evita a espiral de recuperação após travadas longas)
+MAX_FRAME_TIME = 0.25
+
+# Um novo cano entra quando o último passa deste x (canos a cada 300 px)
+PIPE_SPAWN_X = SCREEN_WIDTH - 300
+
+# Canos simultâneos (um a cada 300 px: no máximo 5 vivos com a tela de 1200 px)
+PIPE_CAPACITY = 8
+
+
+class Bird:
+    def __init__(self):
+        self.x = 100
+        self.y = SCREEN_HEIGHT // 2
+        self.prev_y = self.y
+        self.velocity = 0
+        self.size = BIRD_SIZE
+        # Maior y possível (calculado uma vez: ints acima de 256 são alocados a cada conta)
+        self.max_y = SCREEN_HEIGHT - self.size
+        # Extremos do retângulo do pássaro (x é fixo; topo/base seguem y a cada tick)
+        self.left = int(self.x - self.size // 2)
+        self.right = self.left + self.size
+        self._update_extents()
+
+    def _update_extents(self):
+        # Em float (sem criar ints a cada tick); GameEngine.step arredonda como o pygame.Rect
+        self.top = self.y - self.size // 2
+        self.bottom = self.top + self.size
+
+    def flap(self):
+        self.velocity = FLAP_STRENGTH
+
+    def update(self):
+        self.prev_y = self.y
+        self.velocity += GRAVITY
+        self.y += self.velocity
+
+        # Limites da tela
+        if self.y < 0:
+            self.y = 0
+            self.velocity = 0
+        if self.y > self.max_y:
+            self.y = self.max_y
+            self.velocity = 0
+        self._update_extents()
+
+    def interpolated_y(self, alpha):
+        return self.prev_y + (self.y - self.prev_y) * alpha
+
+    def bounds(self):
+        """(esquerda, topo, tamanho) do retângulo do pássaro, como no pygame.Rect"""
+        return int(self.x - self.size // 2), int(self.y - self.size // 2), self.size
+
+
+class Pipe:
+    __slots__ = ("x", "prev_x", "gap_y", "gap_bottom", "width", "scored")
+
+    def __init__(self, x, rng=random):
+        self.width = PIPE_WIDTH
+        self.respawn(x, rng)
+
+    def respawn(self, x, rng=random):
+        """Reinicia o cano na posição ``x`` (reaproveitado pelo PipeRing)"""
+        # Posição em float: os valores são os mesmos, mas avançar não aloca ints novos
+        self.x = float(x)
+        self.prev_x = self.x
+        self.gap_y = rng.randint(150, SCREEN_HEIGHT - PIPE_GAP - 150)
+        self.gap_bottom = self.gap_y + PIPE_GAP
+        self.scored = False
+
+    def update(self):
+        self.prev_x = self.x
+        self.x -= PIPE_SPEED
+
+    def interpolated_x(self, alpha):
+        return self.prev_x + (self.x - self.prev_x) * alpha
+
+    def collides_with(self, bird):
+        """Mesma regra do pygame.Rect.colliderect, sem criar retângulos"""
+        left, top, size = bird.bounds()
+        if not (left < self.x + self.width and self.x < left + size):
+            return False
+        # Cano superior (0 .. gap_y) ou inferior (gap_y + PIPE_GAP .. fundo)
+        return top < self.gap_y or top + size > self.gap_y + PIPE_GAP
+
+    def is_off_screen(self):
+        return self.x + self.width < 0
+
+
+class PipeRing:
+    """Canos ativos em um anel de capacidade fixa, do mais antigo ao mais novo.
+
+    Cada posição recebe um objeto na primeira vez em que é usada; depois os
+    canos são reaproveitados com ``respawn``, sem alocar durante a partida.
+    """
+
+    def __init__(self, factory, capacity=PIPE_CAPACITY):
+        self.factory = factory
+        self.capacity = capacity
+        self.slots = [None] * capacity
+        self.head = 0
+        self.count = 0
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def spawn(self, x, rng):
+        if self.count == self.capacity:
+            self.pop_oldest()
+        index = (self.head + self.count) % self.capacity
+        pipe = self.slots[index]
+        if pipe is None:
+            pipe = self.slots[index] = self.factory(x, rng)
+        else:
+            pipe.respawn(x, rng)
+        self.count += 1
+        return pipe
+
+    def pop_oldest(self):
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("índice de cano fora do anel")
+        return self.slots[(self.head + i) % self.capacity]
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.slots[(self.head + i) % self.capacity]
+
+
+class GameEngine:
+    """Estado de uma partida avançado em passo fixo, sem depender de display"""
+
+    def __init__(self, bird_factory=Bird, pipe_factory=Pipe, rng=random, tick_rate=TICK_RATE,
+                 seed=None):
+        self.bird_factory = bird_factory
+        self.pipe_factory = pipe_factory
+        # Com ``seed`` a partida é reproduzível: os vãos saem de um gerador só dela
+        self.seed = seed
+        self.rng = random.Random(seed) if seed is not None else rng
+        self.dt = 1.0 / tick_rate
+        self.pipes = PipeRing(pipe_factory)
+        # Chamado com o engine depois de cada tick (ex.: telemetria); None = nada
+        self.on_tick = None
+        self.reset()
+
+    def reset(self):
+        self.bird = self.bird_factory()
+        self.pipes.clear()
+        self.pipes.spawn(SCREEN_WIDTH + 200, self.rng)
+        self.score = 0
+        # Contador em float: incrementar um int acima de 256 alocaria um objeto por tick
+        self._ticks = 0.0
+        self.game_over = False
+        self._flap_pending = False
+        # Se o último tick aplicou um flap
+        self.flapped = False
+        # Ticks em que cada flap foi aplicado (a entrada da partida, para replay)
+        self.flap_ticks = []
+        self._accumulator = 0.0
+
+    @property
+    def tick(self):
+        """Ticks simulados desde o início da partida"""
+        return int(self._ticks)
+
+    def flap(self):
+        """Agenda um flap para o próximo tick (e o grava na entrada da partida)"""
+        if not self._flap_pending and not self.game_over:
+            self.flap_ticks.append(int(self._ticks) + 1)
+        self._flap_pending = True
+
+    def step(self):
+        """Avança exatamente um tick"""
+        if self.game_over:
+            return
+        self._ticks += 1.0
+        bird = self.bird
+
+        flapped = self.flapped = self._flap_pending
+        if flapped:
+            self._flap_pending = False
+            bird.flap()
+
+        bird.update()
+        left, right, top, bottom = bird.left, bird.right, bird.top, bird.bottom
+
+        # Percorre o anel direto (sem iterador nem range), do cano mais antigo ao mais novo
+        pipes = self.pipes
+        slots, capacity = pipes.slots, pipes.capacity
+        index = pipes.head
+        remaining = pipes.count
+        while remaining:
+            remaining -= 1
+            pipe = slots[index]
+            index = (index + 1) % capacity
+            pipe.update()
+            x = pipe.x
+
+            # Verificar colisão (só canos que alcançam a faixa horizontal do pássaro).
+            # O pygame.Rect trunca o topo para inteiro: com o topo em float, a base
+            # só invade o cano inferior a partir de um pixel inteiro a mais
+            if x < right and left < x + pipe.width:
+                if top < pipe.gap_y or bottom - 1 >= pipe.gap_bottom:
+                    self.game_over = True
+
+            # Pontuar
+            if not pipe.scored and x + pipe.width < bird.x:
+                pipe.scored = True
+                self.score += 1
+
+        # Remover canos fora da tela (sempre os mais antigos)
+        while pipes.count and pipes.slots[pipes.head].is_off_screen():
+            pipes.pop_oldest()
+
+        # Adicionar novos canos
+        if pipes.count == 0 or pipes[-1].x < PIPE_SPAWN_X:
+            pipes.spawn(SCREEN_WIDTH, self.rng)
+
+        # Verificar se o pássaro saiu da tela
+        if bird.y >= bird.max_y or bird.y <= 0:
+            self.game_over = True
+
+    def advance(self, elapsed):
+        """Consome ``elapsed`` segundos em ticks fixos; retorna o alfa de interpolação"""
+        self._accumulator += min(elapsed, MAX_FRAME_TIME)
+        while self._accumulator >= self.dt and not self.game_over:
+            self.step()
+            self._accumulator -= self.dt
+            if self.on_tick is not None:
+                self.on_tick(self)
+        if self.game_over:
+            return 1.0
+        return self._accumulator / self.dt
+
+
+class MultiGameEngine(GameEngine):
+    """Vários pássaros (um por jogador) no mesmo campo de canos.
+
+    Todos ficam no mesmo x, então um cano passa por todos no mesmo tick: cada
+    pássaro vivo pontua, e quem bate sai da rodada. A partida acaba quando
+    não sobra nenhum. ``score`` é o melhor placar, para o recorde.
+    """
+
+    def __init__(self, players, bird_factory=Bird, pipe_factory=Pipe, rng=random,
+                 tick_rate=TICK_RATE):
+        self.players = players
+        super().__init__(bird_factory, pipe_factory, rng, tick_rate)
+
+    def reset(self):
+        super().reset()
+        self.birds = [self.bird_factory() for _ in range(self.players)]
+        self.bird = self.birds[0]
+        self.scores = [0] * self.players
+        self.alive = [True] * self.players
+        self._flaps = [False] * self.players
+
+    def flap(self, player=0):
+        """Agenda um flap do jogador ``player`` para o próximo tick"""
+        self._flaps[player] = True
+
+    def step(self):
+        """Avança exatamente um tick"""
+        if self.game_over:
+            return
+        self._ticks += 1.0
+        birds, alive = self.birds, self.alive
+
+        # Telemetria: só o pássaro do jogador 1
+        self.flapped = alive[0] and self._flaps[0]
+        for i, bird in enumerate(birds):
+            if alive[i]:
+                if self._flaps[i]:
+                    bird.flap()
+                bird.update()
+            self._flaps[i] = False
+
+        for pipe in self.pipes:
+            pipe.update()
+            for i, bird in enumerate(birds):
+                if alive[i] and pipe.collides_with(bird):
+                    alive[i] = False
+            # Pontuar (todos os pássaros têm o mesmo x)
+            if not pipe.scored and pipe.x + pipe.width < birds[0].x:
+                pipe.scored = True
+                for i in range(self.players):
+                    if alive[i]:
+                        self.scores[i] += 1
+
+        # Remover canos fora da tela e adicionar novos
+        pipes = self.pipes
+        while pipes.count and pipes[0].is_off_screen():
+            pipes.pop_oldest()
+        if pipes.count == 0 or pipes[-1].x < PIPE_SPAWN_X:
+            pipes.spawn(SCREEN_WIDTH, self.rng)
+
+        # Pássaros que saíram da tela
+        for i, bird in enumerate(birds):
+            if alive[i] and (bird.y >= bird.max_y or bird.y <= 0):
+                alive[i] = False
+
+        self.score = max(self.scores)
+        self.game_over = not any(alive)
@@ -0,0 +1,107 @@
+"""Detecção de flap no início do movimento, sobre um anel de landmarks recentes.
+
+O limiar de um frame só (pulso acima do ombro) dispara quando o braço já
+cruzou a linha. O ``GestureEngine`` guarda os últimos ombros/pulsos com
+timestamps em arrays NumPy de tamanho fixo e ajusta, de uma vez para os dois
+pulsos, uma parábola à altura do pulso em relação ao ombro nas últimas
+amostras: a derivada dá a velocidade para cima e a curvatura, a aceleração.
+O flap dispara quando um pulso começa a subir rápido, com histerese (só
+rearma depois que o braço para de subir e está abaixo da linha) e período
+refratário. O cruzamento da linha continua disparando, para subidas lentas.
+"""
+
+import numpy as np
+
+from pose_detector import arms_raised
+
+
+class GestureEngine:
+    """Flap por velocidade/aceleração do pulso, alimentado a cada frame"""
+
+    def __init__(self, capacity=32, window=7, onset_velocity=1.2, release_velocity=0.2,
+                 min_rise=0.04, refractory=0.2):
+        self.capacity = capacity
+        # Amostras usadas no ajuste (velocidade e aceleração)
+        self.window = window
+        # Velocidade para cima (alturas normalizadas por segundo) que dispara o flap
+        self.onset_velocity = onset_velocity
+        # Abaixo desta velocidade (e com o braço abaixo da linha) o gesto rearma
+        self.release_velocity = release_velocity
+        # Subida mínima do pulso dentro da janela: o ajuste sozinho extrapola
+        # demais no fim da descida (curvatura positiva com velocidade perto de zero)
+        self.min_rise = min_rise
+        # Tempo mínimo (s) entre dois flaps
+        self.refractory = refractory
+        self.times = np.zeros(capacity)
+        self.landmarks = np.zeros((capacity, 4, 2))
+        self.velocity = np.zeros(2)
+        self.acceleration = np.zeros(2)
+        self.rise = np.zeros(2)
+        self.armed = True
+        self.raised = False
+        self.last_flap = None
+        self.onset_flaps = 0
+        self._head = 0
+        self._count = 0
+
+    def reset(self):
+        """Esquece o histórico (ex.: pose perdida)"""
+        self._count = 0
+        self.velocity[:] = 0
+        self.acceleration[:] = 0
+        self.rise[:] = 0
+
+    def _recent(self):
+        """(tempos, alturas dos pulsos acima dos ombros) das últimas ``window`` amostras"""
+        n = min(self._count, self.window)
+        index = (self._head - n + np.arange(n)) % self.capacity
+        times = self.times[index]
+        points = self.landmarks[index]
+        # Positivo = pulso acima do ombro do mesmo lado
+        heights = points[:, 0:2, 1] - points[:, 2:4, 1]
+        return times - times[-1], heights
+
+    def _update_motion(self):
+        times, heights = self._recent()
+        if len(times) < 3:
+            self.velocity[:] = 0
+            self.acceleration[:] = 0
+            self.rise[:] = 0
+            return
+        self.rise[:] = heights[-1] - heights.min(axis=0)
+        # h(t) = a t² + b t + c com t = 0 na amostra atual: velocidade b, aceleração 2a
+        a, b, _ = np.polyfit(times, heights, 2)
+        self.velocity[:] = b
+        self.acceleration[:] = 2 * a
+
+    def push(self, timestamp, landmarks):
+        """Adiciona a amostra do frame; retorna True se o flap deve disparar"""
+        if landmarks is None:
+            self.reset()
+            return False
+        if self._count and timestamp <= self.times[(self._head - 1) % self.capacity]:
+            return False
+        self.times[self._head] = timestamp
+        self.landmarks[self._head] = landmarks
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._update_motion()
+
+        raised = arms_raised(landmarks)
+        crossed = raised and not self.raised
+        self.raised = raised
+        rising = self.velocity.max()
+        if not self.armed:
+            if rising < self.release_velocity and not raised:
+                self.armed = True
+            return False
+        if self.last_flap is not None and timestamp - self.last_flap < self.refractory:
+            return False
+        onset = bool(((self.velocity >= self.onset_velocity) & (self.acceleration > 0) &
+                      (self.rise >= self.min_rise)).any())
+        if onset or crossed:
+            self.armed = False
+            self.last_flap = timestamp
+            self.onset_flaps += onset and not crossed
+            return True
+        return False
@@ -0,0 +1,323 @@
+"""Fontes de entrada alternativas à webcam, para benchmarks offline.
+
+- ``VideoFileSource``, ``FrameDirSource`` e ``SyntheticSource`` têm a mesma
+  interface da ``camera.Camera`` (``read``, ``wait_new``, ``pause``/``resume``,
+  ``release``) e podem
+  alimentar o ``PoseDetector`` ou o worker de inferência.
+- ``LandmarkRecorder`` grava os landmarks usados por ``detect_arms_raised``
+  (com timestamps) em um ``.npz`` compacto.
+- ``LandmarkReplayDetector`` reproduz essa gravação no lugar do detector,
+  sem câmera e sem MediaPipe.
+
+Com ``realtime=False`` cada leitura avança um frame/amostra, o mais rápido
+possível; com ``realtime=True`` a reprodução segue o relógio.
+"""
+
+import os
+import time
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+
+from camera import Camera
+from pose_detector import ArmDetector
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class _FileSource(ABC):
+    """Base das fontes gravadas: escolhe o frame por tempo ou sequencialmente.
+
+    As subclasses dizem como avançar (``_next_frame``) e voltar ao início
+    (``_rewind``); instanciar a base direto falha na construção.
+    """
+
+    def __init__(self, fps, realtime=True, loop=False):
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self.finished = False
+        self._frame = None
+        self._timestamp = None
+        self._frame_id = 0
+        self._index = -1
+        self._start = None
+        self._paused_at = None
+
+    @abstractmethod
+    def _next_frame(self, decode):
+        """Avança um frame; retorna (ok, frame), com frame None quando não decodificado"""
+
+    @abstractmethod
+    def _rewind(self):
+        """Volta ao primeiro frame (para ``loop``)"""
+
+    def _target_index(self):
+        if not self.realtime:
+            return self._index + 1
+        if self._start is None:
+            self._start = time.monotonic()
+        return int((time.monotonic() - self._start) * self.fps)
+
+    def read(self):
+        """Retorna (frame, timestamp, frame_id), no mesmo formato da Camera"""
+        target = self._target_index()
+        while self._index < target and not self.finished:
+            # Frames pulados (modo tempo real atrasado) não são decodificados
+            ok, frame = self._next_frame(decode=self._index + 1 == target)
+            if not ok:
+                if not self.loop:
+                    self.finished = True
+                    break
+                self._rewind()
+                self._index = -1
+                self._start = None
+                target = self._target_index()
+                continue
+            self._index += 1
+            if frame is not None:
+                self._frame = frame
+                self._timestamp = time.monotonic()
+                self._frame_id += 1
+        return self._frame, self._timestamp, self._frame_id
+
+    def wait_new(self, last_id, timeout=0.1):
+        deadline = time.monotonic() + timeout
+        while True:
+            frame, timestamp, frame_id = self.read()
+            if frame_id != last_id or self.finished or time.monotonic() >= deadline:
+                return frame, timestamp, frame_id
+            time.sleep(0.25 / self.fps)
+
+    def pause(self):
+        """Congela o relógio da reprodução (as leituras já são sob demanda)"""
+        if self._paused_at is None:
+            self._paused_at = time.monotonic()
+
+    def resume(self):
+        if self._paused_at is not None:
+            if self._start is not None:
+                self._start += time.monotonic() - self._paused_at
+            self._paused_at = None
+
+    def release(self):
+        pass
+
+
+class VideoFileSource(_FileSource):
+    """Frames de um arquivo de vídeo"""
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"não foi possível abrir o vídeo {path!r}")
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS) or 30, realtime, loop)
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def _next_frame(self, decode):
+        if decode:
+            return self.cap.read()
+        return self.cap.grab(), None
+
+    def _rewind(self):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        self.cap.release()
+
+
+class FrameDirSource(_FileSource):
+    """Frames de um diretório de imagens, em ordem alfabética"""
+
+    def __init__(self, path, fps=30, realtime=True, loop=False):
+        super().__init__(fps, realtime, loop)
+        self.paths = sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not self.paths:
+            raise IOError(f"nenhuma imagem em {path!r}")
+        first = cv2.imread(self.paths[0])
+        self.height, self.width = first.shape[:2]
+
+    def _next_frame(self, decode):
+        position = self._index + 1
+        if position >= len(self.paths):
+            return False, None
+        if not decode:
+            return True, None
+        return True, cv2.imread(self.paths[position])
+
+    def _rewind(self):
+        pass
+
+
+class SyntheticSource(_FileSource):
+    """Frames gerados (bonecos com os braços subindo e descendo), sem arquivo nem câmera.
+
+    Com ``figures`` > 1 há um boneco por faixa vertical (multijogador), cada
+    um com o ciclo de braços defasado.
+    """
+
+    def __init__(self, width=640, height=480, fps=30, n_frames=None, period=1.0,
+                 realtime=True, loop=False, figures=1):
+        super().__init__(fps, realtime, loop)
+        self.width = width
+        self.height = height
+        self.n_frames = n_frames
+        # Duração (s) de um ciclo completo de braços abaixados -> levantados
+        self.period = period
+        self.figures = figures
+
+    def arms_up(self, index, figure=0):
+        """Se os braços do boneco ``figure`` estão levantados no frame ``index``"""
+        phase = index / self.fps + figure * self.period / (2 * self.figures)
+        return phase % self.period >= self.period / 2
+
+    def render(self, index):
+        h = self.height
+        w = self.width // self.figures
+        frame = np.full((h, self.width, 3), 90, dtype=np.uint8)
+        color = (200, 200, 200)
+        shoulder_y = int(h * 0.45)
+        for figure in range(self.figures):
+            cx = w * figure + w // 2
+            cv2.circle(frame, (cx, int(h * 0.3)), int(h * 0.07), color, -1)
+            cv2.line(frame, (cx, shoulder_y), (cx, int(h * 0.8)), color, int(w * 0.04))
+            cv2.line(frame, (cx - w // 10, shoulder_y), (cx + w // 10, shoulder_y), color, 8)
+            wrist_y = int(h * 0.2) if self.arms_up(index, figure) else int(h * 0.7)
+            for side in (-1, 1):
+                cv2.line(frame, (cx + side * w // 10, shoulder_y), (cx + side * w // 6, wrist_y),
+                         color, 10)
+        return frame
+
+    def _next_frame(self, decode):
+        position = self._index + 1
+        if self.n_frames is not None and position >= self.n_frames:
+            return False, None
+        if not decode:
+            return True, None
+        return True, self.render(position)
+
+    def _rewind(self):
+        pass
+
+
+def open_source(source=0, realtime=True, loop=False, width=640, height=480, fps=30,
+                fourcc="MJPG", figures=1):
+    """Abre a webcam (índice inteiro), ``"synthetic"``, um vídeo ou um diretório de frames.
+
+    ``figures`` é o número de bonecos da fonte sintética (um por faixa).
+    """
+    if isinstance(source, int) or str(source).isdigit():
+        return Camera(int(source), width, height, fps, fourcc)
+    if source == "synthetic":
+        return SyntheticSource(width, height, fps, realtime=realtime, loop=loop, figures=figures)
+    if os.path.isdir(source):
+        return FrameDirSource(source, fps, realtime, loop)
+    return VideoFileSource(source, realtime, loop)
+
+
+# ==================== LANDMARKS GRAVADOS ====================
+
+class LandmarkRecorder:
+    """Grava (timestamp, ombros e pulsos) de cada frame em um .npz compacto"""
+
+    def __init__(self, path):
+        self.path = path
+        self._times = []
+        self._landmarks = []
+
+    def record(self, timestamp, landmarks):
+        self._times.append(timestamp if timestamp is not None else time.monotonic())
+        # Frames sem pose ficam como NaN, para preservar o ritmo na reprodução
+        self._landmarks.append(landmarks if landmarks else ((np.nan, np.nan),) * 4)
+
+    def close(self):
+        if not self._times:
+            return
+        times = np.asarray(self._times, dtype=np.float64)
+        np.savez_compressed(self.path,
+                            time=times - times[0],
+                            landmarks=np.asarray(self._landmarks, dtype=np.float32))
+        self._times = []
+        self._landmarks = []
+
+
+def load_landmarks(path):
+    """Carrega uma gravação: (tempos em s, landmarks (N, 4, 2) com NaN sem pose)"""
+    with np.load(path) as data:
+        return data["time"], data["landmarks"]
+
+
+class LandmarkReplayDetector(ArmDetector):
+    """Detector que reproduz landmarks gravados, sem câmera nem MediaPipe"""
+
+    def __init__(self, path, realtime=True, loop=True, recorder=None, gesture=None):
+        super().__init__(recorder, gesture)
+        self.times, self.samples = load_landmarks(path)
+        self.realtime = realtime
+        self.loop = loop
+        self.finished = False
+        self.index = -1
+        self._start = None
+        # Origem do relógio da gravação; avança a cada volta, para os tempos só crescerem
+        self._origin = None
+
+    def _next_landmarks(self):
+        """Landmarks da próxima amostra (por tempo ou sequencial), ou None"""
+        if self.realtime:
+            if self._start is None:
+                self._start = time.monotonic()
+            elapsed = time.monotonic() - self._start
+            if elapsed >= self.times[-1] + self._sample_interval():
+                # Passou da última amostra (mantida por um intervalo): fim da gravação
+                index = len(self.times)
+            else:
+                index = int(np.searchsorted(self.times, elapsed, side="right")) - 1
+                if index == self.index:
+                    return False, None
+        else:
+            index = self.index + 1
+        if self._origin is None:
+            self._origin = time.monotonic()
+        if index >= len(self.times):
+            if not self.loop:
+                self.finished = True
+                return False, None
+            length = self.times[-1] + self._sample_interval()
+            if self._start is not None:
+                # Próxima volta começa onde esta terminou (sem deriva do relógio)
+                self._start += length
+            self._origin += length
+            index = 0
+        self.index = index
+        # Tempo da amostra na gravação (velocidades corretas mesmo sem seguir o relógio)
+        self.capture_time = self._origin + float(self.times[index])
+        sample = self.samples[index]
+        if np.isnan(sample[0, 0]):
+            return True, None
+        return True, tuple((float(x), float(y)) for x, y in sample)
+
+    def _sample_interval(self):
+        if len(self.times) < 2:
+            return 1 / 30
+        return float(self.times[-1] - self.times[0]) / (len(self.times) - 1)
+
+    def calibrate(self):
+        """Calibra com a amostra atual da gravação"""
+        _, landmarks = self._next_landmarks()
+        if landmarks is None and self.index >= 0:
+            sample = self.samples[self.index]
+            if not np.isnan(sample[0, 0]):
+                landmarks = tuple((float(x), float(y)) for x, y in sample)
+        return self._calibrate_with(landmarks)
+
+    def detect_arms_raised(self):
+        is_new, landmarks = self._next_landmarks()
+        if not is_new:
+            return False, None
+        return self._flap_from(landmarks), None
+
+    def read_frame(self):
+        return None
@@ -0,0 +1,98 @@
+"""Latência de entrada até a tela: do braço capturado ao flip que mostra o flap.
+
+Cada flap carrega o timestamp de captura do frame que o disparou
+(``capture_time`` do detector, em ``time.monotonic``) e é carimbado em mais
+três pontos do loop do jogo::
+
+    captura -> flap visto pelo jogo -> tick que aplica o flap -> flip
+
+O total se divide em inferência, espera até o jogo ver o resultado (buffer
+da câmera, fila do worker, frame em andamento), espera pelo tick da física e
+desenho + flip. O flip é o último ponto que o jogo enxerga; a varredura do
+monitor fica fora da conta.
+"""
+
+import csv
+
+import numpy as np
+
+# Colunas de cada amostra (ms, menos o timestamp de captura)
+FIELDS = ("capture_time", "total_ms", "inference_ms", "detect_wait_ms", "tick_wait_ms",
+          "render_ms")
+
+
+class LatencyTracer:
+    """Acompanha os flaps pendentes e acumula o histograma da sessão"""
+
+    def __init__(self, bin_ms=10, max_ms=500):
+        self.bin_ms = bin_ms
+        # Último balde: tudo acima de ``max_ms``
+        self.counts = np.zeros(max_ms // bin_ms + 1, dtype=np.int64)
+        self.samples = []
+        # [captura, inferência (ms), visto, tick em que foi agendado, aplicado]
+        self._pending = []
+
+    def flap(self, capture_time, inference_ms, tick, now):
+        """Flap agendado no engine em ``tick``, vindo do frame capturado em ``capture_time``"""
+        if capture_time is not None:
+            self._pending.append([capture_time, inference_ms, now, tick, None])
+
+    def advanced(self, tick, now):
+        """Depois de ``advance``: marca os flaps que algum tick já aplicou"""
+        for pending in self._pending:
+            if pending[4] is None and tick > pending[3]:
+                pending[4] = now
+
+    def presented(self, flip_time):
+        """Depois do flip: fecha os flaps aplicados antes dele"""
+        if not self._pending:
+            return
+        waiting = []
+        for pending in self._pending:
+            capture, inference_ms, seen, _, applied = pending
+            if applied is None:
+                waiting.append(pending)
+                continue
+            total_ms = (flip_time - capture) * 1000
+            self.samples.append((capture, total_ms, inference_ms,
+                                 (seen - capture) * 1000 - inference_ms,
+                                 (applied - seen) * 1000, (flip_time - applied) * 1000))
+            self.counts[min(int(total_ms // self.bin_ms), len(self.counts) - 1)] += 1
+        self._pending = waiting
+
+    def discard(self):
+        """Esquece flaps que nunca chegaram à tela (fim da partida)"""
+        self._pending = []
+
+    def report(self):
+        """Percentis do total e média de cada parcela (ms), ou None sem amostras"""
+        if not self.samples:
+            return None
+        values = np.array(self.samples)[:, 1:]
+        p50, p95, p99 = np.percentile(values[:, 0], (50, 95, 99))
+        means = values.mean(axis=0)
+        return {"flaps": len(values), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99,
+                "max_ms": values[:, 0].max(), "inference_ms": means[1],
+                "detect_wait_ms": means[2], "tick_wait_ms": means[3], "render_ms": means[4]}
+
+    def histogram_lines(self, width=40):
+        """Histograma em texto, um balde por linha (só do primeiro ao último não vazio)"""
+        filled = np.flatnonzero(self.counts)
+        if not len(filled):
+            return []
+        peak = self.counts.max()
+        lines = []
+        for index in range(filled[0], filled[-1] + 1):
+            low = index * self.bin_ms
+            label = f">={low}" if index == len(self.counts) - 1 else f"{low}-{low + self.bin_ms}"
+            bar = "#" * int(round(self.counts[index] / peak * width))
+            lines.append(f"{label:>9} ms {self.counts[index]:>5} {bar}")
+        return lines
+
+    def save(self, path):
+        """Grava uma linha CSV por flap"""
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(FIELDS)
+            for sample in self.samples:
+                writer.writerow([round(value, 3) for value in sample])
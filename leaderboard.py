@@ -0,0 +1,207 @@
+"""Placar persistente do quiosque (SQLite em modo WAL).
+
+Cada partida vira uma linha (jogador, pontos, dia, horário e, se houver, a
+semente e os flaps gravados, para auditar o recorde ou correr contra o
+fantasma; veja ``replay``). Os top-N geral,
+do dia e por jogador saem de índices que já estão na ordem da consulta, então
+custam poucas páginas mesmo com milhões de linhas.
+
+Gravações nunca bloqueiam a tela: ``submit`` só enfileira, e uma thread
+grava em lote (uma transação por lote) na sua própria conexão. Leituras usam
+outra conexão (o WAL deixa ler enquanto a thread grava) e ficam em cache;
+``version`` sobe a cada lote gravado, o que invalida o cache. Um lote que
+o SQLite recusa (banco travado, disco cheio, só leitura) é descartado com um
+aviso; a thread continua e ``flush`` não trava.
+
+Sem caminho explícito, o banco fica na pasta de dados do usuário
+(``default_path``), não no diretório atual.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from replay import Run, decode_flaps, encode_flaps
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    seed INTEGER,
+    ticks INTEGER,
+    flaps BLOB
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_day ON scores (day, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player, score DESC);
+"""
+
+# Consultas por escopo: (SQL, parâmetros a partir de player/day)
+QUERIES = {
+    "global": "SELECT player, score, played_at FROM scores ORDER BY score DESC LIMIT ?",
+    "daily": "SELECT player, score, played_at FROM scores WHERE day = ? "
+             "ORDER BY score DESC LIMIT ?",
+    "player": "SELECT player, score, played_at FROM scores WHERE player = ? "
+              "ORDER BY score DESC LIMIT ?",
+}
+
+# Colunas da partida gravada (bancos criados antes delas ganham um ALTER TABLE)
+RUN_COLUMNS = (("seed", "INTEGER"), ("ticks", "INTEGER"), ("flaps", "BLOB"))
+
+DEFAULT_PLAYER = "guest"
+
+
+def default_path():
+    """Banco padrão na pasta de dados do usuário (XDG_DATA_HOME, %APPDATA% no Windows)"""
+    base = os.environ.get("XDG_DATA_HOME") or os.environ.get("APPDATA") \
+        or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "flappy-arms", "scores.db")
+
+
+def day_of(timestamp):
+    """Dia local (AAAA-MM-DD) de um timestamp"""
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+def _connect(path):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # Com WAL, NORMAL só arrisca a última transação numa queda de energia
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class ScoreStore:
+    """Pontuações em SQLite, gravadas em lote numa thread e lidas com cache"""
+
+    def __init__(self, path, batch_size=512):
+        self.path = path
+        self.batch_size = batch_size
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        writer = _connect(path)
+        writer.executescript(SCHEMA)
+        columns = {row[1] for row in writer.execute("PRAGMA table_info(scores)")}
+        with writer:
+            for name, kind in RUN_COLUMNS:
+                if name not in columns:
+                    writer.execute(f"ALTER TABLE scores ADD COLUMN {name} {kind}")
+        self._reader = _connect(path)
+        self._queue = queue.Queue()
+        # Sobe a cada lote gravado; entradas do cache de outra versão são velhas
+        self.version = 0
+        self._cache = {}
+        # Pontuações descartadas porque o SQLite recusou o lote, e o último erro
+        self.dropped = 0
+        self.error = None
+        self._thread = threading.Thread(target=self._write_loop, args=(writer,),
+                                        name="score-writer", daemon=True)
+        self._thread.start()
+
+    # ---------- Gravação ----------
+
+    def submit(self, score, player=None, played_at=None, run=None):
+        """Enfileira uma pontuação, com a partida gravada (``Run``) se houver; retorna na hora"""
+        played_at = time.time() if played_at is None else played_at
+        if run is not None:
+            recording = (run.seed, run.ticks, encode_flaps(run.flap_ticks))
+        else:
+            recording = (None, None, None)
+        self._queue.put((player or DEFAULT_PLAYER, int(score), day_of(played_at), played_at)
+                        + recording)
+
+    def _write_loop(self, connection):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            stop = False
+            # Junta o que já estiver na fila (rajadas viram uma transação só)
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO scores (player, score, day, played_at, seed, ticks, flaps) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        batch)
+                self.version += 1
+            except sqlite3.Error as exc:
+                # Lote perdido, mas a thread segue: o próximo pode entrar (ex.: banco travado)
+                self.dropped += len(batch)
+                self.error = exc
+                print(f"Aviso: placar não gravou {len(batch)} pontuação(ões) em {self.path}: {exc}")
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                break
+        connection.close()
+
+    def flush(self):
+        """Espera a fila ser gravada (benchmarks; o jogo não precisa)"""
+        self._queue.join()
+
+    # ---------- Leitura ----------
+
+    @staticmethod
+    def _params(n, scope, player, day):
+        if scope == "daily":
+            return (day or day_of(time.time()), n)
+        if scope == "player":
+            return (player or DEFAULT_PLAYER, n)
+        return (n,)
+
+    def query(self, n=10, scope="global", player=None, day=None):
+        """Top-N direto do banco, sem cache"""
+        return self._reader.execute(QUERIES[scope], self._params(n, scope, player, day)).fetchall()
+
+    def top(self, n=10, scope="global", player=None, day=None):
+        """[(jogador, pontos, horário)] em ordem decrescente, do cache quando possível"""
+        key = (scope,) + self._params(n, scope, player, day)
+        cached = self._cache.get(key)
+        version = self.version
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = self.query(n, scope, player, day)
+        self._cache[key] = (version, rows)
+        return rows
+
+    def best(self, player=None):
+        """Maior pontuação (geral ou do jogador), 0 sem partidas"""
+        rows = self.top(1, "player", player) if player else self.top(1)
+        return rows[0][1] if rows else 0
+
+    def runs(self, n=10):
+        """As ``n`` melhores partidas gravadas: [(id, jogador, Run)]"""
+        rows = self._reader.execute(
+            "SELECT id, player, seed, ticks, score, flaps FROM scores "
+            "WHERE flaps IS NOT NULL ORDER BY score DESC LIMIT ?", (n,)).fetchall()
+        return [(row_id, player, Run(seed, decode_flaps(flaps), ticks, score))
+                for row_id, player, seed, ticks, score, flaps in rows]
+
+    def best_run(self):
+        """A melhor partida gravada (``Run``), ou None"""
+        runs = self.runs(1)
+        return runs[0][2] if runs else None
+
+    def close(self):
+        """Grava o que falta e fecha as conexões"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._reader.close()
@@ -0,0 +1,167 @@
+"""Detector de braços levantados por movimento, sem MediaPipe (máquinas fracas).
+
+Trabalha num frame cinza reduzido (cerca de ``DETECT_WIDTH`` pixels de largura). Na
+calibração, com o jogador parado e de braços abaixados, guarda esse frame como
+referência e estima a linha dos ombros pela borda horizontal mais forte no
+centro da imagem. Depois, em cada frame novo, compara as duas regiões acima
+dos ombros (uma de cada lado da cabeça) com a referência: um braço que sobe
+entra numa delas e a fração de pixels diferentes passa de ``RAISE_FRACTION``.
+O flap é essa transição, como no ``PoseDetector``. Enquanto os braços estão
+abaixados a referência acompanha devagar a luz e pequenos movimentos do corpo.
+
+Diferenciar contra a referência, e não contra o frame anterior, dá o estado
+(levantado ou não) em vez de só "houve movimento": abaixar o braço também
+mexe os pixels, mas não dispara flap.
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from pose_detector import RAISE_MARGIN, CameraDetector
+from profiler import profiler
+
+# Largura (px) aproximada do frame cinza analisado (640, 1280 e 1920 dividem por inteiro)
+DETECT_WIDTH = 80
+# Diferença de cinza (0-255) a partir da qual um pixel conta como mudado
+DIFF_THRESHOLD = 30
+# Fração de pixels mudados numa região para o braço contar como levantado (e para soltar)
+RAISE_FRACTION = 0.05
+RELEASE_FRACTION = 0.025
+# Peso de cada frame na referência enquanto os braços estão abaixados
+BACKGROUND_RATE = 0.05
+# Borda dos ombros: contraste mínimo (vs. média da imagem) e posição padrão sem borda
+EDGE_CONTRAST = 2.0
+DEFAULT_SHOULDERS = (0.45, 0.5, 0.3)
+
+
+def find_shoulders(gray):
+    """(altura da linha dos ombros, centro, largura dos ombros), em frações da imagem.
+
+    Procura a linha com mais borda horizontal na faixa central (ombros contra
+    o fundo); sem uma borda clara, volta a ``DEFAULT_SHOULDERS``.
+    """
+    height, width = gray.shape
+    edges = np.abs(cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3))
+    top, bottom = int(height * 0.25), int(height * 0.7)
+    profile = edges[top:bottom, width // 4:3 * width // 4].mean(axis=1)
+    row = int(np.argmax(profile))
+    if profile[row] < EDGE_CONTRAST * (edges.mean() + 1e-6):
+        return DEFAULT_SHOULDERS
+    y = top + row
+    line = edges[max(y - 1, 0):y + 2].max(axis=0)
+    columns = np.flatnonzero(line > line.max() / 2)
+    center = float(columns[0] + columns[-1]) / 2 / width
+    shoulder_width = min(max(float(columns[-1] - columns[0]) / width, 0.15), 0.6)
+    return y / height, center, shoulder_width
+
+
+class MotionEstimator:
+    """Estado de braços levantados a partir de frames RGB, por diferença com a referência"""
+
+    def __init__(self, detect_width=DETECT_WIDTH):
+        self.detect_width = detect_width
+        self.shoulders = None
+        # Regiões acima dos ombros: (fatia de linhas, fatia de colunas) no frame reduzido
+        self.zones = ()
+        self.raised = False
+        # Fração de pixels mudados em cada região no último frame
+        self.fractions = ()
+        self.inference_ms = 0.0
+        self._full_gray = None
+        self._gray = None
+        self._reference = None
+        self._reference_u8 = None
+        self._diff = None
+
+    def _downscale(self, frame_rgb):
+        self._full_gray = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2GRAY, dst=self._full_gray)
+        height, width = self._full_gray.shape
+        # Fator inteiro: INTER_AREA tira a média de blocos inteiros (caminho rápido do OpenCV)
+        factor = max(width // self.detect_width, 1)
+        rows, columns = height // factor, width // factor
+        self._gray = cv2.resize(self._full_gray[:rows * factor, :columns * factor],
+                                (columns, rows), dst=self._gray, interpolation=cv2.INTER_AREA)
+        return self._gray
+
+    def calibrate(self, frame_rgb):
+        """Referência e regiões a partir de um frame com os braços abaixados"""
+        gray = self._downscale(frame_rgb)
+        height, width = gray.shape
+        shoulder_y, center, shoulder_width = find_shoulders(gray)
+        self.shoulders = (shoulder_y, center, shoulder_width)
+        # Do pulso RAISE_MARGIN acima dos ombros até uma largura de ombros mais alto
+        y1 = int((shoulder_y - RAISE_MARGIN) * height)
+        y0 = max(int((shoulder_y - RAISE_MARGIN - shoulder_width) * height), 0)
+        # De cada lado, da borda da cabeça (metade da largura dos ombros) até um ombro além
+        inner, outer = shoulder_width / 4, shoulder_width
+        self.zones = tuple(
+            (slice(y0, max(y1, y0 + 1)),
+             slice(max(int(x0 * width), 0), max(int(x1 * width), int(x0 * width) + 1)))
+            for x0, x1 in ((center - outer, center - inner), (center + inner, center + outer)))
+        self._reference = gray.astype(np.float32)
+        self._reference_u8 = gray.copy()
+        self._diff = np.empty_like(gray)
+        self.raised = False
+        return True
+
+    def process(self, frame_rgb):
+        """True se algum braço está nas regiões acima dos ombros"""
+        start = time.perf_counter()
+        gray = self._downscale(frame_rgb)
+        cv2.absdiff(gray, self._reference_u8, dst=self._diff)
+        limit = RELEASE_FRACTION if self.raised else RAISE_FRACTION
+        self.fractions = tuple(
+            np.count_nonzero(self._diff[rows, columns] > DIFF_THRESHOLD)
+            / self._diff[rows, columns].size
+            for rows, columns in self.zones)
+        self.raised = any(fraction > limit for fraction in self.fractions)
+        if not self.raised:
+            # Braços abaixados: a referência acompanha luz e pequenos movimentos
+            cv2.accumulateWeighted(gray, self._reference, BACKGROUND_RATE)
+            cv2.convertScaleAbs(self._reference, dst=self._reference_u8)
+        self.inference_ms = (time.perf_counter() - start) * 1000
+        return self.raised
+
+
+class MotionDetector(CameraDetector):
+    """Detector por movimento com a interface do ``PoseDetector`` (calibrate/detect_arms_raised)"""
+
+    def __init__(self, camera=None, detect_width=DETECT_WIDTH):
+        super().__init__(camera)
+        self.estimator = MotionEstimator(detect_width)
+
+    @property
+    def inference_ms(self):
+        """Duração da última análise do frame"""
+        return self.estimator.inference_ms
+
+    def calibrate(self):
+        """Guarda a referência (braços abaixados) e a linha dos ombros"""
+        frame_rgb = self._calibration_frame()
+        if frame_rgb is None:
+            return False
+        self.calibrated = self.estimator.calibrate(frame_rgb)
+        self.baseline_shoulder_y = self.estimator.shoulders[0]
+        self.last_raised = self.arms_raised = False
+        return self.calibrated
+
+    def detect_arms_raised(self):
+        """Detecta se os braços estão levantados; retorna (flap, frame RGB)"""
+        frame_rgb, is_new = self._latest_frame()
+        if frame_rgb is None:
+            return False, None
+        if not is_new or not self.calibrated:
+            return False, frame_rgb
+        with profiler.stage("pose"):
+            raised = self.estimator.process(frame_rgb)
+        # Só a transição de abaixado para levantado dispara o flap
+        flap_triggered = raised and not self.last_raised
+        self.last_raised = self.arms_raised = raised
+        return flap_triggered, frame_rgb
+
+    def warm_up(self, timeout=5.0):
+        """Espera o primeiro frame da câmera (não há modelo para carregar)"""
+        frame, _, _ = self.camera.wait_new(0, timeout)
+        return frame is not None
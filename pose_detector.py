@@ -0,0 +1,359 @@
+import time
+
+import cv2
+import numpy as np
+
+from camera import Camera
+from pose_governor import LandmarkPredictor
+from profiler import profiler
+
+# Margem (em coordenadas normalizadas) para considerar o pulso acima do ombro
+RAISE_MARGIN = 0.1
+
+# Ordem dos landmarks usados pelo jogo
+ARM_LANDMARKS = ("LEFT_SHOULDER", "RIGHT_SHOULDER", "LEFT_WRIST", "RIGHT_WRIST")
+
+
+def extract_arm_landmarks(results, mp_pose):
+    """Extrai (x, y) de ombros e pulsos na ordem de ARM_LANDMARKS, ou None"""
+    if not results.pose_landmarks:
+        return None
+    landmark = results.pose_landmarks.landmark
+    return tuple(
+        (landmark[mp_pose.PoseLandmark[name]].x, landmark[mp_pose.PoseLandmark[name]].y)
+        for name in ARM_LANDMARKS
+    )
+
+
+def arms_raised(landmarks):
+    """Verifica se algum pulso está acima do ombro correspondente"""
+    left_shoulder, right_shoulder, left_wrist, right_wrist = landmarks
+    left_raised = left_wrist[1] < left_shoulder[1] - RAISE_MARGIN
+    right_raised = right_wrist[1] < right_shoulder[1] - RAISE_MARGIN
+    return left_raised or right_raised
+
+
+def shoulder_line(landmarks):
+    """Altura média dos ombros"""
+    return (landmarks[0][1] + landmarks[1][1]) / 2
+
+
+class PoseEstimator:
+    """MediaPipe Pose, opcionalmente só na região dos braços e em resolução reduzida.
+
+    Com ``roi=True`` o recorte segue a caixa de ombros e pulsos do resultado
+    anterior (com margem para o braço subir); sem pose no frame anterior, volta
+    ao frame inteiro. O MediaPipe rastreia e suaviza os landmarks entre frames,
+    então o recorte fica parado enquanto os landmarks estão longe da borda e a
+    escala do corpo não muda, e só anda em passos de ``ROI_GRID`` pixels.
+    ``inference_size`` limita o maior lado da imagem enviada ao MediaPipe. Os
+    landmarks retornados estão sempre em coordenadas normalizadas do frame
+    inteiro.
+    """
+
+    # Fração do frame acima da qual o recorte não compensa
+    MAX_ROI_AREA = 0.8
+    # Os cantos do recorte ficam em múltiplos deste tamanho (px)
+    ROI_GRID = 32
+    # Um landmark a menos desta fração do recorte até a borda faz o recorte mudar
+    ROI_EDGE = 0.15
+    # Variação de largura (fração) do recorte calculado que faz o recorte mudar
+    ROI_RESCALE = 0.25
+
+    def __init__(self, model_complexity=1, inference_size=None, roi=False):
+        # Importado aqui: carregar o MediaPipe leva segundos e só o estimador precisa dele
+        import mediapipe as mp
+        self.mp_pose = mp.solutions.pose
+        self.pose = self.mp_pose.Pose(
+            model_complexity=model_complexity,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        self.model_complexity = model_complexity
+        self.inference_size = inference_size
+        self.use_roi = roi
+        # Recorte (x0, y0, x1, y1) em pixels usado na última inferência
+        self.roi = None
+        # Recorte estável em uso (None: frame inteiro) e quantas vezes mudou
+        self._box = None
+        self.roi_changes = 0
+        self.inference_ms = 0.0
+        self._last_landmarks = None
+
+    def _roi_box(self, width, height):
+        """Caixa da parte de cima do corpo a partir dos últimos landmarks, ou None"""
+        points = self._last_landmarks
+        if not self.use_roi or points is None:
+            self._box = None
+            return None
+        xs = [x * width for x, _ in points]
+        ys = [y * height for _, y in points]
+        # A largura dos ombros dá a escala do corpo na imagem
+        scale = max(abs(xs[0] - xs[1]), 0.1 * width)
+        grid = self.ROI_GRID
+        x0 = max(0, int(min(xs) - scale) // grid * grid)
+        x1 = min(width, -(-int(max(xs) + scale) // grid) * grid)
+        y0 = max(0, int(min(ys) - 1.5 * scale) // grid * grid)
+        y1 = min(height, -(-int(max(ys) + scale) // grid) * grid)
+        if x1 <= x0 or y1 <= y0 or (x1 - x0) * (y1 - y0) > self.MAX_ROI_AREA * width * height:
+            self._box = None
+            return None
+        box = self._box
+        new_box = (x0, y0, x1, y1)
+        if box == new_box or box is not None and self._keeps(box, xs, ys, x1 - x0,
+                                                             width, height):
+            return box
+        self._box = new_box
+        self.roi_changes += 1
+        return new_box
+
+    def _keeps(self, box, xs, ys, new_width, frame_width, frame_height):
+        """Se o recorte ``box`` ainda serve: landmarks longe das bordas e mesma escala.
+
+        Um lado colado na borda do frame não tem para onde crescer e não conta.
+        """
+        x0, y0, x1, y1 = box
+        if abs(new_width - (x1 - x0)) > self.ROI_RESCALE * (x1 - x0):
+            return False
+        margin_x = self.ROI_EDGE * (x1 - x0)
+        margin_y = self.ROI_EDGE * (y1 - y0)
+        return ((x0 == 0 or min(xs) >= x0 + margin_x)
+                and (x1 == frame_width or max(xs) <= x1 - margin_x)
+                and (y0 == 0 or min(ys) >= y0 + margin_y)
+                and (y1 == frame_height or max(ys) <= y1 - margin_y))
+
+    def process(self, frame_rgb):
+        """Landmarks de ombros e pulsos no frame inteiro, ou None"""
+        height, width = frame_rgb.shape[:2]
+        box = self._roi_box(width, height)
+        x0, y0, x1, y1 = box if box is not None else (0, 0, width, height)
+        image = frame_rgb[y0:y1, x0:x1] if box is not None else frame_rgb
+
+        crop_w, crop_h = x1 - x0, y1 - y0
+        if self.inference_size and max(crop_w, crop_h) > self.inference_size:
+            scale = self.inference_size / max(crop_w, crop_h)
+            image = cv2.resize(image, (max(1, int(crop_w * scale)), max(1, int(crop_h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        elif box is not None:
+            image = np.ascontiguousarray(image)
+
+        start = time.perf_counter()
+        results = self.pose.process(image)
+        self.inference_ms = (time.perf_counter() - start) * 1000
+        self.roi = (x0, y0, x1, y1)
+
+        landmarks = extract_arm_landmarks(results, self.mp_pose)
+        if landmarks is not None and box is not None:
+            # Do recorte de volta para o frame inteiro
+            landmarks = tuple(((x0 + x * crop_w) / width, (y0 + y * crop_h) / height)
+                              for x, y in landmarks)
+        self._last_landmarks = landmarks
+        return landmarks
+
+    def close(self):
+        self.pose.close()
+
+
+class ArmDetector:
+    """Estado comum aos detectores: calibração e transição para braços levantados.
+
+    As subclasses obtêm os landmarks (MediaPipe, gravação, ...) e chamam
+    ``_calibrate_with`` e ``_flap_from``. Com um ``gesture`` (GestureEngine), o
+    flap é decidido pelo movimento do pulso em vez do cruzamento da linha.
+    """
+
+    def __init__(self, recorder=None, gesture=None):
+        self.baseline_shoulder_y = None
+        self.calibrated = False
+        self.arms_raised = False
+        self.last_raised = False
+        self.capture_time = None
+        # Landmarks do último frame usado na detecção (ex.: telemetria)
+        self.landmarks = None
+        # Gravador opcional dos landmarks usados na detecção
+        self.recorder = recorder
+        self.gesture = gesture
+
+    def _calibrate_with(self, landmarks):
+        if not landmarks:
+            return False
+        # Pegar posição Y dos ombros
+        self.baseline_shoulder_y = shoulder_line(landmarks)
+        self.calibrated = True
+        return True
+
+    def _flap_from(self, landmarks, record=True):
+        """Atualiza o estado com os landmarks do frame e indica se houve flap"""
+        self.landmarks = landmarks
+        if record and self.recorder is not None:
+            self.recorder.record(self.capture_time, landmarks)
+
+        if self.gesture is not None and self.calibrated:
+            flap_triggered = self.gesture.push(self.capture_time, landmarks)
+            self.arms_raised = self.last_raised = self.gesture.raised
+            return flap_triggered
+
+        if landmarks and self.calibrated:
+            # Detectar apenas a transição de não-levantado para levantado
+            currently_raised = arms_raised(landmarks)
+            flap_triggered = currently_raised and not self.last_raised
+
+            self.last_raised = currently_raised
+            self.arms_raised = currently_raised
+            return flap_triggered
+        return False
+
+    def warm_up(self, timeout=5.0):
+        """Prepara a fonte antes do primeiro uso; retorna False se não ficou pronta"""
+        return True
+
+    def pause(self):
+        """Suspende captura e inferência nas telas que não usam a câmera"""
+
+    def resume(self):
+        """Retoma depois de ``pause``; o histórico do gesto ficou velho"""
+        if self.gesture is not None:
+            self.gesture.reset()
+
+    def worker_cpu_time(self):
+        """CPU (s) gasta fora do processo do jogo (só o detector em processo separado)"""
+        return 0.0
+
+    def release(self):
+        if self.recorder is not None:
+            self.recorder.close()
+
+
+class CameraDetector(ArmDetector):
+    """Detector que lê uma câmera (ou fonte gravada) no loop do jogo.
+
+    Cuida do frame RGB da pré-visualização, da pausa da captura e da espera
+    por um frame novo ao calibrar logo depois de retomar.
+    """
+
+    def __init__(self, camera=None, recorder=None, gesture=None):
+        super().__init__(recorder, gesture)
+        self.camera = camera if camera is not None else Camera(0)
+        self._frame_id = 0
+        # Frame RGB (sem espelhar) usado pela inferência e pela pré-visualização
+        self.frame_rgb = None
+        # Último frame da câmera antes de retomar: a calibração espera um mais novo
+        self._resume_id = None
+
+    def _latest_frame(self):
+        """Converte o frame mais recente para RGB; indica se ele ainda não foi processado"""
+        with profiler.stage("camera"):
+            frame, timestamp, frame_id = self.camera.read()
+            is_new = frame is not None and frame_id != self._frame_id
+            if is_new:
+                self._frame_id = frame_id
+                self.capture_time = timestamp
+                # Reaproveita o buffer RGB enquanto o tamanho do frame não muda
+                self.frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.frame_rgb)
+        return self.frame_rgb, is_new
+
+    def _calibration_frame(self):
+        """Frame RGB para calibrar (depois de uma pausa, um capturado após retomar)"""
+        if self._resume_id is not None and self._frame_id <= self._resume_id:
+            # Recém-retomada: o último frame é de antes da pausa
+            self.camera.wait_new(self._resume_id, timeout=0.5)
+        self._resume_id = None
+        return self._latest_frame()[0]
+
+    def read_frame(self):
+        """Frame RGB mais recente da câmera sem rodar a detecção"""
+        return self._latest_frame()[0]
+
+    def pause(self):
+        self.camera.pause()
+
+    def resume(self):
+        super().resume()
+        self._resume_id = self.camera.read()[2]
+        self.camera.resume()
+
+    def release(self):
+        super().release()
+        self.camera.release()
+
+
+class PoseDetector(CameraDetector):
+    def __init__(self, camera=None, recorder=None, model_complexity=1, inference_size=None,
+                 roi=False, governor=None, gesture=None):
+        super().__init__(camera, recorder, gesture)
+        self.estimator = PoseEstimator(model_complexity, inference_size, roi)
+        # Com governor, a inferência roda só em alguns frames e os demais usam a previsão
+        self.governor = governor
+        self.predictor = LandmarkPredictor() if governor is not None else None
+
+    @property
+    def inference_ms(self):
+        """Duração da última inferência do MediaPipe"""
+        return self.estimator.inference_ms
+
+    def _landmarks(self, frame_rgb):
+        with profiler.stage("pose"):
+            return self.estimator.process(frame_rgb)
+
+    def calibrate(self):
+        """Calibra a posição inicial dos ombros"""
+        frame_rgb = self._calibration_frame()
+        if frame_rgb is not None:
+            return self._calibrate_with(self._landmarks(frame_rgb))
+        return False
+
+    def detect_arms_raised(self):
+        """Detecta se os braços estão levantados; retorna (flap, frame RGB)"""
+        frame_rgb, is_new = self._latest_frame()
+        if frame_rgb is None:
+            return False, None
+        if not is_new:
+            # Nenhum frame novo desde o último tick: nada a inferir
+            return False, frame_rgb
+        if self.governor is not None:
+            return self._governed_flap(frame_rgb), frame_rgb
+
+        return self._flap_from(self._landmarks(frame_rgb)), frame_rgb
+
+    def _governed_flap(self, frame_rgb):
+        """Infere quando o governor permite; nos outros frames usa os landmarks previstos"""
+        now = self.capture_time
+        if self.governor.should_run(now):
+            cpu_start = time.process_time()
+            landmarks = self._landmarks(frame_rgb)
+            cpu_ms = (time.process_time() - cpu_start) * 1000
+            self.governor.record_run(now, self.inference_ms, cpu_ms)
+            self.predictor.update(now, landmarks)
+            flap = self._flap_from(landmarks)
+            # A medida real confirma (ou desmente) os flaps disparados pela previsão
+            self.governor.record_result(landmarks is not None and self.arms_raised)
+            predicted = False
+        else:
+            flap = self._flap_from(self.predictor.predict(now), record=False)
+            predicted = True
+        if flap:
+            self.governor.record_flap(predicted, now)
+        return flap
+
+    def governor_report(self):
+        """Relatório do governor (taxa, CPU, atraso adicional), ou None sem governor.
+
+        Medido no relógio que alimentou o governor (instantes de captura, que
+        numa fonte gravada não precisam ser o ``time.monotonic()``), até o
+        último frame.
+        """
+        if self.governor is None:
+            return None
+        return self.governor.report(self.capture_time)
+
+    def warm_up(self, timeout=5.0):
+        """Espera o primeiro frame e roda uma inferência para carregar o modelo"""
+        frame, _, _ = self.camera.wait_new(0, timeout)
+        if frame is None:
+            return False
+        self.estimator.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return True
+
+    def release(self):
+        super().release()
+        self.estimator.close()
@@ -0,0 +1,139 @@
+"""Taxa de inferência adaptativa com previsão de landmarks entre inferências.
+
+O movimento do pulso não precisa de inferência a 60 Hz. O
+``InferenceGovernor`` decide em quais frames rodar o MediaPipe a partir da
+latência medida e de um orçamento de CPU; nos frames intermediários o
+``LandmarkPredictor`` extrapola ombros e pulsos com velocidade constante,
+para que a detecção de flap continue vendo um sinal a cada frame.
+
+Um flap disparado pela previsão só conta como acerto quando a inferência
+real seguinte confirma os braços levantados; os não confirmados são falsos
+flaps e ficam fora do atraso médio.
+"""
+
+import numpy as np
+
+
+class LandmarkPredictor:
+    """Modelo de velocidade constante (filtro alfa-beta) para os 4 landmarks"""
+
+    def __init__(self, smoothing=0.5, max_horizon=0.25):
+        # Peso da nova medida de velocidade (0..1)
+        self.smoothing = smoothing
+        # Não extrapola além deste intervalo (s) desde a última medida
+        self.max_horizon = max_horizon
+        self.reset()
+
+    def reset(self):
+        self._position = None
+        self._velocity = np.zeros((4, 2))
+        self._time = None
+
+    def update(self, timestamp, landmarks):
+        """Incorpora uma medida; sem pose, esquece o estado"""
+        if landmarks is None:
+            self.reset()
+            return
+        position = np.asarray(landmarks, dtype=np.float64)
+        if self._position is not None and timestamp > self._time:
+            measured = (position - self._position) / (timestamp - self._time)
+            self._velocity += self.smoothing * (measured - self._velocity)
+        self._position = position
+        self._time = timestamp
+
+    def predict(self, timestamp):
+        """Landmarks extrapolados para ``timestamp``, no formato de extract_arm_landmarks"""
+        if self._position is None:
+            return None
+        dt = min(max(timestamp - self._time, 0.0), self.max_horizon)
+        predicted = self._position + self._velocity * dt
+        return tuple((float(x), float(y)) for x, y in predicted)
+
+
+class InferenceGovernor:
+    """Escolhe quando inferir para gastar no máximo ``cpu_budget`` de um núcleo.
+
+    ``max_hz`` deve ser o FPS da câmera: é a taxa de referência (inferir em
+    todos os frames) contra a qual o atraso adicional dos flaps é estimado.
+    """
+
+    def __init__(self, cpu_budget=0.5, min_hz=5.0, max_hz=30.0):
+        self.cpu_budget = cpu_budget
+        self.min_hz = min_hz
+        self.max_hz = max_hz
+        self.latency_ms = None
+        self.interval = 1.0 / max_hz
+        self._next_run = 0.0
+        self._last_run = None
+        self._previous_run = None
+        self._first_run = None
+        self._runs = 0
+        # CPU do processo (ms) gasta nas inferências
+        self._cpu_ms = 0.0
+        self._frame_interval = 1.0 / max_hz
+        self._flaps_predicted = 0
+        # Flaps da previsão esperando a próxima inferência real, e os que ela desmentiu
+        self._unconfirmed = 0
+        self._false_flaps = 0
+        self._flap_latencies = []
+
+    def should_run(self, now):
+        return now >= self._next_run
+
+    def record_run(self, now, inference_ms, cpu_ms=None):
+        """Atualiza a latência medida e agenda a próxima inferência.
+
+        ``cpu_ms`` é a CPU do processo durante a inferência (``time.process_time``);
+        sem ela, o relatório usa a latência.
+        """
+        if self.latency_ms is None:
+            self.latency_ms = inference_ms
+        else:
+            self.latency_ms += 0.2 * (inference_ms - self.latency_ms)
+        # Intervalo em que a inferência ocupa exatamente o orçamento de CPU
+        interval = self.latency_ms / 1000 / self.cpu_budget
+        self.interval = min(max(interval, 1.0 / self.max_hz), 1.0 / self.min_hz)
+        self._previous_run = self._last_run
+        self._last_run = now
+        if self._first_run is None:
+            self._first_run = now
+        # Meio frame de folga para o jitter da captura não pular um frame a mais
+        self._next_run = now + self.interval - self._frame_interval / 2
+        self._runs += 1
+        self._cpu_ms += inference_ms if cpu_ms is None else cpu_ms
+
+    def record_flap(self, predicted, now):
+        """Registra um flap; estima o atraso a mais em relação a inferir todo frame"""
+        if predicted:
+            # Disparado pela previsão entre inferências: a próxima inferência real decide
+            self._unconfirmed += 1
+        elif self._previous_run is not None:
+            # O braço cruzou a linha em algum frame desde a inferência anterior
+            gap = now - self._previous_run - self._frame_interval
+            self._flap_latencies.append(max(gap, 0.0) / 2 * 1000)
+
+    def record_result(self, raised):
+        """Resultado de uma inferência real: confirma ou desmente os flaps previstos antes dela"""
+        if not self._unconfirmed:
+            return
+        if raised:
+            # Confirmado: disparou antes (ou junto) da inferência, sem atraso adicional
+            self._flaps_predicted += self._unconfirmed
+            self._flap_latencies.extend([0.0] * self._unconfirmed)
+        else:
+            self._false_flaps += self._unconfirmed
+        self._unconfirmed = 0
+
+    def report(self, now):
+        """Taxa real de inferência, CPU, atraso adicional nos flaps confirmados e falsos flaps"""
+        elapsed = now - self._first_run if self._first_run is not None else 0.0
+        return {
+            "inference_hz": self._runs / elapsed if elapsed > 0 else 0.0,
+            "cpu_percent": self._cpu_ms / 10 / elapsed if elapsed > 0 else 0.0,
+            "latency_ms": self.latency_ms or 0.0,
+            "flaps": len(self._flap_latencies),
+            "flaps_predicted": self._flaps_predicted,
+            "false_flaps": self._false_flaps,
+            "added_flap_latency_ms": float(np.mean(self._flap_latencies))
+            if self._flap_latencies else 0.0,
+        }
@@ -0,0 +1,463 @@
+"""Vários jogadores: uma estimativa de pose por jogador, cada uma em seu processo.
+
+Dois arranjos:
+
+- Faixas: uma câmera larga dividida em ``players`` faixas verticais. Uma
+  thread do jogo lê a câmera e põe o frame RGB em um anel de memória
+  compartilhada; cada worker recorta a sua faixa, roda o seu PoseEstimator e
+  publica o resultado na sua linha do bloco de resultados (mesmo layout e
+  seqlock do ``pose_worker``). A inferência escala com os núcleos.
+- Câmeras: uma fonte por jogador, cada uma em um ``ProcessPoseDetector``.
+
+Nos dois casos o ``PlayerGroup`` junta os detectores (um ArmDetector por
+jogador) com a interface que o menu e o loader já usam, mais ``detect_flaps``
+para o jogo e ``player_report`` com latência e vazão por jogador.
+O jogador 0 é o da esquerda na pré-visualização espelhada.
+"""
+
+import multiprocessing as mp_proc
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from input_sources import open_source
+from pose_detector import ArmDetector
+from pose_worker import (R_CPU, R_INFER_MS, R_TIME, RESULT_FIELDS, PreviewBuffer,
+                         ProcessPoseDetector, _publish, read_result, result_landmarks)
+
+# Cabeçalho do anel de frames (seqlock: ímpar = escrita em andamento)
+H_SEQ = 0
+H_SLOT = 1
+H_TIME = 2
+HEADER_FIELDS = 3
+
+# Leituras do cabeçalho antes de desistir de uma escrita em andamento
+HEADER_RETRIES = 64
+
+# Amostras por jogador guardadas para os percentis do relatório
+STATS_WINDOW = 600
+
+
+def lane_bounds(player, players, width):
+    """Colunas (x0, x1) da faixa do jogador no frame da câmera (não espelhado)"""
+    # A pré-visualização é espelhada: o jogador da esquerda está à direita do frame
+    lane = players - 1 - player
+    return width * lane // players, width * (lane + 1) // players
+
+
+def _read_header(header):
+    """(seq, slot, instante da captura) do frame mais recente do anel, ou None.
+
+    Tenta ``HEADER_RETRIES`` vezes; com a escrita ainda em andamento (escritor
+    preemptado ou morto no meio) desiste, como ``read_result``, e quem chama
+    tenta de novo no próximo frame.
+    """
+    for _ in range(HEADER_RETRIES):
+        seq = header[H_SEQ]
+        if seq % 2:
+            continue
+        slot, capture_time = int(header[H_SLOT]), header[H_TIME]
+        if header[H_SEQ] == seq:
+            return seq, slot, capture_time
+    return None
+
+
+def _lane_worker_main(frames_name, header_name, result_name, shape, slots, players, player,
+                      pose_settings, frame_event, stop_event):
+    """Loop de um worker: espera um frame, recorta a faixa, infere e publica"""
+    from pose_detector import PoseEstimator, arms_raised
+
+    frames_shm = shared_memory.SharedMemory(name=frames_name)
+    header_shm = shared_memory.SharedMemory(name=header_name)
+    result_shm = shared_memory.SharedMemory(name=result_name)
+    frames = np.ndarray((slots,) + shape, dtype=np.uint8, buffer=frames_shm.buf)
+    header = np.ndarray((HEADER_FIELDS,), dtype=np.float64, buffer=header_shm.buf)
+    results = np.ndarray((players, RESULT_FIELDS), dtype=np.float64, buffer=result_shm.buf)
+    result = results[player]
+
+    x0, x1 = lane_bounds(player, players, shape[1])
+    # Recorte contíguo (o MediaPipe não aceita visões com passo)
+    crop = np.empty((shape[0], x1 - x0, 3), dtype=np.uint8)
+    estimator = PoseEstimator(**pose_settings)
+    last_frame = -1
+    seq = 0
+    try:
+        while not stop_event.is_set():
+            if not frame_event.wait(0.1):
+                continue
+            frame_event.clear()
+            latest = _read_header(header)
+            if latest is None:
+                # Escrita em andamento: o próximo frame publicado acorda o worker de novo
+                continue
+            frame_seq, slot, capture_time = latest
+            if frame_seq == last_frame:
+                continue
+            np.copyto(crop, frames[slot][:, x0:x1])
+            # O slot só é reescrito depois de slots - 1 frames novos; senão a cópia pode estar rasgada
+            if (header[H_SEQ] - frame_seq) / 2 >= slots - 1:
+                continue
+            last_frame = frame_seq
+
+            landmarks = estimator.process(crop)
+            raised = landmarks is not None and arms_raised(landmarks)
+            _publish(result, seq, slot, capture_time, estimator.inference_ms, landmarks, raised, 0)
+            seq += 2
+    finally:
+        estimator.close()
+        del frames, header, results, result
+        frames_shm.close()
+        header_shm.close()
+        result_shm.close()
+
+
+class LanePool:
+    """Uma fonte de vídeo repartida em faixas, com um processo de inferência por faixa"""
+
+    def __init__(self, players, source=0, frame_size=(640, 480), fps=30, fourcc="MJPG",
+                 realtime=True, slots=3, **pose_settings):
+        self.players = players
+        width, height = frame_size
+        self.shape = (height, width, 3)
+        self.slots = slots
+        self.source = open_source(source, realtime, width=width, height=height, fps=fps,
+                                  fourcc=fourcc, figures=players)
+
+        self._frames_shm = shared_memory.SharedMemory(
+            create=True, size=slots * height * width * 3)
+        self._header_shm = shared_memory.SharedMemory(create=True, size=HEADER_FIELDS * 8)
+        self._result_shm = shared_memory.SharedMemory(
+            create=True, size=players * RESULT_FIELDS * 8)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8,
+                                 buffer=self._frames_shm.buf)
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.float64,
+                                 buffer=self._header_shm.buf)
+        self.results = np.ndarray((players, RESULT_FIELDS), dtype=np.float64,
+                                  buffer=self._result_shm.buf)
+        self.header[:] = 0
+        self.results[:] = 0
+        self._preview = PreviewBuffer(self.shape, slots)
+        # Instante da captura do frame da pré-visualização
+        self._preview_time = None
+
+        self._stop_event = mp_proc.Event()
+        self._frame_events = [mp_proc.Event() for _ in range(players)]
+        self._processes = [
+            mp_proc.Process(
+                target=_lane_worker_main,
+                args=(self._frames_shm.name, self._header_shm.name, self._result_shm.name,
+                      self.shape, slots, players, player, pose_settings,
+                      self._frame_events[player], self._stop_event),
+                daemon=True)
+            for player in range(players)
+        ]
+        for process in self._processes:
+            process.start()
+
+        # Limpo = captura pausada (telas sem câmera)
+        self._active = threading.Event()
+        self._active.set()
+        self._running = True
+        self._thread = threading.Thread(target=self._dispatch, name="lane-dispatch",
+                                        daemon=True)
+        self._thread.start()
+
+    def _dispatch(self):
+        """Lê a fonte, converte cada frame novo para RGB no anel e acorda os workers"""
+        height, width = self.shape[:2]
+        frame_id = 0
+        slot = 0
+        seq = 0
+        while self._running:
+            if not self._active.is_set():
+                self.source.pause()
+                self._active.wait()
+                self.source.resume()
+                frame_id = self.source.read()[2]
+                continue
+            frame, capture_time, new_id = self.source.wait_new(frame_id)
+            if frame is None or new_id == frame_id:
+                continue
+            frame_id = new_id
+            if frame.shape != self.shape:
+                frame = cv2.resize(frame, (width, height))
+            slot = (slot + 1) % self.slots
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.frames[slot])
+            self.header[H_SEQ] = seq + 1
+            self.header[H_SLOT] = slot
+            self.header[H_TIME] = capture_time
+            self.header[H_SEQ] = seq + 2
+            seq += 2
+            for event in self._frame_events:
+                event.set()
+
+    def latest_frame(self):
+        """(frame RGB inteiro mais recente ou None, instante da captura).
+
+        O frame é uma cópia estável (a pré-visualização), não o slot do anel;
+        com uma escrita em andamento, fica o frame anterior.
+        """
+        latest = _read_header(self.header)
+        if latest is None:
+            return self._preview.frame, self._preview_time
+        seq, slot, capture_time = latest
+        if seq == 0:
+            return None, None
+        previous = self._preview.frame
+        frame = self._preview.update(self.frames, slot, seq, lambda: self.header[H_SEQ])
+        if frame is not previous:
+            # Cópia nova aceita (uma cópia rasgada mantém o frame e o instante anteriores)
+            self._preview_time = capture_time
+        return frame, self._preview_time
+
+    def alive(self):
+        return all(process.is_alive() for process in self._processes)
+
+    def pause(self):
+        self._active.clear()
+
+    def resume(self):
+        self._active.set()
+
+    def release(self):
+        self._running = False
+        self._active.set()
+        self._thread.join(timeout=1)
+        self.source.release()
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        del self.frames, self.header, self.results
+        for shm in (self._frames_shm, self._header_shm, self._result_shm):
+            shm.close()
+            shm.unlink()
+
+
+class LanePoseDetector(ArmDetector):
+    """Um jogador do LanePool: lê a linha de resultados do seu worker sem bloquear"""
+
+    def __init__(self, pool, player, recorder=None, gesture=None):
+        super().__init__(recorder, gesture)
+        self.pool = pool
+        self.player = player
+        self._result = pool.results[player]
+        self._snapshot = np.zeros(RESULT_FIELDS, dtype=np.float64)
+        self._seq = 0
+        self._resumed = False
+        self.landmarks = None
+        self.inference_ms = 0.0
+
+    def _poll(self):
+        seq = read_result(self._result, self._snapshot, self._seq)
+        if seq is None:
+            return False
+        self._seq = seq
+        self._resumed = False
+        self.capture_time = self._snapshot[R_TIME]
+        self.inference_ms = self._snapshot[R_INFER_MS]
+        self.landmarks = result_landmarks(self._snapshot)
+        return True
+
+    def calibrate(self):
+        """Calibra com o último resultado da faixa"""
+        if self._resumed:
+            self.warm_up(timeout=0.5)
+        self._poll()
+        return self._calibrate_with(self.landmarks)
+
+    def detect_arms_raised(self):
+        """Flap pelo último resultado do worker (limiar ou gesto, como no jogo solo)"""
+        if not self._poll():
+            return False, None
+        return self._flap_from(self.landmarks), None
+
+    def read_frame(self):
+        frame, _ = self.pool.latest_frame()
+        if frame is None:
+            return None
+        x0, x1 = lane_bounds(self.player, self.pool.players, frame.shape[1])
+        return frame[:, x0:x1]
+
+    def warm_up(self, timeout=5.0):
+        """Espera o primeiro resultado do worker desta faixa"""
+        deadline = time.monotonic() + timeout
+        while not self._poll():
+            if time.monotonic() >= deadline or not self.pool.alive():
+                return False
+            time.sleep(0.01)
+        return True
+
+    def resume(self):
+        super().resume()
+        self._poll()
+        self._resumed = True
+
+    def worker_cpu_time(self):
+        return float(self._result[R_CPU])
+
+
+class PlayerGroup:
+    """Detectores de todos os jogadores com a interface de um detector só.
+
+    ``calibrated`` só fica True quando todos calibraram; ``calibrate`` tenta
+    os que faltam. ``detect_flaps`` retorna um flap por jogador e mede, para
+    cada resultado novo, a duração da inferência e o atraso desde a captura.
+    """
+
+    def __init__(self, players, pool=None):
+        self.players = players
+        self.pool = pool
+        self._mosaic = None
+        self.reset_stats()
+
+    @property
+    def calibrated(self):
+        return all(player.calibrated for player in self.players)
+
+    @property
+    def calibrated_count(self):
+        return sum(player.calibrated for player in self.players)
+
+    @property
+    def arms_raised(self):
+        return any(player.arms_raised for player in self.players)
+
+    @property
+    def arms_raised_by_player(self):
+        return [player.arms_raised for player in self.players]
+
+    @property
+    def capture_time(self):
+        if self.pool is not None:
+            return self.pool.latest_frame()[1]
+        return max((p.capture_time for p in self.players if p.capture_time is not None),
+                   default=None)
+
+    def calibrate(self):
+        """Calibra os jogadores que faltam; True quando todos estão calibrados"""
+        for player in self.players:
+            if not player.calibrated:
+                player.calibrate()
+        return self.calibrated
+
+    def reset_stats(self):
+        self._stats_start = time.monotonic()
+        self._results = [0] * len(self.players)
+        self._inference_ms = [deque(maxlen=STATS_WINDOW) for _ in self.players]
+        self._latency_ms = [deque(maxlen=STATS_WINDOW) for _ in self.players]
+
+    def detect_flaps(self):
+        """(flap de cada jogador, frame para a pré-visualização)"""
+        flaps = []
+        frames = []
+        now = time.monotonic()
+        for i, player in enumerate(self.players):
+            last_capture = player.capture_time
+            flap, frame = player.detect_arms_raised()
+            flaps.append(flap)
+            frames.append(frame)
+            if player.capture_time is not None and player.capture_time != last_capture:
+                self._results[i] += 1
+                self._inference_ms[i].append(player.inference_ms)
+                self._latency_ms[i].append((now - player.capture_time) * 1000)
+        if self.pool is not None:
+            return flaps, self.pool.latest_frame()[0]
+        # Uma câmera por jogador: o mosaico usa os frames que a detecção já leu. Ler de
+        # novo (read_frame) consumiria resultados que a detecção não veria
+        return flaps, self._mosaic_of(frames[::-1])
+
+    def detect_arms_raised(self):
+        flaps, frame = self.detect_flaps()
+        return any(flaps), frame
+
+    def read_frame(self):
+        """Frame inteiro (faixas) ou mosaico das câmeras, na ordem da tela depois de espelhar"""
+        if self.pool is not None:
+            return self.pool.latest_frame()[0]
+        return self._mosaic_of([player.read_frame() for player in reversed(self.players)])
+
+    def _mosaic_of(self, frames):
+        """Frames das câmeras lado a lado num buffer reutilizado, ou None se faltar algum"""
+        if any(frame is None for frame in frames):
+            return None
+        if self._mosaic is None:
+            height = frames[0].shape[0]
+            width = sum(frame.shape[1] for frame in frames)
+            self._mosaic = np.empty((height, width, 3), dtype=np.uint8)
+        return np.concatenate(frames, axis=1, out=self._mosaic)
+
+    def player_report(self):
+        """Por jogador: resultados/s, inferência p50/p95 e atraso p50 (ms); mais o total"""
+        elapsed = max(time.monotonic() - self._stats_start, 1e-9)
+        players = []
+        for i in range(len(self.players)):
+            inference = np.array(self._inference_ms[i]) if self._inference_ms[i] else np.zeros(1)
+            latency = np.array(self._latency_ms[i]) if self._latency_ms[i] else np.zeros(1)
+            players.append({
+                "player": i + 1,
+                "hz": self._results[i] / elapsed,
+                "inference_p50_ms": float(np.percentile(inference, 50)),
+                "inference_p95_ms": float(np.percentile(inference, 95)),
+                "latency_p50_ms": float(np.percentile(latency, 50)),
+            })
+        return {"players": players, "total_hz": sum(p["hz"] for p in players)}
+
+    def governor_report(self):
+        return None
+
+    def warm_up(self, timeout=5.0):
+        return all([player.warm_up(timeout) for player in self.players])
+
+    def pause(self):
+        for player in self.players:
+            player.pause()
+        if self.pool is not None:
+            self.pool.pause()
+
+    def resume(self):
+        if self.pool is not None:
+            self.pool.resume()
+        for player in self.players:
+            player.resume()
+
+    def worker_cpu_time(self):
+        return sum(player.worker_cpu_time() for player in self.players)
+
+    def release(self):
+        for player in self.players:
+            player.release()
+        if self.pool is not None:
+            self.pool.release()
+
+
+def create_player_group(players, sources=(0,), frame_size=(640, 480), fps=30, fourcc="MJPG",
+                        realtime=True, gesture=False, **pose_settings):
+    """Um PlayerGroup com faixas (uma fonte) ou uma câmera por jogador.
+
+    Com ``gesture`` cada jogador tem o seu GestureEngine.
+    """
+    from gesture_engine import GestureEngine
+
+    if any(str(source).endswith(".npz") for source in sources):
+        raise ValueError("o modo multijogador precisa de vídeo (câmera, clipe ou synthetic)")
+
+    def new_gesture():
+        return GestureEngine() if gesture else None
+
+    if len(sources) == 1:
+        pool = LanePool(players, sources[0], frame_size, fps, fourcc, realtime, **pose_settings)
+        return PlayerGroup([LanePoseDetector(pool, i, gesture=new_gesture())
+                            for i in range(players)], pool)
+    if len(sources) != players:
+        raise ValueError(f"{players} jogadores precisam de uma fonte só (faixas) ou de "
+                         f"{players} fontes, uma por jogador")
+    return PlayerGroup([ProcessPoseDetector(source, frame_size, fps, fourcc, realtime,
+                                            gesture=new_gesture(), **pose_settings)
+                        for source in sources])
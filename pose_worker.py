@@ -0,0 +1,302 @@
+"""Inferência de pose em um processo separado.
+
+A captura e o MediaPipe rodam em um processo dedicado. Os frames passam por
+slots de um anel em ``multiprocessing.shared_memory`` e o resultado (flap,
+landmarks) é publicado em um pequeno bloco compartilhado protegido por um
+contador de sequência, de modo que o loop de renderização apenas lê o último
+resultado, sem bloquear.
+"""
+
+import multiprocessing as mp_proc
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pose_detector import ArmDetector
+from profiler import profiler
+
+# Campos do bloco de resultado
+R_SEQ = 0          # contador de sequência (ímpar = escrita em andamento)
+R_SLOT = 1         # slot do anel com o frame mais recente
+R_TIME = 2         # instante da captura (time.monotonic)
+R_INFER_MS = 3     # duração do pose.process em ms
+R_HAS_POSE = 4     # 1 se há landmarks no frame
+R_RAISED = 5       # 1 se os braços estão levantados
+R_FLAPS = 6        # total de transições não-levantado -> levantado
+R_CPU = 7          # tempo de CPU do worker (time.process_time)
+R_LANDMARKS = 8    # 4 pares (x, y) na ordem de ARM_LANDMARKS
+RESULT_FIELDS = R_LANDMARKS + 8
+
+
+def _publish(result, seq, slot, capture_time, infer_ms, landmarks, raised, flaps):
+    """Escreve um resultado usando o protocolo de sequência (seqlock)"""
+    result[R_SEQ] = seq + 1
+    result[R_SLOT] = slot
+    result[R_TIME] = capture_time
+    result[R_INFER_MS] = infer_ms
+    result[R_HAS_POSE] = landmarks is not None
+    result[R_RAISED] = raised
+    result[R_FLAPS] = flaps
+    result[R_CPU] = time.process_time()
+    if landmarks is not None:
+        result[R_LANDMARKS:RESULT_FIELDS] = np.ravel(landmarks)
+    result[R_SEQ] = seq + 2
+
+
+def read_result(result, snapshot, last_seq):
+    """Copia um resultado novo e consistente para ``snapshot``; retorna seu seq (ou None)"""
+    seq = result[R_SEQ]
+    if seq == last_seq or seq % 2:
+        return None
+    np.copyto(snapshot, result)
+    if result[R_SEQ] != seq:
+        # O worker começou outra escrita durante a cópia; tenta no próximo frame
+        return None
+    return seq
+
+
+def result_landmarks(snapshot):
+    """Landmarks de um resultado copiado, ou None sem pose"""
+    if not snapshot[R_HAS_POSE]:
+        return None
+    values = snapshot[R_LANDMARKS:RESULT_FIELDS]
+    return tuple((values[i], values[i + 1]) for i in range(0, 8, 2))
+
+
+class PreviewBuffer:
+    """Cópia estável de um slot do anel para a pré-visualização.
+
+    O slot publicado é reescrito depois de ``slots - 1`` frames novos; uma visão
+    direta desenhada num frame lento pode sair rasgada. O frame é copiado para
+    um de dois buffers e só passa a ser exibido se a escrita não alcançou o
+    slot durante a cópia (senão fica o anterior).
+    """
+
+    def __init__(self, shape, slots):
+        self.slots = slots
+        self._buffers = [np.empty(shape, dtype=np.uint8) for _ in range(2)]
+        self.frame = None
+        self._copied = None
+
+    def update(self, frames, slot, seq, current_seq):
+        """Copia ``frames[slot]`` (publicado em ``seq``); ``current_seq()`` lê o seq de agora"""
+        if seq == self._copied:
+            return self.frame
+        self._copied = seq
+        back = self._buffers[1] if self.frame is self._buffers[0] else self._buffers[0]
+        np.copyto(back, frames[slot])
+        if (current_seq() - seq) / 2 < self.slots - 1:
+            self.frame = back
+        return self.frame
+
+
+def _worker_main(frames_name, result_name, shape, slots, source_settings, pose_settings,
+                 stop_event, active_event):
+    """Loop do processo de inferência: captura, converte para RGB, infere e publica.
+
+    Com ``active_event`` limpo (telas sem câmera) a captura fica pausada e o
+    worker só espera, sem gastar CPU.
+    """
+    import cv2
+
+    from input_sources import open_source
+    from pose_detector import PoseEstimator, arms_raised
+
+    frames_shm = shared_memory.SharedMemory(name=frames_name)
+    result_shm = shared_memory.SharedMemory(name=result_name)
+    frames = np.ndarray((slots,) + shape, dtype=np.uint8, buffer=frames_shm.buf)
+    result = np.ndarray((RESULT_FIELDS,), dtype=np.float64, buffer=result_shm.buf)
+
+    estimator = PoseEstimator(**pose_settings)
+    camera = open_source(**source_settings)
+    height, width = shape[:2]
+
+    seq = 0
+    slot = 0
+    flaps = 0
+    frame_id = 0
+    last_raised = False
+    try:
+        while not stop_event.is_set():
+            if not active_event.is_set():
+                camera.pause()
+                while not active_event.wait(0.1) and not stop_event.is_set():
+                    pass
+                camera.resume()
+                # Frames de antes da pausa não são inferidos
+                frame_id = camera.read()[2]
+                continue
+            # Sempre o frame mais novo; os intermediários são descartados pela câmera
+            frame, capture_time, new_id = camera.wait_new(frame_id)
+            if frame is None or new_id == frame_id:
+                continue
+            frame_id = new_id
+            if frame.shape != shape:
+                frame = cv2.resize(frame, (width, height))
+
+            # O slot publicado por último continua intacto enquanto escrevemos no próximo.
+            # O frame RGB vai direto para o slot e serve à inferência e à pré-visualização.
+            slot = (slot + 1) % slots
+            frame_rgb = frames[slot]
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
+
+            landmarks = estimator.process(frame_rgb)
+            infer_ms = estimator.inference_ms
+            raised = last_raised
+            if landmarks is not None:
+                raised = arms_raised(landmarks)
+                if raised and not last_raised:
+                    flaps += 1
+                last_raised = raised
+
+            _publish(result, seq, slot, capture_time, infer_ms, landmarks, raised, flaps)
+            seq += 2
+    finally:
+        camera.release()
+        estimator.close()
+        del frames, result
+        frames_shm.close()
+        result_shm.close()
+
+
+class ProcessPoseDetector(ArmDetector):
+    """Mesma interface do PoseDetector, com a inferência em outro processo"""
+
+    def __init__(self, source=0, frame_size=(640, 480), fps=30, fourcc="MJPG",
+                 realtime=True, slots=3, recorder=None, gesture=None, **pose_settings):
+        super().__init__(recorder, gesture)
+        width, height = frame_size
+        self.shape = (height, width, 3)
+        self.slots = slots
+
+        self._frames_shm = shared_memory.SharedMemory(
+            create=True, size=slots * height * width * 3)
+        self._result_shm = shared_memory.SharedMemory(
+            create=True, size=RESULT_FIELDS * 8)
+        self._frames = np.ndarray((slots,) + self.shape, dtype=np.uint8,
+                                  buffer=self._frames_shm.buf)
+        self._result = np.ndarray((RESULT_FIELDS,), dtype=np.float64,
+                                  buffer=self._result_shm.buf)
+        self._result[:] = 0
+        self._snapshot = np.zeros(RESULT_FIELDS, dtype=np.float64)
+
+        self._stop_event = mp_proc.Event()
+        self._active_event = mp_proc.Event()
+        self._active_event.set()
+        self._process = mp_proc.Process(
+            target=_worker_main,
+            args=(self._frames_shm.name, self._result_shm.name, self.shape,
+                  slots, dict(source=source, realtime=realtime, width=width,
+                              height=height, fps=fps, fourcc=fourcc),
+                  pose_settings,
+                  self._stop_event, self._active_event),
+            daemon=True,
+        )
+        self._process.start()
+
+        self.landmarks = None
+        self.inference_ms = 0.0
+        self._seq = 0
+        self._flaps_seen = 0
+        # Slot e seq do último resultado; o frame é copiado só quando alguém o pede
+        self._slot = None
+        self._preview = PreviewBuffer(self.shape, slots)
+        # Retomado e sem resultado novo ainda: a calibração espera o worker
+        self._resumed = False
+
+    def _poll(self):
+        """Copia o último resultado publicado, se houver um novo e consistente"""
+        seq = read_result(self._result, self._snapshot, self._seq)
+        if seq is None:
+            return False
+        self._seq = seq
+        self._resumed = False
+
+        snap = self._snapshot
+        self._slot = int(snap[R_SLOT])
+        self.capture_time = snap[R_TIME]
+        self.inference_ms = snap[R_INFER_MS]
+        # Tempo de inferência medido no worker (fora do frame, só para comparação)
+        profiler.record("worker_pose", self.inference_ms)
+        self.landmarks = result_landmarks(snap)
+        if self.recorder is not None:
+            self.recorder.record(self.capture_time, self.landmarks)
+        return True
+
+    def calibrate(self):
+        """Calibra a posição inicial dos ombros com o último resultado"""
+        if self._resumed:
+            # O último resultado é de antes da pausa
+            self.warm_up(timeout=0.5)
+        self._poll()
+        if not self._calibrate_with(self.landmarks):
+            return False
+        # Flaps anteriores à calibração não contam
+        self._flaps_seen = int(self._snapshot[R_FLAPS])
+        return True
+
+    def detect_arms_raised(self):
+        """Lê o último resultado do worker sem bloquear"""
+        flap_triggered = False
+        if self._poll():
+            flaps = int(self._snapshot[R_FLAPS])
+            if self.calibrated and self.gesture is not None:
+                # O gesto roda aqui, sobre a sequência de resultados do worker
+                flap_triggered = self.gesture.push(self.capture_time, self.landmarks)
+                self.arms_raised = self.gesture.raised
+            elif self.calibrated:
+                flap_triggered = flaps > self._flaps_seen
+                if self.landmarks is not None:
+                    self.arms_raised = bool(self._snapshot[R_RAISED])
+            self._flaps_seen = flaps
+        return flap_triggered, self._preview_frame()
+
+    def warm_up(self, timeout=5.0):
+        """Espera o worker publicar o primeiro resultado (câmera aberta e modelo carregado)"""
+        deadline = time.monotonic() + timeout
+        while not self._poll():
+            if time.monotonic() >= deadline or not self._process.is_alive():
+                return False
+            time.sleep(0.01)
+        return True
+
+    def pause(self):
+        self._active_event.clear()
+
+    def resume(self):
+        super().resume()
+        self._poll()
+        self._resumed = True
+        self._active_event.set()
+
+    def worker_cpu_time(self):
+        """CPU do worker na última publicação"""
+        return float(self._result[R_CPU])
+
+    def _preview_frame(self):
+        """Cópia estável do frame do último resultado (None antes do primeiro)"""
+        if self._slot is None:
+            return None
+        return self._preview.update(self._frames, self._slot, self._seq,
+                                    lambda: self._result[R_SEQ])
+
+    def read_frame(self):
+        """Frame RGB mais recente (cópia estável do slot compartilhado)"""
+        self._poll()
+        return self._preview_frame()
+
+    def release(self):
+        super().release()
+        self._stop_event.set()
+        self._active_event.set()
+        self._process.join(timeout=2)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._slot = None
+        del self._frames, self._result
+        self._frames_shm.close()
+        self._frames_shm.unlink()
+        self._result_shm.close()
+        self._result_shm.unlink()
@@ -0,0 +1,48 @@
+"""Pré-visualização da câmera sem alocação por frame.
+
+O espelhamento e a redução de tamanho são feitos em uma única passada
+(``cv2.remap`` com mapas pré-calculados) direto para um buffer fixo. Uma
+Surface persistente criada com ``pygame.image.frombuffer`` enxerga esse mesmo
+buffer, então nenhum array ou Surface novo é criado a cada frame.
+"""
+
+import cv2
+import numpy as np
+import pygame
+
+
+class CameraPreview:
+    """Converte frames RGB da inferência em Surfaces de pré-visualização reutilizadas"""
+
+    def __init__(self, mirror=True):
+        self.mirror = mirror
+        # (largura, altura) de destino -> [shape de origem, mapas, buffer, surface]
+        self._targets = {}
+
+    def _build_maps(self, src_shape, size):
+        """Mapas de remap: para cada pixel de destino, a coordenada na origem"""
+        src_h, src_w = src_shape[:2]
+        width, height = size
+        xs = (np.arange(width, dtype=np.float32) + 0.5) * (src_w / width) - 0.5
+        ys = (np.arange(height, dtype=np.float32) + 0.5) * (src_h / height) - 0.5
+        if self.mirror:
+            xs = (src_w - 1) - xs
+        map_x, map_y = np.meshgrid(xs, ys)
+        # Mapas em ponto fixo deixam o remap mais rápido
+        return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+    def render(self, frame_rgb, size):
+        """Escreve o frame no buffer do tamanho pedido e retorna a Surface persistente"""
+        target = self._targets.get(size)
+        if target is None:
+            width, height = size
+            buffer = np.empty((height, width, 3), dtype=np.uint8)
+            surface = pygame.image.frombuffer(buffer, size, "RGB")
+            target = self._targets[size] = [None, None, buffer, surface]
+        if target[0] != frame_rgb.shape:
+            target[0] = frame_rgb.shape
+            target[1] = self._build_maps(frame_rgb.shape, size)
+
+        map1, map2 = target[1]
+        cv2.remap(frame_rgb, map1, map2, cv2.INTER_LINEAR, dst=target[2])
+        return target[3]
@@ -0,0 +1,158 @@
+"""Temporizadores por etapa do frame, com percentis móveis e exportação.
+
+Uso no caminho quente::
+
+    with profiler.stage("pose"):
+        results = pose.process(frame_rgb)
+    ...
+    profiler.end_frame("play")
+
+Desligado, ``stage`` devolve sempre o mesmo contexto vazio, então o custo é
+só uma chamada de método. Ligado, cada etapa acumula seu tempo no frame e
+``end_frame`` guarda os totais em anéis de tamanho fixo.
+"""
+
+import csv
+import json
+import time
+
+import numpy as np
+
+# Etapas conhecidas (colunas do CSV, ordem do overlay)
+STAGES = ("camera", "pose", "update", "background", "camera_feed", "text", "scale", "flip")
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class FrameProfiler:
+    """Coleta o tempo de cada etapa por frame (em ms)"""
+
+    def __init__(self, window=300):
+        self.window = window
+        self.enabled = False
+        self.overlay_visible = False
+        self.frame = 0
+        self._current = {}
+        self._rings = {}
+        self._frame_start = time.perf_counter()
+        self._export_file = None
+        self._export_writer = None
+
+    # ---------- Coleta ----------
+
+    def stage(self, name):
+        """Contexto que mede uma etapa (nada faz quando desligado)"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name, ms):
+        """Soma um tempo já medido (ex.: inferência informada pelo worker) ao frame atual"""
+        if self.enabled:
+            self._current[name] = self._current.get(name, 0.0) + ms
+
+    def end_frame(self, screen_name=""):
+        """Fecha o frame: guarda os tempos nos anéis e exporta a linha, se houver arquivo"""
+        now = time.perf_counter()
+        total_ms = (now - self._frame_start) * 1000
+        self._frame_start = now
+        if not self.enabled:
+            return
+        self.frame += 1
+        stages = self._current
+        stages["frame"] = total_ms
+        for name, ms in stages.items():
+            ring = self._rings.get(name)
+            if ring is None:
+                ring = self._rings[name] = [np.zeros(self.window), 0]
+            ring[0][ring[1] % self.window] = ms
+            ring[1] += 1
+        if self._export_writer is not None:
+            self._export_writer(screen_name, stages)
+        self._current = {}
+
+    # ---------- Estatísticas ----------
+
+    def percentiles(self, name, q=(50, 95, 99)):
+        """Percentis móveis (ms) de uma etapa, ou None se ainda não houve amostras"""
+        ring = self._rings.get(name)
+        if ring is None:
+            return None
+        values, count = ring
+        return np.percentile(values[:min(count, self.window)], q)
+
+    def fps(self):
+        """FPS efetivo médio na janela"""
+        ring = self._rings.get("frame")
+        if ring is None:
+            return 0.0
+        mean_ms = ring[0][:min(ring[1], self.window)].mean()
+        return 1000.0 / mean_ms if mean_ms else 0.0
+
+    def stage_names(self):
+        """Etapas com amostras, as conhecidas primeiro"""
+        known = [name for name in STAGES if name in self._rings]
+        others = sorted(n for n in self._rings if n not in STAGES and n != "frame")
+        return known + others
+
+    # ---------- Controle ----------
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible or self._export_file is not None
+
+    def start_export(self, path):
+        """Grava os tempos de cada frame em CSV ou JSONL (pela extensão do arquivo)"""
+        self._export_file = open(path, "w", newline="")
+        if path.endswith(".csv"):
+            writer = csv.writer(self._export_file)
+            writer.writerow(("frame", "screen", "frame_ms") + STAGES)
+
+            def write(screen_name, stages):
+                writer.writerow([self.frame, screen_name, round(stages["frame"], 3)] +
+                                [round(stages.get(name, 0.0), 3) for name in STAGES])
+        else:
+            def write(screen_name, stages):
+                row = {"frame": self.frame, "screen": screen_name}
+                row.update((name, round(ms, 3)) for name, ms in stages.items())
+                self._export_file.write(json.dumps(row) + "\n")
+        self._export_writer = write
+        self.enabled = True
+
+    def close(self):
+        if self._export_file is not None:
+            self._export_file.close()
+            self._export_file = None
+            self._export_writer = None
+            self.enabled = self.overlay_visible
+
+
+# Instância usada pelo jogo
+profiler = FrameProfiler()
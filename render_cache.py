@@ -0,0 +1,199 @@
+"""Caches de renderização compartilhados pelas telas do jogo."""
+
+from collections import OrderedDict
+
+import pygame
+
+# Cor usada como transparência nas camadas com colorkey
+LAYER_COLORKEY = (255, 0, 255)
+
+
+class LayerCache:
+    """Camadas estáticas pré-renderizadas (gradiente, painéis, sombras).
+
+    Cada camada é desenhada uma vez por ``painter(surface, params)`` e depois
+    só é blitada. ``params`` (tema, geometria) entra na chave, então a camada é
+    reconstruída apenas quando o tamanho da tela ou esses parâmetros mudam.
+    Camadas não opacas usam colorkey e são recortadas ao retângulo que contém
+    pixels, para que o blit custe só a área desenhada.
+    """
+
+    def __init__(self):
+        self._layers = {}
+        self.rebuilds = 0
+
+    def get(self, name, size, painter, params=None, opaque=False):
+        """Retorna (surface, posição) da camada, renderizando se necessário"""
+        key = (tuple(size), params)
+        entry = self._layers.get(name)
+        if entry is None or entry[0] != key:
+            entry = (key,) + self._render(size, painter, params, opaque)
+            self._layers[name] = entry
+            self.rebuilds += 1
+        return entry[1], entry[2]
+
+    def blit(self, target, name, painter, params=None, opaque=False):
+        """Blita a camada na superfície de destino"""
+        layer, pos = self.get(name, target.get_size(), painter, params, opaque)
+        target.blit(layer, pos)
+
+    def clear(self):
+        self._layers.clear()
+
+    @staticmethod
+    def _render(size, painter, params, opaque):
+        surface = pygame.Surface(size)
+        if not opaque:
+            surface.fill(LAYER_COLORKEY)
+            surface.set_colorkey(LAYER_COLORKEY)
+        painter(surface, params)
+
+        pos = (0, 0)
+        if not opaque:
+            bounds = surface.get_bounding_rect()
+            surface = surface.subsurface(bounds).copy()
+            surface.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            pos = bounds.topleft
+        if pygame.display.get_surface() is not None:
+            # Mesmo formato da tela: blit sem conversão de pixels
+            surface = surface.convert()
+        return surface, pos
+
+
+class SpriteAtlas:
+    """Formas estáticas (nuvens, estrelas, canos, botões, painéis) pré-renderizadas.
+
+    Cada forma é desenhada uma vez por ``painter(surface, params)`` em uma
+    superfície com alfa por pixel, recortada ao retângulo com pixels visíveis
+    e empacotada em prateleiras de páginas ``PAGE_SIZE``. Depois o desenho é
+    um blit de uma área da página. ``origin`` é o ponto da superfície do
+    painter que cai na posição passada a ``blit``. Como o alfa é por pixel,
+    cores RGBA (sombras, caixas translúcidas) são de fato translúcidas.
+    """
+
+    PAGE_SIZE = 1024
+
+    def __init__(self):
+        self._sprites = {}
+        self._pages = []
+        # Página e prateleira abertas: (y do topo, altura, próximo x livre)
+        self._shelf_page = None
+        self._shelf = None
+        self.renders = 0
+
+    def get(self, name, params, size, painter, origin=(0, 0)):
+        """(página, área, deslocamento) da forma, renderizando na primeira vez"""
+        key = (name, params)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._render(params, size, painter, origin)
+            self.renders += 1
+        return sprite
+
+    def blit(self, target, pos, name, params, size, painter, origin=(0, 0)):
+        """Blita a forma com ``origin`` em ``pos``"""
+        page, area, (dx, dy) = self.get(name, params, size, painter, origin)
+        target.blit(page, (pos[0] + dx, pos[1] + dy), area)
+
+    def clear(self):
+        self._sprites.clear()
+        self._pages = []
+        self._shelf_page = None
+        self._shelf = None
+
+    def page_count(self):
+        return len(self._pages)
+
+    def _render(self, params, size, painter, origin):
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        painter(surface, params)
+        bounds = surface.get_bounding_rect()
+        page, area = self._allocate(bounds.width, bounds.height)
+        # MAX sobre a área zerada copia os pixels (inclusive o alfa) sem mesclar
+        page.blit(surface, area.topleft, bounds, special_flags=pygame.BLEND_RGBA_MAX)
+        return page, area, (bounds.x - origin[0], bounds.y - origin[1])
+
+    def _allocate(self, width, height):
+        """Reserva um espaço nas páginas (prateleiras, da esquerda para a direita)"""
+        size = self.PAGE_SIZE
+        if width > size or height > size:
+            # Maior que uma página: página própria, fora das prateleiras
+            return self._new_page((width, height)), pygame.Rect(0, 0, width, height)
+        shelf = self._shelf
+        if shelf is not None:
+            top, shelf_height, x = shelf
+            if x + width > size or height > shelf_height:
+                # Nova prateleira logo abaixo da atual
+                top, shelf_height, x = top + shelf_height, height, 0
+            shelf = (top, shelf_height, x) if top + shelf_height <= size else None
+        if shelf is None:
+            self._shelf_page = self._new_page((size, size))
+            shelf = (0, height, 0)
+        top, shelf_height, x = shelf
+        self._shelf = (top, shelf_height, x + width)
+        return self._shelf_page, pygame.Rect(x, top, width, height)
+
+    def _new_page(self, size):
+        page = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        # RLE: o blit pula as corridas transparentes (a página é recodificada
+        # automaticamente quando recebe uma forma nova)
+        page.set_alpha(255, pygame.RLEACCEL)
+        self._pages.append(page)
+        return page
+
+
+class TextCache:
+    """Cache LRU limitado de superfícies de texto já renderizadas.
+
+    A chave é (texto, fonte, cor, cor do contorno). Texto com contorno é
+    composto uma única vez em uma só superfície. ``hits`` e ``misses`` contam
+    os acessos; cada miss corresponde a uma renderização de fonte.
+    """
+
+    # Deslocamentos do contorno, iguais aos do desenho original
+    OUTLINE_OFFSETS = ((-2, -2), (-2, 2), (2, -2), (2, 2))
+    OUTLINE_WIDTH = 2
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, font, color, outline_color=None):
+        """Superfície do texto; com contorno, a borda extra tem OUTLINE_WIDTH pixels"""
+        key = (text, font, color, outline_color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        if outline_color is not None:
+            surface = self._outlined(surface, font.render(text, True, outline_color))
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    @classmethod
+    def _outlined(cls, text_surface, outline_surface):
+        pad = cls.OUTLINE_WIDTH
+        width, height = text_surface.get_size()
+        surface = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+        for dx, dy in cls.OUTLINE_OFFSETS:
+            surface.blit(outline_surface, (pad + dx, pad + dy))
+        surface.blit(text_surface, (pad, pad))
+        return surface
+
+    def stats(self):
+        """Contadores do cache: hits, misses e entradas atuais"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._surfaces)}
+
+    def clear(self):
+        self._surfaces.clear()
@@ -0,0 +1,127 @@
+"""Renderização em resolução interna reduzida, escalada para a janela uma vez por frame.
+
+As telas de jogo desenham numa superfície fora da tela de
+``escala × tamanho da janela``; ``present`` a amplia para a janela com um
+único ``pygame.transform.scale``. Com escala 1 a superfície é a própria
+janela e nada muda. Os preenchimentos, blits e a pré-visualização da câmera
+passam a custar ``escala²`` dos pixels.
+
+A ampliação não é grátis: com o fundo e os sprites já em cache, os blits na
+escala 1 são baratos e o ``transform.scale`` até a janela pode custar mais
+do que economiza (medido numa máquina de 1 núcleo: escala 0.75 = 273% do
+frame nativo, 0.5 = 135%). Fatores não inteiros são os piores, por isso os
+degraus são só 1 e 0.5.
+
+No modo dinâmico, ``adjust`` recebe o tempo de trabalho de cada frame (sem a
+espera do relógio): se o p90 recente passa do orçamento, a escala desce um
+degrau; se fica folgado por um tempo, sobe de volta até a escala pedida. Cada
+troca é conferida: uma descida que não baixa o p90 da janela seguinte é
+desfeita e o degrau sai da lista; uma subida é julgada já nos primeiros
+``trial_frames`` frames e, se estoura o orçamento, é desfeita (a próxima
+tentativa espera o dobro). Assim uma subida malsucedida custa poucos frames
+acima do orçamento, não uma janela inteira.
+"""
+
+import numpy as np
+import pygame
+
+# Degraus do modo dinâmico (frações do tamanho da janela, só fatores inteiros)
+SCALE_STEPS = (1.0, 0.5)
+
+
+class RenderView:
+    """Superfície de desenho das telas de jogo e a escala em uso"""
+
+    def __init__(self, window, scale=1.0, dynamic=False, budget_ms=1000 / 60, window_frames=30,
+                 raise_after=120, headroom=0.6, trial_frames=4):
+        self.window = window
+        # Escala pedida: o modo dinâmico nunca sobe acima dela
+        self.max_scale = scale
+        self.dynamic = dynamic
+        self.budget_ms = budget_ms
+        # Frames medidos antes de decidir (e de pausa depois de cada troca)
+        self.window_frames = window_frames
+        # Frames seguidos com folga (p90 < headroom × orçamento) antes de subir
+        self.raise_after = raise_after
+        self.headroom = headroom
+        # Frames medidos depois de uma subida antes de mantê-la ou desfazê-la
+        self.trial_frames = min(trial_frames, window_frames)
+        self.steps = sorted({step for step in SCALE_STEPS if step <= scale} | {scale},
+                            reverse=True)
+        self._work_ms = np.zeros(window_frames)
+        self._count = 0
+        self._calm = 0
+        # Depois de uma troca: (escala anterior, p90 antes dela) até a próxima janela
+        self._trial = None
+        # Frames com folga exigidos para subir (dobra a cada subida desfeita)
+        self._raise_wait = raise_after
+        self.changes = 0
+        # Degraus desfeitos por não baixarem o p90
+        self.reverted = 0
+        self._set_scale(scale)
+
+    def _set_scale(self, scale):
+        self.scale = scale
+        width, height = self.window.get_size()
+        if scale == 1.0:
+            self.surface = self.window
+        else:
+            self.surface = pygame.Surface((max(int(width * scale), 1),
+                                           max(int(height * scale), 1))).convert()
+
+    @property
+    def in_trial(self):
+        """True enquanto a última troca ainda está sendo conferida"""
+        return self._trial is not None
+
+    @property
+    def raising(self):
+        """True enquanto uma subida de escala está em teste"""
+        return self._trial is not None and self._trial[0] < self.scale
+
+    def present(self):
+        """Amplia a superfície de desenho para a janela (nada a fazer na escala 1)"""
+        if self.surface is not self.window:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+
+    def adjust(self, work_ms):
+        """Registra o tempo de trabalho do frame; retorna True se a escala mudou"""
+        if not self.dynamic:
+            return False
+        self._work_ms[self._count % self.window_frames] = work_ms
+        self._count += 1
+        if self._count < (self.trial_frames if self.raising else self.window_frames):
+            return False
+        p90 = np.percentile(self._work_ms[:self._count], 90)
+        if self._trial is not None:
+            previous, before = self._trial
+            self._trial = None
+            if previous > self.scale and p90 >= before:
+                # A ampliação custou mais que o desenho economizou: volta e não tenta de novo
+                self.steps.remove(self.scale)
+                self.reverted += 1
+                return self._change(previous)
+            if previous < self.scale and p90 > self.budget_ms:
+                # Subiu e estourou o orçamento: volta e espera o dobro antes de tentar de novo
+                self._raise_wait *= 2
+                self.reverted += 1
+                return self._change(previous)
+        index = self.steps.index(self.scale)
+        if p90 > self.budget_ms and index + 1 < len(self.steps):
+            return self._change(self.steps[index + 1], p90)
+        if p90 < self.budget_ms * self.headroom and index > 0:
+            self._calm += 1
+            if self._calm >= self._raise_wait:
+                return self._change(self.steps[index - 1], p90)
+        else:
+            self._calm = 0
+        return False
+
+    def _change(self, scale, p90=None):
+        """Troca a escala; com ``p90``, a troca é testada nos próximos frames"""
+        self._trial = (self.scale, p90) if p90 is not None else None
+        self._set_scale(scale)
+        self.changes += 1
+        self._count = 0
+        self._calm = 0
+        return True
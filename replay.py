@@ -0,0 +1,134 @@
+"""Partidas reproduzíveis: semente + ticks dos flaps, replay e fantasma.
+
+Com a semente, os vãos dos canos se repetem; com os ticks em que cada flap
+foi aplicado, a física (passo fixo) se repete tick a tick. Um ``Run`` guarda
+só isso, mais o resultado para conferir. Os ticks são gravados como
+diferenças em varint (LEB128): em geral um byte por flap.
+
+- ``replay``: refaz a partida sem display, o mais rápido possível, para
+  verificar um recorde (``verify``).
+- ``ReplayInput``: entrega os flaps gravados tick a tick, para refazer a
+  partida na tela em velocidade normal.
+- ``Ghost``: a partida gravada avançando junto com a partida ao vivo (mesma
+  semente), para desenhar o pássaro fantasma.
+"""
+
+import random
+
+from game_core import GameEngine
+
+
+def encode_flaps(ticks):
+    """Ticks crescentes -> bytes (diferenças em varint)"""
+    out = bytearray()
+    last = 0
+    for tick in ticks:
+        delta = tick - last
+        last = tick
+        while delta >= 0x80:
+            out.append(delta & 0x7F | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_flaps(data):
+    """Inverso de ``encode_flaps``"""
+    ticks = []
+    tick = delta = shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        tick += delta
+        ticks.append(tick)
+        delta = shift = 0
+    return ticks
+
+
+def new_seed():
+    """Semente para uma partida nova"""
+    return random.getrandbits(32)
+
+
+class Run:
+    """Uma partida: semente, ticks dos flaps e o resultado (ticks jogados, placar)"""
+
+    __slots__ = ("seed", "flap_ticks", "ticks", "score")
+
+    def __init__(self, seed, flap_ticks, ticks, score):
+        self.seed = seed
+        self.flap_ticks = list(flap_ticks)
+        self.ticks = ticks
+        self.score = score
+
+    @classmethod
+    def from_engine(cls, engine):
+        """A partida que ``engine`` (criado com ``seed``) acabou de jogar"""
+        return cls(engine.seed, engine.flap_ticks, engine.tick, engine.score)
+
+    def __repr__(self):
+        return (f"Run(seed={self.seed}, flaps={len(self.flap_ticks)}, ticks={self.ticks}, "
+                f"score={self.score})")
+
+
+class ReplayInput:
+    """Flaps gravados, entregues no tick em que foram aplicados"""
+
+    def __init__(self, run):
+        self.flap_ticks = run.flap_ticks
+        self._next = 0
+
+    def feed(self, engine):
+        """Agenda no ``engine`` o flap do próximo tick, se houver um gravado"""
+        ticks = self.flap_ticks
+        if self._next < len(ticks) and ticks[self._next] == engine.tick + 1:
+            engine.flap()
+            self._next += 1
+
+
+def replay(run, engine=None):
+    """Refaz ``run`` sem display (um engine novo ou ``engine``); retorna o engine no fim"""
+    if engine is None:
+        engine = GameEngine(seed=run.seed)
+    else:
+        engine.seed = run.seed
+        engine.rng = random.Random(run.seed)
+        engine.reset()
+    feed = ReplayInput(run).feed
+    step = engine.step
+    while not engine.game_over and engine.tick < run.ticks:
+        feed(engine)
+        step()
+    return engine
+
+
+def verify(run, engine=None):
+    """True se o replay chega ao mesmo placar, no mesmo tick, com game over"""
+    engine = replay(run, engine)
+    return engine.game_over and engine.tick == run.ticks and engine.score == run.score
+
+
+class Ghost:
+    """A partida gravada em paralelo com a ao vivo, para desenhar o pássaro fantasma"""
+
+    def __init__(self, run, bird_factory, pipe_factory):
+        self.run = run
+        self.engine = GameEngine(bird_factory, pipe_factory, seed=run.seed)
+        self._input = ReplayInput(run)
+
+    @property
+    def bird(self):
+        return self.engine.bird
+
+    @property
+    def finished(self):
+        return self.engine.game_over
+
+    def sync(self, tick):
+        """Avança o fantasma até ``tick`` (o tick da partida ao vivo)"""
+        engine = self.engine
+        while engine.tick < tick and not engine.game_over:
+            self._input.feed(engine)
+            engine.step()
@@ -0,0 +1,457 @@
+"""Transmissão da partida para espectadores (telão, segunda máquina) por UDP.
+
+Em vez de espelhar a janela em vídeo, o jogo manda o estado de cada frame:
+pássaro (y, velocidade), canos (x, vão), placar e os flags de braços
+levantados e game over. Os valores viram inteiros (posições e velocidade em
+quartos de pixel, exatos para a física do ``game_core``) e vão em varints.
+
+- Quadro-chave: todos os campos, a cada ``keyframe_interval`` snapshots, para
+  espectadores novos e para quem ficou para trás.
+- Delta: só as diferenças em relação ao último snapshot que o espectador
+  confirmou (ACK), com uma máscara dos campos que mudaram. Como a base é
+  sempre um snapshot que ele tem, um pacote perdido não estraga os seguintes.
+
+Protocolo: o espectador manda ``HELLO`` e depois um ``ACK`` com o último
+snapshot decodificado; sem notícias por ``viewer_timeout`` segundos, deixa de
+receber. Cada servidor sorteia uma sessão, que vai em todo pacote e ACK:
+se o jogo reinicia (e o seq volta a 1), o espectador reconhece a sessão nova
+no próximo quadro-chave e recomeça em vez de descartar tudo como velho. ``SpectatorServer`` roda no loop do jogo (socket não bloqueante,
+um snapshot por tick da simulação); ``SpectatorClient`` decodifica e
+interpola (veja ``spectator_viewer.py``).
+
+Atrasos: os relógios monotônicos de duas máquinas não têm relação, então o
+cliente mede só a variação (atraso de cada snapshot além do menor visto) e o
+servidor mede o RTT pelo ACK (envio do snapshot até a chegada da confirmação,
+anotada por uma thread de leitura, e não no próximo tick).
+"""
+
+import random
+import select
+import socket
+import struct
+import threading
+import time
+from collections import deque
+
+from game_core import PIPE_SPEED
+
+# Tipos de pacote
+KEYFRAME = 1
+DELTA = 2
+HELLO = b"H"
+ACK = b"A"
+# Cabeçalho: tipo, sessão do servidor, número do snapshot, instante do envio (ms do
+# relógio monotônico)
+HEADER = struct.Struct("<BHII")
+ACK_PACKET = struct.Struct("<cHI")
+
+# Campos fixos do snapshot (depois vêm x e vão de cada cano)
+FIELDS = ("tick", "score", "flags", "bird_y", "bird_velocity", "pipes")
+PIPE_FIELDS = 2
+# Bits de ``flags``
+ARMS_RAISED = 1
+GAME_OVER = 2
+# Posições e velocidade em quartos de pixel
+POSITION_SCALE = 4
+# Maior pacote aceito (um quadro-chave com PIPE_CAPACITY canos tem ~40 bytes)
+MAX_PACKET = 512
+# RTTs guardados para os percentis do relatório
+RTT_WINDOW = 1000
+
+
+def now_ms():
+    """Relógio monotônico em ms (32 bits), o mesmo em todos os processos da máquina"""
+    return int(time.monotonic() * 1000) & 0xFFFFFFFF
+
+
+def parse_address(text, default_host="127.0.0.1"):
+    """``HOST:PORTA`` (ou só ``:PORTA``) -> (host, porta)"""
+    host, _, port = text.rpartition(":")
+    return host or default_host, int(port)
+
+
+def _percentile(values, q):
+    """Percentil ``q`` (0-100) de uma sequência já ordenada, 0 se vazia"""
+    if not values:
+        return 0
+    return values[min(int(len(values) * q / 100), len(values) - 1)]
+
+
+def _write_varint(out, value):
+    """Acrescenta ``value`` (inteiro com sinal, zigzag) em LEB128"""
+    value = (value << 1) ^ (value >> 63)
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(data, offset=0):
+    """Todos os varints (zigzag) de ``data`` a partir de ``offset``"""
+    values = []
+    value = shift = 0
+    for byte in memoryview(data)[offset:]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append((value >> 1) ^ -(value & 1))
+        value = shift = 0
+    return values
+
+
+def state_fields(engine, arms_raised=False):
+    """Estado do ``engine`` como lista de inteiros (ordem de FIELDS, depois os canos)"""
+    bird = engine.bird
+    flags = (ARMS_RAISED if arms_raised else 0) | (GAME_OVER if engine.game_over else 0)
+    fields = [engine.tick, engine.score, flags, round(bird.y * POSITION_SCALE),
+              round(bird.velocity * POSITION_SCALE), len(engine.pipes)]
+    for pipe in engine.pipes:
+        fields.append(round(pipe.x * POSITION_SCALE))
+        fields.append(pipe.gap_y)
+    return fields
+
+
+def encode_keyframe(session, seq, sent_ms, fields):
+    out = bytearray(HEADER.pack(KEYFRAME, session, seq, sent_ms))
+    for value in fields:
+        _write_varint(out, value)
+    return bytes(out)
+
+
+def encode_delta(session, seq, sent_ms, fields, base_seq, base):
+    """Delta de ``fields`` contra ``base`` (precisa do mesmo número de canos)"""
+    out = bytearray(HEADER.pack(DELTA, session, seq, sent_ms))
+    _write_varint(out, seq - base_seq)
+    mask = 0
+    changes = []
+    for i, (value, old) in enumerate(zip(fields, base)):
+        if value != old:
+            mask |= 1 << i
+            changes.append(value - old)
+    _write_varint(out, mask)
+    for change in changes:
+        _write_varint(out, change)
+    return bytes(out)
+
+
+def decode(packet, history):
+    """(seq, instante do envio, campos) de um pacote, ou None sem a base do delta.
+
+    ``history`` mapeia seq -> campos dos snapshots já decodificados (da mesma
+    sessão: quem chama confere a sessão do cabeçalho antes).
+    """
+    kind, _, seq, sent_ms = HEADER.unpack_from(packet)
+    values = _read_varints(packet, HEADER.size)
+    if kind == KEYFRAME:
+        return seq, sent_ms, values
+    base = history.get(seq - values[0])
+    if base is None:
+        return None
+    fields = list(base)
+    mask = values[1]
+    changes = iter(values[2:])
+    i = 0
+    while mask:
+        if mask & 1:
+            fields[i] += next(changes)
+        mask >>= 1
+        i += 1
+    return seq, sent_ms, fields
+
+
+class Snapshot:
+    """Estado decodificado, em pixels do mundo do jogo"""
+
+    __slots__ = ("seq", "sent_ms", "tick", "score", "arms_raised", "game_over", "bird_y",
+                 "bird_velocity", "pipes")
+
+    def __init__(self, seq, sent_ms, fields):
+        self.seq = seq
+        self.sent_ms = sent_ms
+        self.tick, self.score, flags = fields[0], fields[1], fields[2]
+        self.arms_raised = bool(flags & ARMS_RAISED)
+        self.game_over = bool(flags & GAME_OVER)
+        self.bird_y = fields[3] / POSITION_SCALE
+        self.bird_velocity = fields[4] / POSITION_SCALE
+        # [(x, vão)] do mais antigo ao mais novo
+        self.pipes = [(fields[i] / POSITION_SCALE, fields[i + 1])
+                      for i in range(len(FIELDS), len(fields), PIPE_FIELDS)]
+
+
+class SpectatorServer:
+    """Envia o estado de cada tick a todos os espectadores que deram HELLO"""
+
+    def __init__(self, address=("0.0.0.0", 5005), keyframe_interval=60, history=128,
+                 viewer_timeout=5.0):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(address)
+        self.socket.setblocking(False)
+        self.address = self.socket.getsockname()
+        self.keyframe_interval = keyframe_interval
+        self.history = history
+        self.viewer_timeout = viewer_timeout
+        # Distingue este processo de um jogo anterior no mesmo endereço (seq recomeça)
+        self.session = random.getrandbits(16)
+        # Endereço -> [último seq confirmado (ou None), última notícia (monotonic)]
+        self.viewers = {}
+        self.seq = 0
+        # seq -> campos dos snapshots recentes (bases possíveis dos deltas) e instante do envio
+        self._sent = {}
+        self._sent_at = {}
+        # Envio -> ACK (ms) dos snapshots confirmados
+        self.rtt_ms = deque(maxlen=RTT_WINDOW)
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self.keyframes_sent = 0
+        self.send_errors = 0
+        self._started = time.monotonic()
+        # (pacote, endereço, chegada) lidos pela thread, consumidos em publish
+        self._incoming = deque()
+        self._closing = threading.Event()
+        self._thread = threading.Thread(target=self._receive, name="spectators", daemon=True)
+        self._thread.start()
+
+    def _receive(self):
+        """Thread: lê HELLO e ACK assim que chegam e anota o instante (para o RTT)"""
+        while not self._closing.is_set():
+            try:
+                readable, _, _ = select.select([self.socket], [], [], 0.2)
+            except (OSError, ValueError):
+                return
+            while readable:
+                try:
+                    data, address = self.socket.recvfrom(64)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    if self._closing.is_set():
+                        return
+                    # ICMP "porta inalcançável" de um espectador que saiu
+                    continue
+                self._incoming.append((data, address, time.monotonic()))
+
+    def _poll(self, now):
+        incoming = self._incoming
+        while incoming:
+            data, address, arrived = incoming.popleft()
+            viewer = self.viewers.setdefault(address, [None, arrived])
+            viewer[1] = arrived
+            if len(data) == ACK_PACKET.size and data[:1] == ACK:
+                _, session, seq = ACK_PACKET.unpack(data)
+                # ACK de outra sessão: o espectador ainda não viu o quadro-chave desta
+                if session != self.session:
+                    continue
+                if viewer[0] is None or seq > viewer[0]:
+                    viewer[0] = seq
+                    sent_at = self._sent_at.get(seq)
+                    if sent_at is not None:
+                        self.rtt_ms.append((arrived - sent_at) * 1000)
+        for address in [a for a, v in self.viewers.items() if now - v[1] > self.viewer_timeout]:
+            del self.viewers[address]
+
+    def publish(self, engine, arms_raised=False):
+        """Manda o estado atual de ``engine`` (um snapshot por chamada: use em ``on_tick``)"""
+        now = time.monotonic()
+        self._poll(now)
+        self.seq += 1
+        seq = self.seq
+        fields = state_fields(engine, arms_raised)
+        self._sent[seq] = fields
+        self._sent.pop(seq - self.history, None)
+        if not self.viewers:
+            return
+        self._sent_at[seq] = now
+        self._sent_at.pop(seq - self.history, None)
+        sent_ms = now_ms()
+        keyframe = seq % self.keyframe_interval == 0
+        # Espectadores com a mesma base recebem o mesmo pacote (None: quadro-chave)
+        packets = {}
+        for address, (acked, _) in self.viewers.items():
+            base = None if keyframe or acked is None else self._sent.get(acked)
+            # Cano que entrou ou saiu desde a base: quadro-chave
+            key = acked if base is not None and len(base) == len(fields) else None
+            packet = packets.get(key)
+            if packet is None:
+                if key is None:
+                    packet = encode_keyframe(self.session, seq, sent_ms, fields)
+                else:
+                    packet = encode_delta(self.session, seq, sent_ms, fields, acked, base)
+                packets[key] = packet
+            try:
+                self.socket.sendto(packet, address)
+            except OSError:
+                self.send_errors += 1
+                continue
+            self.bytes_sent += len(packet)
+            self.packets_sent += 1
+            self.keyframes_sent += key is None
+
+    def report(self):
+        """Bytes/s enviados, tamanho médio do pacote, fração de quadros-chave e RTT (p50/p95, ms)"""
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        packets = max(self.packets_sent, 1)
+        rtt = sorted(self.rtt_ms)
+        return {"viewers": len(self.viewers), "bytes_per_s": self.bytes_sent / elapsed,
+                "packet_bytes": self.bytes_sent / packets,
+                "keyframe_share": self.keyframes_sent / packets,
+                "rtt_p50_ms": _percentile(rtt, 50), "rtt_p95_ms": _percentile(rtt, 95),
+                "send_errors": self.send_errors}
+
+    def close(self):
+        self._closing.set()
+        self._thread.join()
+        self.socket.close()
+
+
+class SpectatorClient:
+    """Recebe os snapshots, confirma cada um e interpola entre eles.
+
+    ``interp_ms`` é o atraso de exibição: a cena mostrada fica esse tempo atrás
+    do último snapshot, para sempre haver dois entre os quais interpolar
+    (mesmo com um pacote perdido).
+    """
+
+    def __init__(self, address, interp_ms=50, history=128, hello_every=1.0):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.connect(address)
+        self.socket.setblocking(False)
+        self.interp_ms = interp_ms
+        self.history = history
+        self.hello_every = hello_every
+        # Sessão do servidor dos snapshots guardados (None antes do primeiro quadro-chave)
+        self.session = None
+        # Vezes que o servidor mudou de sessão (jogo reiniciado)
+        self.resets = 0
+        # seq -> campos decodificados (bases dos deltas que ainda podem chegar)
+        self.decoded = {}
+        # Snapshots para interpolar, do mais antigo ao mais novo
+        self.snapshots = []
+        self.latest = None
+        # Recebido - enviado (ms) de cada snapshot: relógios de máquinas diferentes,
+        # só as diferenças entre esses valores têm sentido
+        self.delays_ms = []
+        self.bytes_received = 0
+        self.packets = 0
+        self.undecodable = 0
+        # Menor (recebido - enviado): o relógio do jogo no relógio local
+        self._offset_ms = None
+        self._last_contact = None
+        self._started = time.monotonic()
+
+    def _send(self, packet):
+        try:
+            self.socket.send(packet)
+        except OSError:
+            pass
+
+    def poll(self):
+        """Lê os pacotes que chegaram e confirma o mais novo; retorna quantos"""
+        now = time.monotonic()
+        if self._last_contact is None or now - self._last_contact > self.hello_every:
+            # Ainda sem dados (ou servidor mudo): pede para entrar de novo
+            self._send(HELLO)
+            self._last_contact = now
+        received = 0
+        while True:
+            try:
+                packet = self.socket.recv(MAX_PACKET)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # Servidor ainda não escutando (ICMP): tenta de novo no próximo HELLO
+                break
+            received += 1
+            self.handle(packet, now_ms())
+        if received:
+            self._last_contact = now
+            if self.latest is not None:
+                self._send(ACK_PACKET.pack(ACK, self.session, self.latest.seq))
+        return received
+
+    def handle(self, packet, received_ms):
+        """Decodifica um pacote e guarda o snapshot"""
+        self.bytes_received += len(packet)
+        self.packets += 1
+        kind, session = HEADER.unpack_from(packet)[:2]
+        if session != self.session:
+            if kind != KEYFRAME:
+                # Delta de uma sessão cujo quadro-chave ainda não chegou
+                self.undecodable += 1
+                return
+            self._new_session(session)
+        result = decode(packet, self.decoded)
+        if result is None:
+            self.undecodable += 1
+            return
+        seq, sent_ms, fields = result
+        if self.latest is not None and seq <= self.latest.seq:
+            return
+        self.decoded[seq] = fields
+        self.decoded.pop(seq - self.history, None)
+        snapshot = Snapshot(seq, sent_ms, fields)
+        self.latest = snapshot
+        self.snapshots.append(snapshot)
+        if len(self.snapshots) > 16:
+            del self.snapshots[0]
+        # Com sinal: o relógio do jogo pode estar à frente do local
+        delay = ((received_ms - sent_ms + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+        self.delays_ms.append(delay)
+        if self._offset_ms is None or delay < self._offset_ms:
+            self._offset_ms = delay
+
+    def _new_session(self, session):
+        """Servidor novo (ou reiniciado): os snapshots e o relógio da sessão anterior não valem"""
+        if self.session is not None:
+            self.resets += 1
+        self.session = session
+        self.decoded.clear()
+        self.snapshots.clear()
+        self.latest = None
+        self.delays_ms.clear()
+        self._offset_ms = None
+
+    def sample(self):
+        """Estado interpolado para exibir agora: (snapshot base, y do pássaro, canos), ou None"""
+        if not self.snapshots:
+            return None
+        target = now_ms() - self._offset_ms - self.interp_ms
+        older = newer = self.snapshots[-1]
+        for snapshot in reversed(self.snapshots):
+            if snapshot.sent_ms <= target:
+                older = snapshot
+                break
+            newer = snapshot
+        span = newer.sent_ms - older.sent_ms
+        alpha = min(max((target - older.sent_ms) / span, 0.0), 1.0) if span > 0 else 1.0
+        if newer.tick < older.tick:
+            # Rodada nova entre os dois: nada a interpolar
+            alpha = 1.0
+        bird_y = older.bird_y + (newer.bird_y - older.bird_y) * alpha
+        # Todos os canos andam PIPE_SPEED por tick: basta recuar os do snapshot mais novo
+        shift = (newer.tick - older.tick) * PIPE_SPEED * (1 - alpha)
+        pipes = [(x + shift, gap) for x, gap in newer.pipes]
+        return newer if alpha >= 0.5 else older, bird_y, pipes
+
+    def jitter_ms(self):
+        """Atraso de cada snapshot além do menor visto (ms), válido entre máquinas"""
+        return [delay - self._offset_ms for delay in self.delays_ms]
+
+    def report(self):
+        """Bytes/s recebidos e variação do atraso de rede (p50/p95, ms).
+
+        A cena exibida fica ``interp_ms`` atrás do snapshot que chegou mais
+        rápido; o atraso de rede em si (metade do RTT) vem do servidor.
+        """
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        jitter = sorted(self.jitter_ms())
+        return {"bytes_per_s": self.bytes_received / elapsed,
+                "snapshots": len(self.delays_ms),
+                "jitter_p50_ms": _percentile(jitter, 50),
+                "jitter_p95_ms": _percentile(jitter, 95),
+                "interp_ms": self.interp_ms,
+                "undecodable": self.undecodable,
+                "resets": self.resets}
+
+    def close(self):
+        self.socket.close()
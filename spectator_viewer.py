@@ -0,0 +1,101 @@
+"""Espectador: mostra a partida transmitida por ``flappy_arms.py --spectate``.
+
+Desenha com as mesmas funções do jogo a partir dos snapshots recebidos
+(``spectator.SpectatorClient``), interpolados a 60 FPS mesmo com pacotes
+perdidos. Não precisa de câmera nem de MediaPipe.
+
+Uso: python spectator_viewer.py HOST:PORTA [--interp-ms 50] [--render-scale 0.5]
+"""
+
+import argparse
+import random
+
+import pygame
+
+import flappy_arms as game
+from game_core import SCREEN_WIDTH, SCREEN_HEIGHT, PIPE_GAP
+from spectator import SpectatorClient, parse_address
+
+
+class ViewState:
+    """O que ``draw_play_frame`` lê de um engine (pássaro, canos, placar), vindo da rede"""
+
+    def __init__(self):
+        self.bird = game.Bird()
+        self.pipes = []
+        self.score = 0
+        self._pipe_pool = []
+
+    def update(self, snapshot, bird_y, pipes):
+        self.bird.y = self.bird.prev_y = bird_y
+        # Canos reaproveitados entre frames (sem alocar por frame)
+        while len(self._pipe_pool) < len(pipes):
+            self._pipe_pool.append(game.Pipe(SCREEN_WIDTH))
+        self.pipes = self._pipe_pool[:len(pipes)]
+        for pipe, (x, gap_y) in zip(self.pipes, pipes):
+            pipe.x = pipe.prev_x = x
+            pipe.gap_y = gap_y
+            pipe.gap_bottom = gap_y + PIPE_GAP
+        self.score = snapshot.score
+
+
+def main(address, interp_ms=50, render_scale=1.0):
+    game.init_display(idle_after=0, partial=False, render_scale=render_scale)
+    pygame.display.set_caption("Flappy Arms - Spectator")
+    client = SpectatorClient(address, interp_ms)
+    state = ViewState()
+    clouds = [
+        game.Cloud(random.randint(0, SCREEN_WIDTH), random.randint(50, 300),
+                   random.uniform(0.2, 0.4), random.uniform(0.8, 1.2))
+        for _ in range(5)
+    ]
+    game.frame_scheduler.enter("spectate")
+    game.use_view(True)
+    try:
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
+
+            client.poll()
+            sample = client.sample()
+            game.frame_scheduler.mark_all()
+            if sample is None:
+                game.draw_background(game.screen)
+                game.draw_text(f"Waiting for {address[0]}:{address[1]}...",
+                               game.view_font(game.font_medium), game.WHITE,
+                               game.px(SCREEN_WIDTH // 2), game.px(SCREEN_HEIGHT // 2),
+                               center=True)
+            else:
+                snapshot, bird_y, pipes = sample
+                state.update(snapshot, bird_y, pipes)
+                game.draw_play_frame(state, 1.0, clouds, None, snapshot.arms_raised)
+                if snapshot.game_over:
+                    game.draw_text_with_outline("GAME OVER", game.view_font(game.font_large),
+                                                game.RED, game.BLACK, game.px(SCREEN_WIDTH // 2),
+                                                game.px(SCREEN_HEIGHT // 2), center=True)
+            game.present_frame("spectate", game.FPS)
+    finally:
+        report = client.report()
+        if report["snapshots"]:
+            print("Espectador: {snapshots} snapshots, {bytes_per_s:.0f} B/s, variação do atraso "
+                  "p50 {jitter_p50_ms} ms / p95 {jitter_p95_ms} ms, cena exibida {interp_ms} ms "
+                  "atrás do snapshot mais rápido (o RTT sai no jogo), {resets} reinício(s) "
+                  "do jogo".format(**report))
+        client.close()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flappy Arms - espectador")
+    parser.add_argument("address", metavar="HOST:PORTA",
+                        help="endereço do jogo (o --spectate de flappy_arms.py)")
+    parser.add_argument("--interp-ms", type=int, default=50,
+                        help="atraso de exibição para interpolar entre snapshots")
+    parser.add_argument("--render-scale", type=float, default=1.0, metavar="FRAÇÃO",
+                        help="desenha nesta fração da resolução da janela e amplia")
+    args = parser.parse_args()
+    main(parse_address(args.address), args.interp_ms, args.render_scale)
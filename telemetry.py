@@ -0,0 +1,173 @@
+"""Telemetria da partida: um registro binário de tamanho fixo por tick.
+
+Cada tick da física vira um registro (``RECORD_DTYPE``): tick, partida,
+pássaro (y, velocidade), cano mais próximo, flap, placar e os quatro
+landmarks (ombros e pulsos) usados na detecção. O ``TelemetryWriter`` só
+empacota o registro (``struct.pack_into``) num buffer pré-alocado; buffers
+cheios vão para uma thread que grava em bloco, então o frame nunca espera
+pelo disco. O arquivo é só acréscimo: um cabeçalho de 16 bytes e os
+registros em sequência.
+
+A leitura (``read_telemetry``) mapeia o arquivo com ``np.memmap`` e devolve
+um array estruturado, sem copiar nem interpretar texto; um registro
+incompleto no fim (sessão interrompida) é ignorado.
+"""
+
+import glob
+import os
+import queue
+import struct
+import threading
+import time
+
+import numpy as np
+
+MAGIC = b"FATL"
+VERSION = 1
+HEADER = struct.Struct("<4sII4x")
+
+# Registro de um tick (little-endian, sem alinhamento)
+RECORD = struct.Struct("<IHdffffBH8f")
+RECORD_DTYPE = np.dtype([
+    ("tick", "<u4"),
+    ("round", "<u2"),
+    ("time", "<f8"),
+    ("bird_y", "<f4"),
+    ("bird_velocity", "<f4"),
+    # Cano mais próximo ainda não ultrapassado (NaN sem cano)
+    ("pipe_x", "<f4"),
+    ("pipe_gap_y", "<f4"),
+    ("flap", "u1"),
+    ("score", "<u2"),
+    # Ombro esquerdo, ombro direito, pulso esquerdo, pulso direito; NaN sem pose
+    ("landmarks", "<f4", (4, 2)),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+NO_POSE = (float("nan"),) * 8
+
+
+def nearest_pipe(engine):
+    """Cano mais antigo cuja borda direita ainda não passou do pássaro, ou None"""
+    pipes = engine.pipes
+    left = engine.bird.left
+    for i in range(pipes.count):
+        pipe = pipes.slots[(pipes.head + i) % pipes.capacity]
+        if pipe.x + pipe.width >= left:
+            return pipe
+    return None
+
+
+class TelemetryWriter:
+    """Acumula registros em buffers fixos e grava os cheios numa thread"""
+
+    def __init__(self, path, records_per_buffer=4096, buffers=4):
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.buffer_size = records_per_buffer * RECORD.size
+        # Buffers livres e cheios; a thread devolve cada um depois de gravar
+        self._free = queue.SimpleQueue()
+        for _ in range(buffers - 1):
+            self._free.put(bytearray(self.buffer_size))
+        self._full = queue.SimpleQueue()
+        self._buffer = bytearray(self.buffer_size)
+        self._offset = 0
+        self.round = 0
+        self.records = 0
+        # Buffers que precisaram ser criados porque o disco não acompanhou
+        self.overflows = 0
+        self._thread = threading.Thread(target=self._drain, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def new_round(self):
+        """Começa uma partida nova (os registros seguintes levam o número dela)"""
+        self.round += 1
+
+    def record(self, engine, landmarks=None):
+        """Registra o tick que ``engine`` acabou de simular"""
+        bird = engine.bird
+        pipe = nearest_pipe(engine)
+        if landmarks:
+            (lsx, lsy), (rsx, rsy), (lwx, lwy), (rwx, rwy) = landmarks
+        else:
+            lsx, lsy, rsx, rsy, lwx, lwy, rwx, rwy = NO_POSE
+        RECORD.pack_into(self._buffer, self._offset, engine.tick, self.round, time.monotonic(),
+                         bird.y, bird.velocity,
+                         pipe.x if pipe is not None else NO_POSE[0],
+                         pipe.gap_y if pipe is not None else NO_POSE[0],
+                         engine.flapped, engine.score,
+                         lsx, lsy, rsx, rsy, lwx, lwy, rwx, rwy)
+        self._offset += RECORD.size
+        self.records += 1
+        if self._offset == self.buffer_size:
+            self._hand_off()
+
+    def _hand_off(self):
+        """Entrega o buffer atual à thread e passa a escrever em um livre"""
+        self._full.put((self._buffer, self._offset))
+        try:
+            self._buffer = self._free.get_nowait()
+        except queue.Empty:
+            self.overflows += 1
+            self._buffer = bytearray(self.buffer_size)
+        self._offset = 0
+
+    def flush(self):
+        """Manda gravar o que já foi registrado (fim de partida, não a cada frame)"""
+        if self._offset:
+            self._hand_off()
+
+    def _drain(self):
+        while True:
+            item = self._full.get()
+            if item is None:
+                break
+            buffer, size = item
+            self._file.write(memoryview(buffer)[:size])
+            self._file.flush()
+            self._free.put(buffer)
+
+    def close(self):
+        """Grava o resto e fecha o arquivo"""
+        if self._file is None:
+            return
+        self.flush()
+        self._full.put(None)
+        self._thread.join()
+        self._file.close()
+        self._file = None
+
+
+def session_path(directory):
+    """Arquivo novo para uma sessão em ``directory`` (nome pela data e hora)"""
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"session-{stamp}.tlm")
+    suffix = 1
+    while os.path.exists(path):
+        suffix += 1
+        path = os.path.join(directory, f"session-{stamp}-{suffix}.tlm")
+    return path
+
+
+def read_telemetry(path):
+    """Registros de um arquivo como array estruturado mapeado em memória (somente leitura)"""
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        magic, version, record_size = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path}: não é um arquivo de telemetria v{VERSION}")
+    count = (size - HEADER.size) // RECORD.size
+    if count == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def iter_telemetry(pattern):
+    """(caminho, registros) de cada sessão que casa com ``pattern`` (glob ou diretório)"""
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.tlm")
+    for path in sorted(glob.glob(pattern)):
+        yield path, read_telemetry(path)